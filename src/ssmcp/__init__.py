@@ -3,9 +3,14 @@
 A Model Context Protocol server providing web search with content extraction.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from ssmcp.config import Settings, settings
-from ssmcp.searxng_client import SearXNGClient
-from ssmcp.youtube_client import YouTubeClient
+
+if TYPE_CHECKING:
+    from ssmcp.searxng_client import SearXNGClient
+    from ssmcp.youtube_client import YouTubeClient
 
 __version__ = "0.2.0"
 
@@ -16,3 +21,18 @@ __all__ = [
     "__version__",
     "settings",
 ]
+
+# Clients pull in heavy dependencies (yt-dlp, httpx), so they are imported on demand
+_LAZY_IMPORTS = {
+    "SearXNGClient": "ssmcp.searxng_client",
+    "YouTubeClient": "ssmcp.youtube_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import client classes on first access to keep `import ssmcp` lightweight."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return getattr(importlib.import_module(module_name), name)
@@ -5,6 +5,7 @@ Environment variables are automatically mapped to Settings fields.
 
 from functools import lru_cache
 
+from dotenv import load_dotenv
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,6 +15,7 @@ class Settings(BaseSettings):
 
     Required settings will cause validation errors if missing,
     ensuring the application fails early with clear error messages.
+    Settings are frozen after validation so hot paths can safely snapshot them.
     """
 
     # --- Connectivity & Infrastructure ---
@@ -67,9 +69,21 @@ class Settings(BaseSettings):
     junk_filter_enabled: bool = True
     junk_filter_letter_ratio_threshold: float = 0.3
 
+    # --- Parser ---
+    # Worker processes for filtering and Markdown conversion; 0 runs them in a thread
+    parser_workers: int = 0
+    # Seconds a single page may take before it is dropped; 0 disables the limit
+    parser_page_timeout: float = 30.0
+    # Seconds web_search waits for its pages before dropping the rest; 0 disables the limit
+    parser_search_deadline: float = 45.0
+
     # --- Content Extraction & YouTube ---
     youtube_subtitle_language: str = "en"
     youtube_cookies_path: str = "/app/deploy/docker/ssmcp/cookies.txt"
+    # Worker processes for subtitle downloads; 0 runs them in a thread
+    youtube_workers: int = 0
+    # Parsed subtitles stay cached in Redis for this long when Redis is configured
+    youtube_cache_ttl_seconds: int = 604800
 
     # --- Network Interface ---
     host: str = "0.0.0.0"
@@ -106,6 +120,11 @@ class Settings(BaseSettings):
                 raise ValueError(msg)
         return self
 
+    @property
+    def redis_index_key(self) -> str:
+        """Redis sorted set listing logged request keys scored by write time."""
+        return f"{self.redis_key_prefix}:index"
+
     # --- Tool Metadata ---
     # Tool descriptions are stored here so they can be updated via environment
     # variables without code changes.
@@ -128,11 +147,13 @@ class Settings(BaseSettings):
     arg_web_fetch_url_desc: str = "The URL to fetch content from"
     arg_youtube_get_subtitles_url_desc: str = "YouTube video URL to get subtitles from"
 
+    # .env is loaded into the process environment once by get_settings(),
+    # so Settings only reads os.environ
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
+        env_file=None,
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
 
@@ -141,7 +162,8 @@ def get_settings() -> Settings:
     """Return cached settings instance.
 
     Uses lru_cache to ensure the .env file is only parsed once
-    and all modules share the same settings instance.
+    and all modules share the same settings instance. Variables already
+    present in the environment take precedence over .env values.
 
     Returns:
         Settings instance with application configuration.
@@ -150,6 +172,8 @@ def get_settings() -> Settings:
         ValidationError: If required environment variables are missing.
 
     """
+    load_dotenv(".env", override=False)
+
     # Pydantic Settings populates required fields from environment variables
     # at runtime, so mypy incorrectly reports missing constructor arguments.
     return Settings()  # type: ignore[call-arg]
@@ -1,10 +1,11 @@
 """Redis Middleware for storing requests and responses."""
 
-import json
-import secrets
+import asyncio
+import itertools
 import time
 from typing import Any
 
+import orjson
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 from fastmcp.tools.tool import ToolResult
 from redis.asyncio import Redis
@@ -12,9 +13,36 @@ from redis.asyncio import Redis
 from ssmcp.config import settings
 from ssmcp.logger import logger
 
+# Time window in seconds during which queued entries are coalesced into one pipeline
+FLUSH_INTERVAL = 0.02
+
+# Maximum number of entries written in a single pipeline
+MAX_BATCH_SIZE = 100
+
+# Maximum number of entries waiting to be written; newer entries are dropped beyond this
+MAX_QUEUE_SIZE = 10_000
+
+# Responses are indented for reading in the UI; like json.dumps, non-str dict keys are stringified
+RESPONSE_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Seconds shutdown waits for queued entries to be written before dropping them
+SHUTDOWN_TIMEOUT = 5.0
+
+# Consecutive failed writes after which logging is suspended
+CIRCUIT_FAILURE_THRESHOLD = 5
+
+# Seconds logging stays suspended once the circuit opens
+CIRCUIT_OPEN_SECONDS = 30.0
+
 
 class RedisLoggingMiddleware(Middleware):
-    """Middleware that stores tool parameters and responses in Redis."""
+    """Middleware that stores tool parameters and responses in Redis.
+
+    Entries are queued on the tool path and written by a background task that
+    batches everything arriving within a short window into one Redis pipeline.
+    After repeated write failures logging is suspended for a while, so an
+    unreachable Redis costs nothing per request.
+    """
 
     def __init__(self, redis_url: str = "") -> None:
         """Initialize the middleware.
@@ -25,20 +53,67 @@ class RedisLoggingMiddleware(Middleware):
         """
         self.redis_url = redis_url
         self.redis_client: Redis | None = None
+        self._enabled = bool(redis_url)
+        self._fail_count = 0
+        self._open_until = 0.0
+        self._queue: asyncio.Queue[tuple[str, dict[str, bytes | str]] | None] = asyncio.Queue(
+            MAX_QUEUE_SIZE
+        )
+        self._flush_task: asyncio.Task[None] | None = None
+        self._seq = itertools.count()
+        self._key_prefix = settings.redis_key_prefix
+        self._index_key = settings.redis_index_key
+        self._expiration = settings.redis_expiration_seconds
 
     async def startup(self) -> None:
-        """Initialize Redis connection on startup."""
+        """Initialize Redis connection and start the flush loop on startup."""
         if self.redis_url:
             self.redis_client = Redis.from_url(self.redis_url)
+            self._flush_task = asyncio.create_task(self._flush_loop(self.redis_client))
 
     async def shutdown(self) -> None:
-        """Cleanup Redis connection on shutdown."""
+        """Flush queued entries and cleanup Redis connection on shutdown."""
+        if self._flush_task is not None:
+            await self._stop_flush_loop(self._flush_task)
+            self._flush_task = None
+
         if self.redis_client:
             await self.redis_client.aclose()
             self.redis_client = None
 
+    async def _stop_flush_loop(self, flush_task: asyncio.Task[None]) -> None:
+        """Let the flush loop write what's queued and exit, within SHUTDOWN_TIMEOUT.
+
+        A loop that already died can't drain the queue, so nothing is sent to it;
+        a loop that doesn't finish in time is cancelled and its entries dropped.
+
+        Args:
+            flush_task: Task running the flush loop
+
+        """
+        if not flush_task.done():
+            try:
+                # Sentinel makes the loop write what's left and exit
+                await asyncio.wait_for(self._queue.put(None), SHUTDOWN_TIMEOUT)
+                await asyncio.wait_for(flush_task, SHUTDOWN_TIMEOUT)
+            except TimeoutError:
+                logger.warning(
+                    "Redis flush did not finish within %ss, dropping %d queued entries",
+                    SHUTDOWN_TIMEOUT,
+                    self._queue.qsize(),
+                )
+                flush_task.cancel()
+                return
+
+        if not flush_task.cancelled() and (error := flush_task.exception()) is not None:
+            logger.error(
+                "Redis flush loop failed, dropping %d queued entries: %s",
+                self._queue.qsize(),
+                error,
+            )
+
     async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
-        """Process the tool call and store params and response in Redis.
+        """Process the tool call and queue params and response for Redis.
 
         Args:
             context: The middleware context
@@ -48,53 +123,142 @@ class RedisLoggingMiddleware(Middleware):
             The result from the tool execution
 
         """
-        # If Redis is not configured, just pass through
-        if self.redis_client is None:
+        # If Redis is not configured or not connected, just pass through
+        if not self._enabled or self.redis_client is None:
             return await call_next(context)
 
         # Process the tool call and get result
         result = await call_next(context)
 
+        # Circuit is open after repeated Redis failures, skip serialization entirely
+        if time.monotonic() < self._open_until:
+            return result
+
         try:
-            # Extract content from ToolResult if necessary
-            # FastMCP wraps tool outputs in ToolResult objects
-            response_content = ""
-            if isinstance(result, ToolResult):
-                # ToolResult.content is a list of ContentBlock objects
-                contents = []
-                for item in result.content:
-                    if hasattr(item, "text"):
-                        contents.append(item.text)
-                    else:
-                        contents.append(str(item))
-                response_content = "\n".join(contents)
-
-                # If there's structured content and it's not just the same as text
-                if result.structured_content and not response_content:
-                    response_content = json.dumps(result.structured_content, indent=2)
-            elif isinstance(result, list | dict):
-                response_content = json.dumps(result, indent=2)
-            else:
-                response_content = str(result)
-
-            # Store tool params and response
-            log_data = {
-                "tool": context.message.name,
-                "params": context.message.arguments,
-                "response": response_content,
-            }
-
-            # Unique key with timestamp and random suffix to prevent collisions
-            unique_id = secrets.token_hex(4)
-            key = f"{settings.redis_key_prefix}:{int(time.time())}:{unique_id}"
-            await self.redis_client.setex(
-                key,
-                settings.redis_expiration_seconds,
-                json.dumps(log_data),
-            )
+            entry = self._build_entry(context.message.name, context.message.arguments, result)
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            logger.warning("Redis log queue is full, dropping entry")
         except Exception:
-            logger.exception("Failed to store data in Redis")
             # We don't raise here as logging is a non-critical side effect
-            return result
+            logger.exception("Failed to store data in Redis")
 
         return result
+
+    def _build_entry(
+        self, tool: str, params: dict[str, Any] | None, result: Any
+    ) -> tuple[str, dict[str, bytes | str]]:
+        """Serialize a tool call into a Redis key and hash fields.
+
+        Fields are stored separately, so the UI can list tool names and params
+        without transferring or decoding the responses.
+
+        Args:
+            tool: Name of the called tool
+            params: Arguments the tool was called with
+            result: The result from the tool execution
+
+        Returns:
+            Tuple of (key, hash fields with tool name, JSON params and response)
+
+        """
+        # Extract content from ToolResult if necessary
+        # FastMCP wraps tool outputs in ToolResult objects
+        response_content = ""
+        if isinstance(result, ToolResult):
+            # ToolResult.content is a list of ContentBlock objects
+            response_content = "\n".join([
+                text if (text := getattr(item, "text", None)) is not None else str(item)
+                for item in result.content
+            ])
+
+            # If there's structured content and it's not just the same as text
+            if result.structured_content and not response_content:
+                response_content = orjson.dumps(
+                    result.structured_content, option=RESPONSE_JSON_OPTIONS
+                ).decode()
+        elif isinstance(result, (list, dict)):
+            response_content = orjson.dumps(result, option=RESPONSE_JSON_OPTIONS).decode()
+        else:
+            response_content = str(result)
+
+        # Store tool params and response
+        log_data: dict[str, bytes | str] = {
+            "tool": tool,
+            "params": orjson.dumps(params or {}, option=orjson.OPT_NON_STR_KEYS),
+            "response": response_content,
+        }
+
+        # Nanosecond timestamp plus a per-process sequence number keeps keys unique
+        key = f"{self._key_prefix}:{time.time_ns()}:{next(self._seq)}"
+        return key, log_data
+
+    async def _flush_loop(self, redis_client: Redis) -> None:
+        """Write queued entries to Redis in batches until the shutdown sentinel arrives.
+
+        Args:
+            redis_client: Redis client to write to
+
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is None:
+                break
+
+            batch = [entry]
+            deadline = loop.time() + FLUSH_INTERVAL
+            while len(batch) < MAX_BATCH_SIZE:
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            await self._write_batch(redis_client, batch)
+
+    async def _write_batch(
+        self, redis_client: Redis, batch: list[tuple[str, dict[str, bytes | str]]]
+    ) -> None:
+        """Write a batch of entries to Redis in a single pipeline.
+
+        Each key is also added to the index sorted set the UI pages through;
+        index members whose entries have expired are trimmed in the same pipeline.
+        Batches arriving while the circuit is open are dropped.
+
+        Args:
+            redis_client: Redis client to write to
+            batch: List of (key, hash fields) tuples
+
+        """
+        if time.monotonic() < self._open_until:
+            return
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                now = time.time()
+                for key, fields in batch:
+                    pipe.hset(key, mapping=fields)
+                    pipe.expire(key, self._expiration)
+                pipe.zadd(self._index_key, dict.fromkeys((key for key, _ in batch), now))
+                pipe.zremrangebyscore(self._index_key, "-inf", now - self._expiration)
+                pipe.expire(self._index_key, self._expiration)
+                await pipe.execute()
+        except Exception:
+            # We don't raise here as logging is a non-critical side effect
+            logger.exception("Failed to store %d entries in Redis", len(batch))
+            self._fail_count += 1
+            if self._fail_count >= CIRCUIT_FAILURE_THRESHOLD:
+                logger.warning(
+                    "Redis logging suspended for %.0f seconds after %d consecutive failures",
+                    CIRCUIT_OPEN_SECONDS,
+                    self._fail_count,
+                )
+                self._open_until = time.monotonic() + CIRCUIT_OPEN_SECONDS
+                self._fail_count = 0
+        else:
+            self._fail_count = 0
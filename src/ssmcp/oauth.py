@@ -1,12 +1,17 @@
 """OAuth token verification using JWKS from any OIDC-compliant identity provider."""
 
 import asyncio
+import base64
+import functools
+import hashlib
+import re
 import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
 import jwt
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+import orjson
 
 from ssmcp.config import settings
 from ssmcp.exceptions import (
@@ -17,15 +22,40 @@ from ssmcp.exceptions import (
     TokenExpiredError,
     TokenValidationError,
 )
+from ssmcp.logger import logger
 
-__all__ = ["JWKSProvider", "OAuthTokenVerifier"]
+__all__ = ["JWKSProvider", "OAuthTokenVerifier", "get_token_verifier"]
+
+# Fraction of the cache TTL after which keys are refreshed in the background
+REFRESH_AHEAD_RATIO = 0.8
+
+# Multiple of the cache TTL after which cached keys are no longer served unless a refresh succeeds
+MAX_STALENESS_RATIO = 2
+
+# Minimum interval in seconds between blocking refreshes triggered by unknown key IDs
+MIN_REFRESH_INTERVAL = 300
+
+# Extracts the max-age directive from a Cache-Control header
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+# Maximum number of verified tokens kept in memory; oldest entries are evicted first
+TOKEN_CACHE_MAX_SIZE = 4096
+
+# Maximum seconds a verified token is trusted without verifying it again
+TOKEN_CACHE_MAX_TTL = 300
 
 
 class JWKSProvider:
     """Fetches and caches JWKS (JSON Web Key Set) from any OIDC-compliant identity provider.
 
     This provider retrieves public keys from the JWKS endpoint and caches
-    them to avoid repeated requests. Keys are cached with a TTL.
+    them to avoid repeated requests. Once cached keys reach 80% of their TTL
+    they keep being served while a refresh runs in the background, so requests
+    never wait for the endpoint unless a key ID is unknown. Keys older than
+    MAX_STALENESS_RATIO times the TTL are only served after a successful
+    refresh, so revoked keys aren't trusted indefinitely while the endpoint is
+    down. Refreshes are conditional (ETag/Last-Modified) and honor the
+    server's Cache-Control max-age.
     """
 
     def __init__(self, jwks_url: str, cache_ttl: int = 3600) -> None:
@@ -38,9 +68,45 @@ class JWKSProvider:
         """
         self.jwks_url = jwks_url
         self.cache_ttl = cache_ttl
+        self._base_cache_ttl = cache_ttl
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        # Monotonic timestamps, so wall-clock adjustments can't expire or pin the cache
         self._cache_time: float = 0.0
+        self._last_fetch_attempt: float = 0.0
         self._keys: dict[str, Any] = {}
+        self._key_fingerprints: dict[str, bytes] = {}
         self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._http: httpx.AsyncClient | None = None
+
+    async def aclose(self) -> None:
+        """Cancel any pending background refresh and close the HTTP client.
+
+        The provider stays usable: the next refresh opens a new client, so a
+        cached provider survives the application lifespan that closed it.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Returns:
+            HTTP client reused by all refreshes until the provider is closed
+
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=10.0,
+                http2=True,
+                limits=httpx.Limits(max_connections=2, max_keepalive_connections=2),
+            )
+        return self._http
 
     async def get_key(self, kid: str) -> Any:
         """Get a public key by key ID.
@@ -55,19 +121,48 @@ class JWKSProvider:
             InvalidJWKSURLError: If key cannot be fetched or found
 
         """
-        # Check if cache is still valid
-        if time.time() - self._cache_time > self.cache_ttl:
+        if not self._keys or self._is_expired():
+            # Nothing to serve yet, or the keys are too old to trust, so the fetch has to block
             await self._refresh_cache()
+            if self._is_expired():
+                # Another task's refresh attempt failed while this one waited for the lock
+                msg = f"Cached JWKS from {self.jwks_url} expired and could not be refreshed"
+                raise InvalidJWKSURLError(msg)
+        elif time.monotonic() - self._last_fetch_attempt > self.cache_ttl * REFRESH_AHEAD_RATIO:
+            self._schedule_refresh()
 
         if kid not in self._keys:
-            # Try to refresh cache if key not found
-            await self._refresh_cache()
+            # Unknown kid may mean the provider rotated keys, but don't let
+            # tokens with bogus key IDs hammer the endpoint
+            if time.monotonic() - self._last_fetch_attempt > MIN_REFRESH_INTERVAL:
+                await self._refresh_cache()
             if kid not in self._keys:
                 msg = f"Key with kid '{kid}' not found in JWKS"
                 raise InvalidJWKSURLError(msg)
 
         return self._keys[kid]
 
+    def _is_expired(self) -> bool:
+        """Check whether the cached keys are past the maximum staleness bound.
+
+        Returns:
+            True if the last successful fetch is older than the bound
+
+        """
+        return time.monotonic() - self._cache_time > self.cache_ttl * MAX_STALENESS_RATIO
+
+    def _schedule_refresh(self) -> None:
+        """Start a background JWKS refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        """Refresh the JWKS cache, keeping stale keys if the fetch fails."""
+        try:
+            await self._refresh_cache()
+        except InvalidJWKSURLError as e:
+            logger.warning("Background JWKS refresh failed, serving cached keys: %s", e)
+
     async def _refresh_cache(self) -> None:
         """Fetch and cache JWKS from the configured endpoint.
 
@@ -77,28 +172,89 @@ class JWKSProvider:
             InvalidJWKSURLError: If JWKS cannot be fetched or parsed
 
         """
+        observed_attempt = self._last_fetch_attempt
         async with self._refresh_lock:
-            # Check again if another task already refreshed while we waited for the lock
-            if time.time() - self._cache_time <= self.cache_ttl:
+            # Another task already fetched while we waited for the lock
+            if self._last_fetch_attempt != observed_attempt:
                 return
 
+            self._last_fetch_attempt = time.monotonic()
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(self.jwks_url)
-                    response.raise_for_status()
-                    jwks_data = response.json()
-
-                # Parse and cache keys
-                self._keys = {}
+                response = await self._get_http_client().get(
+                    self.jwks_url, headers=self._conditional_headers()
+                )
+
+                self._update_cache_ttl(response.headers.get("cache-control"))
+                if response.status_code == httpx.codes.NOT_MODIFIED and self._keys:
+                    # Key set unchanged, keep the already parsed keys
+                    self._cache_time = time.monotonic()
+                    return
+
+                response.raise_for_status()
+                jwks_data = response.json()
+
+                # Parse and cache keys, reusing key objects that didn't change
+                keys = {}
+                fingerprints = {}
                 for key_data in jwks_data.get("keys", []):
-                    key = self._parse_jwk(key_data)
-                    self._keys[key_data["kid"]] = key
-
-                self._cache_time = time.time()
-            except (httpx.HTTPError, KeyError, ValueError, Exception) as e:
+                    kid = key_data["kid"]
+                    fingerprint = self._jwk_fingerprint(key_data)
+                    if self._key_fingerprints.get(kid) == fingerprint:
+                        keys[kid] = self._keys[kid]
+                    else:
+                        keys[kid] = self._parse_jwk(key_data)
+                    fingerprints[kid] = fingerprint
+
+                self._keys = keys
+                self._key_fingerprints = fingerprints
+                self._etag = response.headers.get("etag")
+                self._last_modified = response.headers.get("last-modified")
+                self._cache_time = time.monotonic()
+            except Exception as e:
                 msg = f"Failed to fetch JWKS from {self.jwks_url}: {e}"
                 raise InvalidJWKSURLError(msg) from e
 
+    def _conditional_headers(self) -> dict[str, str]:
+        """Build conditional request headers from the last successful fetch.
+
+        Returns:
+            Headers for a conditional JWKS request
+
+        """
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _update_cache_ttl(self, cache_control: str | None) -> None:
+        """Extend the cache TTL to the server-advertised max-age.
+
+        The configured TTL is kept as a lower bound.
+
+        Args:
+            cache_control: Cache-Control header of the JWKS response
+
+        """
+        match = MAX_AGE_PATTERN.search(cache_control) if cache_control else None
+        max_age = int(match.group(1)) if match else 0
+        self.cache_ttl = max(self._base_cache_ttl, max_age)
+
+    @staticmethod
+    def _jwk_fingerprint(jwk_data: dict[str, Any]) -> bytes:
+        """Compute a digest identifying the key material of a JWK.
+
+        Args:
+            jwk_data: JWK data from JWKS endpoint
+
+        Returns:
+            Digest of the key type, modulus and exponent
+
+        """
+        material = f"{jwk_data.get('kty')}|{jwk_data.get('n')}|{jwk_data.get('e')}"
+        return hashlib.blake2b(material.encode(), digest_size=16).digest()
+
     def _parse_jwk(self, jwk_data: dict[str, Any]) -> Any:
         """Parse a JWK into a public key.
 
@@ -117,14 +273,8 @@ class JWKSProvider:
                 msg = f"Unsupported key type: {jwk_data.get('kty')}"
                 raise InvalidJWKSURLError(msg)
 
-            # Extract RSA public key components
-            e = int.from_bytes(jwt.utils.base64url_decode(jwk_data["e"]))
-            n = int.from_bytes(jwt.utils.base64url_decode(jwk_data["n"]))
-
-            # Create RSA public key
-            numbers = RSAPublicNumbers(e=e, n=n)
-            return numbers.public_key()
-        except (KeyError, ValueError) as e:
+            return jwt.PyJWK(jwk_data).key
+        except (jwt.PyJWKError, jwt.InvalidKeyError, KeyError, ValueError) as e:
             msg = f"Failed to parse JWK: {e}"
             raise InvalidJWKSURLError(msg) from e
 
@@ -139,11 +289,21 @@ class OAuthTokenVerifier:
     - Audience (aud claim) matches configured client ID
     - Subject (sub claim) exists and contains user ID
 
+    Successfully verified tokens are cached for up to TOKEN_CACHE_MAX_TTL
+    seconds and never past their own ``exp`` claim, so clients reusing the
+    same bearer token skip signature verification. Once TOKEN_CACHE_MAX_SIZE
+    tokens are cached, the least recently used one is evicted first.
+
     """
 
     def __init__(self) -> None:
         """Initialize OAuth token verifier."""
         self.jwks_provider = JWKSProvider(settings.oauth_jwks_url)
+        self._token_cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def aclose(self) -> None:
+        """Release network resources held by the JWKS provider."""
+        await self.jwks_provider.aclose()
 
     async def verify_token(self, token: str) -> dict[str, Any]:
         """Verify a JWT token and return its payload.
@@ -162,15 +322,29 @@ class OAuthTokenVerifier:
             SubjectClaimMissingError: If sub claim is missing
 
         """
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            expires_at, result = cached
+            if time.time() < expires_at:
+                # Most recently used tokens are evicted last
+                self._token_cache.move_to_end(cache_key)
+                # Callers get their own copy, so they can't alter what later hits return
+                return dict(result)
+            del self._token_cache[cache_key]
+
         try:
             # Decode header to get kid (key ID)
-            header = jwt.get_unverified_header(token)
+            header = self._decode_header(token)
             kid = header.get("kid")
 
             if not kid:
                 msg = "Token missing 'kid' in header"
                 raise TokenValidationError(msg)
 
+            # Reject expired tokens and foreign audiences before the costly signature check
+            self._precheck_claims(jwt.decode(token, options={"verify_signature": False}))
+
             # Get the public key for this token
             public_key = await self.jwks_provider.get_key(kid)
 
@@ -190,7 +364,7 @@ class OAuthTokenVerifier:
                 raise SubjectClaimMissingError(msg)
 
             # Return user information
-            return {"sub": sub, "payload": payload}
+            result = {"sub": sub, "payload": payload}
 
         except jwt.ExpiredSignatureError as e:
             raise TokenExpiredError("Token has expired") from e
@@ -203,8 +377,106 @@ class OAuthTokenVerifier:
         except jwt.InvalidTokenError as e:
             msg = f"Invalid token: {e}"
             raise TokenValidationError(msg) from e
-        except (InvalidJWKSURLError, SubjectClaimMissingError):
+        except (
+            AudienceMismatchError,
+            InvalidJWKSURLError,
+            SubjectClaimMissingError,
+            TokenExpiredError,
+            TokenValidationError,
+        ):
             raise  # Re-raise our custom exceptions
         except Exception as e:
             msg = f"Unexpected error verifying token: {e}"
             raise TokenValidationError(msg) from e
+
+        self._cache_token(cache_key, payload, result)
+        return result
+
+    @staticmethod
+    def _decode_header(token: str) -> dict[str, Any]:
+        """Decode the JOSE header of a token without verifying it.
+
+        Args:
+            token: JWT access token string
+
+        Returns:
+            Decoded header
+
+        Raises:
+            TokenValidationError: If the header is not valid base64url-encoded JSON
+
+        """
+        header_segment, separator, _ = token.partition(".")
+        if not separator:
+            raise TokenValidationError("Invalid token: Not enough segments")
+
+        try:
+            padded = header_segment + "=" * (-len(header_segment) % 4)
+            header = orjson.loads(base64.urlsafe_b64decode(padded))
+        except ValueError as e:
+            msg = f"Invalid token: Invalid header: {e}"
+            raise TokenValidationError(msg) from e
+
+        if not isinstance(header, dict):
+            raise TokenValidationError("Invalid token: Invalid header string")
+        return header
+
+    def _precheck_claims(self, claims: dict[str, Any]) -> None:
+        """Validate exp and aud claims of an unverified token.
+
+        Only well-formed claims are checked here; anything unusual is left to
+        the signed decode so error messages stay consistent.
+
+        Args:
+            claims: Token claims decoded without signature verification
+
+        Raises:
+            TokenExpiredError: If token has expired
+            AudienceMismatchError: If aud claim doesn't match client ID
+
+        """
+        exp = claims.get("exp")
+        if isinstance(exp, int | float) and exp <= time.time():
+            raise TokenExpiredError("Token has expired")
+
+        aud = claims.get("aud")
+        audiences = [aud] if isinstance(aud, str) else aud
+        if isinstance(audiences, list) and settings.oauth_client_id not in audiences:
+            msg = f"Token audience does not match expected client ID '{settings.oauth_client_id}'"
+            raise AudienceMismatchError(msg)
+
+    def _cache_token(
+        self, cache_key: bytes, payload: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        """Store a verified token until its expiration time or TOKEN_CACHE_MAX_TTL.
+
+        Tokens without a numeric ``exp`` claim are never cached. The TTL cap
+        bounds how long a token keeps working after its signing key is rotated out.
+
+        Args:
+            cache_key: Digest of the raw token string
+            payload: Verified token payload
+            result: Verification result returned to callers
+
+        """
+        exp = payload.get("exp")
+        if not isinstance(exp, int | float):
+            return
+
+        expires_at = min(float(exp), time.time() + TOKEN_CACHE_MAX_TTL)
+        self._token_cache[cache_key] = (expires_at, dict(result))
+        if len(self._token_cache) > TOKEN_CACHE_MAX_SIZE:
+            self._token_cache.popitem(last=False)
+
+
+@functools.cache
+def get_token_verifier() -> OAuthTokenVerifier:
+    """Get the process-wide OAuth token verifier.
+
+    A single instance is shared so the JWKS and token caches are not duplicated.
+
+    Returns:
+        Shared OAuthTokenVerifier instance
+
+    """
+    return OAuthTokenVerifier()
@@ -0,0 +1,50 @@
+"""HTML parsing helpers shared by the content filters.
+
+Parsing is done with lxml, whose C parser builds the tree far faster than
+BeautifulSoup's pure-Python ``html.parser`` backend.
+"""
+
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
+
+# Elements whose text is never page content; dropped right after parsing
+NON_CONTENT_TAGS = ("script", "style")
+
+# Input is always fed as UTF-8 bytes, so encoding declarations in the markup are ignored
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def parse_html(html: str) -> HtmlElement | None:
+    """Parse an HTML document or fragment into an lxml tree.
+
+    Fragments are wrapped into ``<html><body>`` by the parser.
+
+    Args:
+        html: HTML content to parse.
+
+    Returns:
+        Root ``<html>`` element, or None if the document is empty.
+
+    """
+    try:
+        root = lxml.html.document_fromstring(html.encode(), parser=_HTML_PARSER)
+    except etree.ParserError:
+        return None
+
+    etree.strip_elements(root, *NON_CONTENT_TAGS, with_tail=False)
+    return root
+
+
+def to_html(element: HtmlElement) -> str:
+    """Serialize an element without the text that follows it.
+
+    Args:
+        element: Element to serialize.
+
+    Returns:
+        HTML markup of the element and its descendants.
+
+    """
+    return str(lxml.html.tostring(element, encoding="unicode", with_tail=False))
+
@@ -1,8 +1,10 @@
 """HTML extraction module using Crawl4ai."""
 
 import asyncio
-from typing import NamedTuple
+from collections import OrderedDict, deque
+from typing import Any, NamedTuple
 
+import httpx
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 
 from ssmcp.config import Settings
@@ -17,22 +19,65 @@ class ExtractionResult(NamedTuple):
     cleaned_html: str
 
 
+class _CachedPage(NamedTuple):
+    """Extraction result of a page together with its HTTP validators."""
+
+    etag: str | None
+    last_modified: str | None
+    result: ExtractionResult
+
+
+# Maximum number of extracted pages kept for conditional revalidation
+PAGE_CACHE_MAX_SIZE = 64
+
+# Timeout in seconds for the conditional request revalidating a cached page
+REVALIDATION_TIMEOUT = 5.0
+
+# Navigations served by one browser session before its context is torn down to bound memory
+MAX_USES_PER_SESSION = 50
+
+
+class _PooledCrawler:
+    """Browser instance of the pool with the session its page is reused through."""
+
+    def __init__(self, crawler: AsyncWebCrawler, session_id: str, config: CrawlerRunConfig) -> None:
+        self.crawler = crawler
+        self.session_id = session_id
+        # Run config bound to the session, so Crawl4AI keeps the page open between calls
+        self.config = config
+        self.uses = 0
+
+
 class Extractor:
     """HTML extractor using a pool of browser instances.
 
-    Uses a queue to limit concurrent browser instances and reuse them across requests.
+    Uses a semaphore to limit concurrent browser instances and a free list
+    to reuse them across requests. Each instance navigates through one
+    long-lived session, so its browser context and page are reused instead
+    of being created per request; the session is recycled after
+    MAX_USES_PER_SESSION navigations or a failure. Pages served with an ETag or Last-Modified
+    header are cached and revalidated with a conditional HEAD request, so an
+    unchanged page is returned without a browser navigation.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient | None = None) -> None:
         """Initialize the extractor with settings.
 
         Args:
             settings: Application settings containing Crawl4ai configuration.
+            http_client: Shared HTTP client for revalidation; a private one is created if omitted.
 
         """
         self._settings = settings
-        self._crawler_queue: asyncio.Queue[AsyncWebCrawler] = asyncio.Queue()
         self._crawlers: list[AsyncWebCrawler] = []
+        # Crawlers not currently in use; the semaphore counts them
+        self._free_crawlers: deque[_PooledCrawler] = deque()
+        self._crawler_semaphore = asyncio.Semaphore(0)
+        # Settings never change at runtime, so one config serves every request
+        self._crawler_config = self._get_crawler_config()
+        self._page_cache: OrderedDict[str, _CachedPage] = OrderedDict()
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient()
 
     async def start(self) -> None:
         """Initialize the browser pool.
@@ -56,11 +101,15 @@ class Extractor:
             verbose=False,
         )
 
-        for _ in range(pool_size):
+        for index in range(pool_size):
             crawler = AsyncWebCrawler(config=browser_config)
             await crawler.start()
             self._crawlers.append(crawler)
-            self._crawler_queue.put_nowait(crawler)
+            session_id = f"pool-{index}"
+            session_config = self._crawler_config.clone(session_id=session_id)
+            self._free_crawlers.append(_PooledCrawler(crawler, session_id, session_config))
+
+        self._crawler_semaphore = asyncio.Semaphore(len(self._free_crawlers))
 
         logger.debug("Browser pool initialized.")
 
@@ -70,13 +119,11 @@ class Extractor:
         for crawler in self._crawlers:
             await crawler.close()
         self._crawlers.clear()
-
-        # Drain queue
-        while not self._crawler_queue.empty():
-            try:
-                self._crawler_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._free_crawlers.clear()
+        self._crawler_semaphore = asyncio.Semaphore(0)
+        self._page_cache.clear()
+        if self._owns_http:
+            await self._http.aclose()
         logger.debug("Browser pool closed.")
 
     async def extract_html(self, url_or_html: str) -> ExtractionResult:
@@ -99,35 +146,130 @@ class Extractor:
         """
         is_url = url_or_html.startswith(("http://", "https://"))
 
-        crawler_config = self._get_crawler_config()
+        if is_url:
+            cached_result = await self._revalidate_cached(url_or_html)
+            if cached_result is not None:
+                return cached_result
 
         # Get a crawler from the pool (blocks if none available)
-        crawler = await self._crawler_queue.get()
+        async with self._crawler_semaphore:
+            pooled = self._free_crawlers.pop()
+            succeeded = False
+            try:
+                target = url_or_html if is_url else f"raw:{url_or_html}"
+                mode = "URL" if is_url else "HTML"
+                if is_url:
+                    logger.debug("[EXTRACTION STARTED] (mode=%s) URL: %s", mode, url_or_html)
+                else:
+                    logger.debug("[EXTRACTION STARTED] (mode=%s)", mode)
+
+                if is_url:
+                    pooled.uses += 1
+                    result = await pooled.crawler.arun(url=target, config=pooled.config)
+                else:
+                    # Raw HTML is processed without a page, so no session is needed
+                    result = await pooled.crawler.arun(url=target, config=self._crawler_config)
+
+                if not result.success:
+                    error_msg = getattr(result, "error_message", "Unknown Crawl4AI error")
+                    raise Crawl4AIError(error_msg)
+
+                raw_html = result.html
+                cleaned_html = result.cleaned_html
+
+                if not raw_html and not cleaned_html:
+                    raise ExtractorError("No HTML content extracted")
+
+                extraction_result = ExtractionResult(
+                    raw_html=raw_html or "", cleaned_html=cleaned_html or ""
+                )
+                if is_url:
+                    self._cache_page(url_or_html, result.response_headers, extraction_result)
+                succeeded = True
+                return extraction_result
+
+            finally:
+                if pooled.uses and (not succeeded or pooled.uses >= MAX_USES_PER_SESSION):
+                    await self._recycle_session(pooled)
+                # Always return the crawler to the pool
+                self._free_crawlers.append(pooled)
+
+    async def _recycle_session(self, pooled: _PooledCrawler) -> None:
+        """Close the browser context of a pooled session.
+
+        The next navigation with the same session id opens a fresh context.
+
+        Args:
+            pooled: Pool entry whose session is closed.
+
+        """
+        logger.debug("Recycling browser session %s after %d uses", pooled.session_id, pooled.uses)
+        pooled.uses = 0
         try:
-            target = url_or_html if is_url else f"raw:{url_or_html}"
-            mode = "URL" if is_url else "HTML"
-            if is_url:
-                logger.debug("[EXTRACTION STARTED] (mode=%s) URL: %s", mode, url_or_html)
-            else:
-                logger.debug("[EXTRACTION STARTED] (mode=%s)", mode)
+            await pooled.crawler.crawler_strategy.browser_manager.kill_session(pooled.session_id)
+        except Exception as e:
+            # A broken session is dropped by Crawl4AI once its TTL expires
+            logger.warning("Failed to close browser session %s: %s", pooled.session_id, e)
+
+    async def _revalidate_cached(self, url: str) -> ExtractionResult | None:
+        """Return the cached result for a URL if the server reports it unchanged.
+
+        Args:
+            url: URL to revalidate.
+
+        Returns:
+            Cached ExtractionResult on a 304 response, None otherwise.
+
+        """
+        cached = self._page_cache.get(url)
+        if cached is None:
+            return None
 
-            result = await crawler.arun(url=target, config=crawler_config)
+        headers = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
 
-            if not result.success:
-                error_msg = getattr(result, "error_message", "Unknown Crawl4AI error")
-                raise Crawl4AIError(error_msg)
+        try:
+            response = await self._http.head(
+                url, headers=headers, timeout=REVALIDATION_TIMEOUT, follow_redirects=True
+            )
+        except httpx.HTTPError as e:
+            logger.debug("Revalidation of %s failed: %s", url, e)
+            return None
 
-            raw_html = result.html
-            cleaned_html = result.cleaned_html
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            return None
 
-            if not raw_html and not cleaned_html:
-                raise ExtractorError("No HTML content extracted")
+        logger.debug("[EXTRACTION SKIPPED] Page not modified: %s", url)
+        self._page_cache.move_to_end(url)
+        return cached.result
 
-            return ExtractionResult(raw_html=raw_html or "", cleaned_html=cleaned_html or "")
+    def _cache_page(
+        self, url: str, response_headers: Any, extraction_result: ExtractionResult
+    ) -> None:
+        """Cache an extraction result if the page carries HTTP validators.
 
-        finally:
-            # Always return the crawler to the pool
-            self._crawler_queue.put_nowait(crawler)
+        Args:
+            url: URL the result was extracted from.
+            response_headers: Response headers reported by Crawl4AI.
+            extraction_result: Result to cache.
+
+        """
+        # Crawl4AI leaves the headers unset when the response isn't available
+        headers = httpx.Headers(response_headers if isinstance(response_headers, dict) else {})
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+
+        if not etag and not last_modified:
+            self._page_cache.pop(url, None)
+            return
+
+        self._page_cache[url] = _CachedPage(etag, last_modified, extraction_result)
+        self._page_cache.move_to_end(url)
+        while len(self._page_cache) > PAGE_CACHE_MAX_SIZE:
+            self._page_cache.popitem(last=False)
 
     def _get_crawler_config(self) -> CrawlerRunConfig:
         """Build crawler configuration from settings.
@@ -1,16 +1,34 @@
 """HTML filtering module."""
 
+from crawl4ai.config import SOCIAL_MEDIA_DOMAINS
+from crawl4ai.utils import get_base_domain, is_external_url
+from lxml import etree
+from lxml.html import HtmlElement
+
 from ssmcp.config import Settings
+from ssmcp.parser.dom import parse_html, to_html
 from ssmcp.parser.filters.css_selector import CssSelectorFilter
 from ssmcp.parser.filters.residual_junk import ResidualJunkFilter
 from ssmcp.parser.protocols import ContentFilter
 
+# Elements the crawler keeps even when they hold fewer words than the threshold
+_SPARSE_ALLOWED_TAGS = frozenset(
+    ("a", "img", "br", "hr", "input", "meta", "link", "source", "track", "wbr", "tr", "td", "th")
+)
+
+# Elements whose whitespace-only children are significant and must not be dropped
+_PREFORMATTED_TAGS = frozenset(("pre", "code"))
+
 
 class Filter:
     """Applies content filters to extract main content from HTML.
 
-    Applies all filters sequentially, with output of each filter
-    becoming input to the next filter in the chain.
+    The HTML is parsed once and the tree is passed through the filters
+    sequentially, with output of each filter becoming input to the next
+    filter in the chain. The result is then cleaned the way the crawler
+    cleans the pages it extracts (excluded tags, external and social media
+    links, external images, elements below the word count threshold) and
+    serialized back to HTML only once.
     """
 
     def __init__(self, settings: Settings) -> None:
@@ -22,6 +40,9 @@ class Filter:
         """
         self._settings = settings
         self._filters = self._initialize_filters()
+        self._excluded_tags = tuple(
+            tag.strip() for tag in settings.crawl4ai_excluded_tags.split(",") if tag.strip()
+        )
 
     def _initialize_filters(self) -> list[ContentFilter]:
         """Initialize content filters in processing order.
@@ -35,31 +56,87 @@ class Filter:
             ResidualJunkFilter(self._settings),
         ]
 
-    def apply_all(self, html: str) -> str | None:
+    def apply_all(self, html: str, url: str = "") -> str | None:
         """Apply all filters sequentially.
 
-        Each filter transforms the HTML. If a filter returns a result,
+        Each filter transforms the parsed tree. If a filter returns a result,
         that result is passed to the next filter. If a filter returns
-        None, the next filter receives the same HTML the previous
+        None, the next filter receives the same node the previous
         filter received (acting as a fallback).
 
         Args:
             html: HTML content to filter.
+            url: URL the page was loaded from, used to tell external links and
+                images apart. If empty, only social media links are dropped.
 
         Returns:
             String containing filtered HTML after all filters applied,
             or None if all filters returned None.
 
         """
-        current_html = html
+        current_node = parse_html(html)
+        if current_node is None:
+            return None
+
         any_success = False
 
         for content_filter in self._filters:
-            result = content_filter.apply(current_html)
+            result = content_filter.apply(current_node)
             if result is not None:
                 # Filter succeeded, use its output for next filter
-                current_html = result
+                current_node = result
                 any_success = True
-            # If result is None, keep current_html unchanged for next filter
+            # If result is None, keep current_node unchanged for next filter
+
+        if not any_success:
+            return None
+
+        # Filtered content goes straight to Markdown conversion, so apply the
+        # same cleaning the crawler applies to the pages it extracts
+        etree.strip_elements(current_node, *self._excluded_tags, with_tail=False)
+        self._drop_excluded_links(current_node, get_base_domain(url))
+        _drop_sparse_elements(current_node, self._settings.crawl4ai_word_count_threshold)
+        return to_html(current_node)
+
+    def _drop_excluded_links(self, node: HtmlElement, base_domain: str) -> None:
+        """Remove social media links, external links and external images.
+
+        Args:
+            node: Element to clean in place.
+            base_domain: Base domain of the page the element comes from.
 
-        return current_html if any_success else None
+        """
+        exclude_external_links = self._settings.crawl4ai_exclude_external_links
+        for link in list(node.iter("a")):
+            href = link.get("href", "").strip()
+            if get_base_domain(href) in SOCIAL_MEDIA_DOMAINS or (
+                exclude_external_links and is_external_url(href, base_domain)
+            ):
+                link.drop_tree()
+
+        for image in list(node.iter("img")):
+            src = image.get("src", "").strip()
+            if get_base_domain(src) in SOCIAL_MEDIA_DOMAINS or is_external_url(src, base_domain):
+                image.drop_tree()
+
+
+def _drop_sparse_elements(node: HtmlElement, word_count_threshold: int) -> None:
+    """Remove leaf elements holding fewer words than the threshold.
+
+    Elements are visited bottom-up, so a parent left empty by the removal
+    of its children is removed as well.
+
+    Args:
+        node: Element to clean in place.
+        word_count_threshold: Minimum number of words a leaf element must hold.
+
+    """
+    for element in reversed(list(node.iterdescendants())):
+        if not isinstance(element, HtmlElement) or element.tag in _SPARSE_ALLOWED_TAGS:
+            continue
+        if len(element) or any(
+            ancestor.tag in _PREFORMATTED_TAGS for ancestor in element.iterancestors()
+        ):
+            continue
+        if len(element.text_content().split()) < word_count_threshold:
+            element.drop_tree()
@@ -1,11 +1,15 @@
 """CSS selector filter for content extraction."""
 
+from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
 
 from ssmcp.config import Settings
 from ssmcp.logger import logger
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
 
 class CssSelectorFilter:
     """Extracts main content using CSS selectors.
@@ -22,46 +26,43 @@ class CssSelectorFilter:
 
         """
         self._settings = settings
-
-    def apply(self, html: str) -> str | None:
+        # Settings never change at runtime, so the selectors are compiled to XPath once
+        self._selectors = tuple(
+            CSSSelector(s.strip(), translator="html")
+            for s in settings.css_selector_priority_list.split(",")
+            if s.strip()
+        )
+
+    def apply(self, node: "HtmlElement") -> "HtmlElement | None":
         """Find and extract the main content element.
 
         Tries selectors in order (e.g., article, main, #content) and returns
         the first match with enough words.
 
         Args:
-            html: HTML content to parse.
+            node: Parsed HTML tree to search.
 
         Returns:
-            Extracted HTML element as string, or None if no match.
+            Matched element, or None if no match.
 
         """
-        soup = BeautifulSoup(html, "html.parser")
-
-        selectors = self._parse_selector_list()
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if not element:
+        min_words = self._settings.css_selector_min_words
+        for selector in self._selectors:
+            matches = selector(node)
+            if not matches:
                 continue
+            element = matches[0]
 
-            # Check word count to avoid selecting empty or small elements
-            text = element.get_text(strip=True)
-            word_count = len(text.split())
+            # Check word count to avoid selecting empty or small elements.
+            # Splitting stops at the threshold, so a large element isn't split into every word.
+            word_count = len(element.text_content().split(maxsplit=min_words))
 
-            if word_count >= self._settings.css_selector_min_words:
-                logger.debug("CSS selector '%s' matched with %d words", selector, word_count)
-                return str(element)
+            if word_count >= min_words:
+                logger.debug(
+                    "CSS selector '%s' matched with at least %d words", selector.css, min_words
+                )
+                return element
 
-        logger.debug("No CSS selector matched among %d candidates", len(selectors))
+        logger.debug("No CSS selector matched among %d candidates", len(self._selectors))
         return None
 
-    def _parse_selector_list(self) -> list[str]:
-        """Parse the CSS selector priority list from settings string.
-
-        Returns:
-            List of CSS selector strings in priority order.
-
-        """
-        selector_str = self._settings.css_selector_priority_list
-        return [s.strip() for s in selector_str.split(",") if s.strip()]
@@ -1,15 +1,32 @@
 """Residual junk filter for removing UI artifacts from extracted content."""
 
-import re
-from typing import TYPE_CHECKING, ClassVar
+import string
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from ssmcp.config import Settings
 from ssmcp.logger import logger
 
 if TYPE_CHECKING:
-    from bs4.element import Tag
+    from lxml.html import HtmlElement
+
+# Whitespace characters ignored by the letter ratio check
+_RATIO_WHITESPACE = (" ", "\t", "\n")
+
+# Translation table deleting ASCII letters and ignored whitespace, leaving other characters
+_NON_LETTERS_TABLE = str.maketrans("", "", string.ascii_letters + "".join(_RATIO_WHITESPACE))
+
+
+class _Subtree(NamedTuple):
+    """Summary of an element's subtree."""
+
+    # Stripped text strings of the subtree joined together, as get_text(strip=True)
+    text: str
+    # Whether any descendant is a protected tag
+    contains_protected: bool
+    # Whether any child element has text
+    has_text_child: bool
 
 
 class ResidualJunkFilter:
@@ -27,58 +44,101 @@ class ResidualJunkFilter:
         self._enabled = settings.junk_filter_enabled
         self._letter_ratio_threshold = settings.junk_filter_letter_ratio_threshold
 
-    def apply(self, html: str) -> str | None:
-        """Remove residual junk elements from HTML content."""
+    def apply(self, node: "HtmlElement") -> "HtmlElement | None":
+        """Remove residual junk elements from an HTML tree in place.
+
+        Removals are decided before anything is dropped, so the tree is left
+        untouched when no text would survive.
+        """
         if not self._enabled:
-            return html
+            return node
 
-        soup = BeautifulSoup(html, "html.parser")
-        removed_count = 0
-        seen_texts: set[str] = set()
+        subtrees = self._collect_subtrees(node)
+        # (hash, length) fingerprints of kept leaf texts, so no long strings are held
+        seen_texts: set[tuple[int, int]] = set()
+        junk: list[HtmlElement] = []
 
-        for element in soup.find_all():
-            # Skip non-tag elements
-            if not hasattr(element, "name"):
-                continue
+        # Pre-order walk in document order; subtrees of removed or
+        # protected container elements are never visited
+        stack = [node]
+        while stack:
+            element = stack.pop()
 
-            # Skip if already removed
-            if element.parent is None:
+            # Skip protected containers along with everything inside them
+            if element.tag in self.PROTECTED_CONTAINER_TAGS:
                 continue
 
-            # Skip protected tags - never remove these
-            if element.name in self.PROTECTED_TAGS:
+            subtree = subtrees[element]
+            if (
+                # Protected tags and elements containing them are never removed
+                element.tag not in self.PROTECTED_TAGS
+                and not subtree.contains_protected
+                and self._should_remove(element, subtree, seen_texts)
+            ):
+                junk.append(element)
                 continue
 
-            # Skip if inside protected containers
-            if self._is_inside_protected_containers(element):
-                continue
+            stack.extend(element.iterchildren(etree.Element, reversed=True))
 
-            # Skip if contains protected tags
-            if self._contains_protected_tags(element):
-                continue
+        # Nothing to drop: the tree is returned as is if it has any text at all
+        if not junk:
+            return node if subtrees[node].text else None
 
-            # Check removal conditions
-            if self._should_remove(element, seen_texts):
-                element.decompose()
-                removed_count += 1
+        if not self._has_text_left(node, set(junk)):
+            return None
 
-        if removed_count > 0:
-            logger.debug("ResidualJunkFilter removed %d junk elements", removed_count)
+        for element in junk:
+            element.drop_tree()
 
-        text_content = soup.get_text(strip=True)
-        return str(soup) if text_content else None
+        logger.debug("ResidualJunkFilter removed %d junk elements", len(junk))
+        return node
 
-    def _is_inside_protected_containers(self, element: "Tag") -> bool:
-        """Check if element is inside protected containers."""
-        return any(parent.name in self.PROTECTED_CONTAINER_TAGS for parent in element.parents)
+    def _collect_subtrees(self, node: "HtmlElement") -> dict["HtmlElement", _Subtree]:
+        """Summarize every element's subtree in a single post-order pass.
 
-    def _should_remove(self, element: "Tag", seen_texts: set[str]) -> bool:
+        Each element's text is joined from its own strings and the already
+        computed text of its children, so no subtree is walked twice.
+
+        Args:
+            node: Root of the tree to summarize.
+
+        Returns:
+            Mapping of each element to its subtree summary.
+
+        """
+        subtrees: dict[HtmlElement, _Subtree] = {}
+
+        # End events arrive for every child before its parent; comments are skipped
+        for _, element in etree.iterwalk(node, events=("end",), tag=etree.Element):
+            parts = [element.text.strip()] if element.text else []
+            contains_protected = False
+            has_text_child = False
+
+            for child in element:
+                # Comments contribute only their tail text
+                if isinstance(child.tag, str):
+                    child_subtree = subtrees[child]
+                    if child_subtree.text:
+                        parts.append(child_subtree.text)
+                        has_text_child = True
+                    if child.tag in self.PROTECTED_TAGS or child_subtree.contains_protected:
+                        contains_protected = True
+                if child.tail:
+                    parts.append(child.tail.strip())
+
+            subtrees[element] = _Subtree("".join(parts), contains_protected, has_text_child)
+
+        return subtrees
+
+    def _should_remove(
+        self, element: "HtmlElement", subtree: _Subtree, seen_texts: set[tuple[int, int]]
+    ) -> bool:
         """Determine if element should be removed."""
         # Remove elements with role="tooltip"
         if element.get("role") == "tooltip":
             return True
 
-        text = element.get_text(strip=True)
+        text = subtree.text
 
         # Remove if no spaces in text (single word/junk)
         if " " not in text:
@@ -90,22 +150,31 @@ class ResidualJunkFilter:
 
         # Remove duplicate text from leaf nodes only (avoid parent/child conflicts)
         # A leaf node has no children with text
-        is_leaf = not any(
-            child.get_text(strip=True) for child in element.find_all(recursive=False)
-        )
-        if is_leaf:
-            if text in seen_texts:
+        if not subtree.has_text_child:
+            fingerprint = (hash(text), len(text))
+            if fingerprint in seen_texts:
                 return True
-            seen_texts.add(text)
+            seen_texts.add(fingerprint)
 
         return False
 
-    def _contains_protected_tags(self, element: "Tag") -> bool:
-        """Check if element contains any protected tags as descendants."""
-        return any(
-            descendant.name in self.PROTECTED_TAGS
-            for descendant in element.find_all(self.PROTECTED_TAGS, recursive=True)
-        )
+    def _has_text_left(self, node: "HtmlElement", junk_set: set["HtmlElement"]) -> bool:
+        """Check if any text remains in node once the junk elements are dropped."""
+        if node in junk_set:
+            return False
+
+        stack = [node]
+        while stack:
+            element = stack.pop()
+            if element.text and element.text.strip():
+                return True
+            for child in element:
+                # Tail text stays in place when its element is dropped
+                if child.tail and child.tail.strip():
+                    return True
+                if isinstance(child.tag, str) and child not in junk_set:
+                    stack.append(child)
+        return False
 
     def _has_low_letter_ratio(self, text: str, threshold: float) -> bool:
         """Check if text has too few letters compared to other characters.
@@ -118,13 +187,12 @@ class ResidualJunkFilter:
             True if letter ratio is below threshold.
 
         """
-        # Remove whitespace for calculation
-        clean_text = text.replace(" ", "").replace("\t", "").replace("\n", "")
-        if not clean_text:
+        # Whitespace is left out of the calculation; counting it doesn't allocate
+        total = len(text) - sum(map(text.count, _RATIO_WHITESPACE))
+        if not total:
             return False
 
-        # Count letters (a-z, A-Z)
-        letters = len(re.findall(r"[a-zA-Z]", clean_text))
-        total = len(clean_text)
+        # Letters (a-z, A-Z) are what remains once whitespace and other characters are excluded
+        letters = total - len(text.translate(_NON_LETTERS_TABLE))
 
         return letters / total < threshold
@@ -1,14 +1,23 @@
 """Markdown generation module using Crawl4ai."""
 
+import hashlib
+from collections import OrderedDict
 
 from crawl4ai import DefaultMarkdownGenerator, PruningContentFilter
 
 from ssmcp.config import Settings
 from ssmcp.exceptions import MarkdownGeneratorError
 
+# Maximum number of converted documents kept per generator
+MARKDOWN_CACHE_MAX_SIZE = 256
+
 
 class MarkdownGenerator:
-    """Converts HTML to Markdown using Crawl4AI."""
+    """Converts HTML to Markdown using Crawl4AI.
+
+    Conversion is deterministic for a given HTML, so recent results are kept in
+    an LRU cache keyed by a digest of the HTML.
+    """
 
     def __init__(self, settings: Settings) -> None:
         """Initialize the markdown generator with settings.
@@ -18,12 +27,38 @@ class MarkdownGenerator:
 
         """
         self._settings = settings
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
 
     def convert(self, html: str) -> str:
         """Convert HTML to Markdown.
 
         Uses PruningContentFilter to remove low-content sections before conversion.
 
+        Args:
+            html: HTML content to convert to Markdown.
+
+        Returns:
+            String containing Markdown content.
+
+        Raises:
+            MarkdownGeneratorError: If MD generation failed.
+
+        """
+        # Settings are fixed per generator, so the HTML alone determines the output
+        key = hashlib.blake2b(html.encode(), digest_size=16).digest()
+        cached = self._cache.pop(key, None)
+        if cached is None:
+            cached = self._generate(html)
+            while len(self._cache) >= MARKDOWN_CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+
+        # Reinserting marks the entry as most recently used
+        self._cache[key] = cached
+        return cached
+
+    def _generate(self, html: str) -> str:
+        """Run the pruning filter and Markdown conversion on HTML.
+
         Args:
             html: HTML content to convert to Markdown.
 
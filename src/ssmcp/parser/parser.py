@@ -2,84 +2,247 @@
 
 import asyncio
 import logging
+import multiprocessing
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
 
+import httpx
 from fastmcp import Context
 
 from ssmcp.config import Settings
-from ssmcp.exceptions import SSMCPError
+from ssmcp.exceptions import ParserError, SSMCPError
 from ssmcp.logger import logger
 from ssmcp.parser.extractor import Extractor
 from ssmcp.parser.filter import Filter
 from ssmcp.parser.markdown_generator import MarkdownGenerator
 from ssmcp.timing import timeit
 
+# Jobs queued per worker process; extraction waits once the queue is full
+JOBS_PER_WORKER = 2
+
+
+class _WorkerState:
+    """Pipeline components owned by a parser worker process."""
+
+    filter: Filter
+    markdown_generator: MarkdownGenerator
+
+
+# Set up once per worker process by _init_worker
+_worker_state = _WorkerState()
+
+
+def _init_worker(settings: Settings) -> None:
+    """Build the filter and markdown generator of a parser worker process.
+
+    Args:
+        settings: Application settings passed from the parent process.
+
+    """
+    _worker_state.filter = Filter(settings)
+    _worker_state.markdown_generator = MarkdownGenerator(settings)
+
+
+def _convert_page(
+    content_filter: Filter,
+    markdown_generator: MarkdownGenerator,
+    url: str,
+    raw_html: str,
+    cleaned_html: str,
+) -> str:
+    """Filter a page and convert the chosen HTML to Markdown.
+
+    Args:
+        content_filter: Filter applied to the raw HTML.
+        markdown_generator: Generator converting the chosen HTML.
+        url: URL the page was loaded from.
+        raw_html: Raw HTML of the page.
+        cleaned_html: HTML cleaned by Crawl4AI, used when no filter matched.
+
+    Returns:
+        String containing Markdown content.
+
+    """
+    # Apply a chain of filters to clean up content
+    filtered_html = content_filter.apply_all(raw_html, url)
+
+    # Convert the filtered fragment if a filter matched, otherwise the cleaned HTML
+    html_to_convert = filtered_html if filtered_html is not None else cleaned_html
+    return markdown_generator.convert(html_to_convert)
+
+
+def _convert_page_in_worker(url: str, raw_html: str, cleaned_html: str) -> str:
+    """Filter and convert a page inside a parser worker process."""
+    return _convert_page(
+        _worker_state.filter, _worker_state.markdown_generator, url, raw_html, cleaned_html
+    )
+
+
+class _ConversionJob(NamedTuple):
+    """Page waiting to be filtered and converted by the worker pool."""
+
+    url: str
+    raw_html: str
+    cleaned_html: str
+    future: asyncio.Future[str]
+
 
 class Parser:
     """Coordinates HTML extraction, filtering, and Markdown conversion.
 
     Pipeline: URL -> HTML extraction -> Content filtering -> Markdown conversion.
+
+    Filtering and Markdown conversion are CPU-bound. With ``parser_workers``
+    set, extracted pages are queued and a dispatcher per worker hands them to
+    a process pool, so several pages are parsed in parallel while browsers
+    keep extracting. Otherwise they run in a thread, so the event loop keeps
+    serving other requests and timeouts still fire during conversion.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, http_client: httpx.AsyncClient | None = None) -> None:
         """Initialize the parser with settings.
 
         Args:
             settings: Application settings containing all configuration.
+            http_client: Shared HTTP client passed on to the extractor.
 
         """
         self._settings = settings
-        self._extractor = Extractor(settings)
+        self._extractor = Extractor(settings, http_client)
         self._filter = Filter(settings)
         self._markdown_generator = MarkdownGenerator(settings)
+        self._executor: ProcessPoolExecutor | None = None
+        # Shared by the dispatchers, so a broken pool is replaced only once
+        self._executor_lock = asyncio.Lock()
+        self._jobs: asyncio.Queue[_ConversionJob] = asyncio.Queue()
+        self._dispatchers: list[asyncio.Task[None]] = []
 
     async def start(self) -> None:
-        """Initialize the extractor's browser pool."""
+        """Initialize the extractor's browser pool and the parser worker pool."""
+        workers = self._settings.parser_workers
+        if workers > 0:
+            self._executor = self._create_executor()
+            self._jobs = asyncio.Queue(maxsize=JOBS_PER_WORKER * workers)
+            self._dispatchers = [asyncio.create_task(self._dispatch_jobs()) for _ in range(workers)]
         await self._extractor.start()
 
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Create the parser worker pool.
+
+        Returns:
+            Process pool sized by ``parser_workers``.
+
+        """
+        # Spawned workers don't inherit the event loop or browser threads
+        return ProcessPoolExecutor(
+            max_workers=self._settings.parser_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._settings,),
+        )
+
+    async def _replace_broken_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Replace the worker pool after one of its processes died.
+
+        Every dispatcher sees the same broken pool, so only the first one to
+        get here replaces it.
+
+        Args:
+            broken: Pool that raised BrokenProcessPool.
+
+        """
+        async with self._executor_lock:
+            if self._executor is not broken:
+                return
+            logger.warning("Parser worker process died, restarting the worker pool")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+
     async def close(self) -> None:
-        """Close the extractor's browser pool."""
+        """Close the extractor's browser pool and the parser worker pool."""
         await self._extractor.close()
 
+        for dispatcher in self._dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers.clear()
+
+        # Fail pages still waiting in the queue
+        while not self._jobs.empty():
+            self._jobs.get_nowait().future.cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     @timeit("Pages parsing", logging.DEBUG)
-    async def parse_pages(self, urls: list[str], ctx: Context) -> dict[str, str]:
+    async def parse_pages(
+        self, urls: Iterable[str], ctx: Context, deadline: float | None = None
+    ) -> dict[str, str]:
         """Parse multiple webpages concurrently.
 
+        Duplicate URLs are parsed once. Pages taking longer than
+        ``parser_page_timeout`` are dropped, and so are pages still pending
+        once the deadline passes.
+
         Args:
-            urls: List of URLs to parse.
+            urls: URLs to parse, consumed once.
             ctx: FastMCP context for progress reporting.
+            deadline: Seconds to wait for all pages; None waits for every page.
 
         Returns:
             Dictionary mapping URLs to their Markdown content.
 
         """
-        total_urls = len(urls)
+        # Keeps the first occurrence of each URL in input order
+        unique_urls = list(dict.fromkeys(urls))
+        total_urls = len(unique_urls)
         completed_count = 0
         await ctx.report_progress(0, total_urls, f"Starting parse of {total_urls} page(s)")
+        page_timeout = self._settings.parser_page_timeout or None
 
         async def _tracked_process(url: str) -> tuple[str, str]:
             nonlocal completed_count
-            content = await self._process_single_url(url)
+            try:
+                content = await asyncio.wait_for(self._process_single_url(url), page_timeout)
+            except TimeoutError:
+                raise ParserError(f"Timed out after {page_timeout}s: {url}") from None
             completed_count += 1
             status_msg = f"Completed {completed_count}/{total_urls}: {url}"
             await ctx.report_progress(completed_count, total_urls, status_msg)
             return (url, content)
 
-        tasks = [_tracked_process(url) for url in urls]
-        results_list = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [asyncio.create_task(_tracked_process(url)) for url in unique_urls]
 
-        # Build dict, skipping expected SSMCP errors but re-raising unexpected ones
-        # e.g. skipping failed URLs for resilience
-        result_dict: dict[str, str] = {}
-        for item in results_list:
-            if isinstance(item, SSMCPError):
-                logger.error("Failed to parse URL: %s", item)
-                continue
-            if isinstance(item, BaseException):
-                raise item
-            url, content = item
-            result_dict[url] = content
+        # Collect results as they complete, skipping expected SSMCP errors
+        # (e.g. failed URLs for resilience) but re-raising unexpected ones
+        completed: dict[str, str] = {}
+        try:
+            async for task in asyncio.as_completed(tasks, timeout=deadline):
+                try:
+                    url, content = await task
+                except SSMCPError as e:
+                    logger.error("Failed to parse URL: %s", e)
+                    continue
+                completed[url] = content
+        except TimeoutError:
+            logger.warning(
+                "Parsing deadline of %ss reached, dropping %d unfinished page(s)",
+                deadline,
+                sum(not task.done() for task in tasks),
+            )
+        finally:
+            # Only unfinished tasks are affected, i.e. after an unexpected error or
+            # the deadline. They are awaited so cancelled extractions have released
+            # their browsers by the time the tool call returns.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        return result_dict
+        # Keep the order of the input URLs rather than completion order
+        return {url: completed[url] for url in unique_urls if url in completed}
 
     async def _process_single_url(self, url: str) -> str:
         """Process a single URL through the pipeline.
@@ -109,18 +272,73 @@ class Parser:
         raw_html = extraction_result.raw_html
         cleaned_html = extraction_result.cleaned_html
 
-        # 2. Apply a chain of filters to clean up content
-        logger.debug("[FILTERING STARTED] for %s", url)
-        filtered_html = await asyncio.to_thread(self._filter.apply_all, raw_html)
-
-        # 3. Choose which HTML to convert:
-        #    - If filter matched, re-extract the filtered fragment for cleaning
-        #    - Otherwise, use the cleaned HTML from step 1
-        html_to_convert = cleaned_html
-        if filtered_html is not None:
-            re_extraction_result = await self._extractor.extract_html(filtered_html)
-            html_to_convert = re_extraction_result.cleaned_html
-
-        # 4. Convert to Markdown
-        logger.debug("[MARKDOWN GENERATION STARTED] for %s", url)
-        return await asyncio.to_thread(self._markdown_generator.convert, html_to_convert)
+        # 2. Filter the content and convert it to Markdown
+        logger.debug("[FILTERING AND MARKDOWN GENERATION STARTED] for %s", url)
+        if self._executor is None:
+            return await asyncio.to_thread(
+                _convert_page, self._filter, self._markdown_generator, url, raw_html, cleaned_html
+            )
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        await self._jobs.put(_ConversionJob(url, raw_html, cleaned_html, future))
+        return await future
+
+    async def _dispatch_jobs(self) -> None:
+        """Hand queued pages to the worker pool one at a time until cancelled.
+
+        A page whose worker process dies fails with a ParserError and the pool
+        is replaced, so later pages are converted by fresh workers.
+        """
+        while True:
+            job = await self._jobs.get()
+
+            # The caller was cancelled while the page waited in the queue
+            if job.future.done():
+                continue
+
+            try:
+                markdown = await self._convert_in_pool(job)
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                if not job.future.done():
+                    job.future.set_result(markdown)
+
+    async def _convert_in_pool(self, job: _ConversionJob) -> str:
+        """Convert a queued page in the worker pool.
+
+        A pool found broken before the page was submitted is replaced and the
+        page is submitted again, as it didn't cause the crash.
+
+        Args:
+            job: Page to convert.
+
+        Returns:
+            String containing Markdown content.
+
+        Raises:
+            ParserError: If the worker process died while converting the page.
+
+        """
+        while True:
+            executor = self._executor
+            if executor is None:
+                raise ParserError(f"Parser worker pool is closed: {job.url}")
+            try:
+                future = executor.submit(
+                    _convert_page_in_worker, job.url, job.raw_html, job.cleaned_html
+                )
+            except BrokenProcessPool:
+                await self._replace_broken_executor(executor)
+                continue
+            break
+
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool as e:
+            await self._replace_broken_executor(executor)
+            raise ParserError(f"Parser worker died while converting {job.url}") from e
@@ -4,28 +4,32 @@ Contains structural typing protocols that define interfaces for
 parser components, enabling better type checking and extensibility.
 """
 
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
 
 
 class ContentFilter(Protocol):
     """Protocol defining the interface for content filters.
 
-    Content filters extract main content from HTML by applying
-    various strategies (CSS selectors, heuristics, etc.).
+    Content filters extract main content from a parsed HTML tree by
+    applying various strategies (CSS selectors, heuristics, etc.).
 
     Implementations should:
-    - Return the filtered HTML string if content was found
-    - Return None if no suitable content was found
+    - Return the node holding the filtered content if content was found,
+      either a descendant of the input or the input modified in place
+    - Return None if no suitable content was found, leaving the input untouched
     """
 
-    def apply(self, html: str) -> str | None:
-        """Apply the filter to extract main content from HTML.
+    def apply(self, node: "HtmlElement") -> "HtmlElement | None":
+        """Apply the filter to extract main content from an HTML tree.
 
         Args:
-            html: The raw HTML content to filter.
+            node: The parsed HTML element to filter.
 
         Returns:
-            The filtered HTML content, or None if no content was found.
+            The element holding the filtered content, or None if no content was found.
 
         """
         ...
@@ -3,28 +3,43 @@
 from typing import Any
 
 import httpx
+import orjson
 
 from ssmcp.exceptions import SearXNGError
 from ssmcp.logger import logger
 
+# Connection pool limits of the HTTP client shared by searches and page revalidation
+CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0
+)
+
 
 class SearXNGClient:
     """HTTP client for SearXNG search API.
 
     Uses a persistent httpx client to reuse connections across requests.
+    HTTP/2 is negotiated when SearXNG is served over TLS, so concurrent
+    searches are multiplexed over a single connection. The client can be
+    shared with other components, in which case its owner closes it.
     """
 
-    def __init__(self, search_url: str, timeout: float) -> None:
+    def __init__(
+        self, search_url: str, timeout: float, http_client: httpx.AsyncClient | None = None
+    ) -> None:
         """Initialize the SearXNG client.
 
         Args:
             search_url: SearXNG search endpoint URL.
             timeout: Request timeout in seconds.
+            http_client: Shared HTTP client; a private one is created if omitted.
 
         """
         self._search_url = search_url
         self._timeout = timeout
-        self._client = httpx.AsyncClient(timeout=self._timeout)
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            http2=True, timeout=self._timeout, limits=CONNECTION_LIMITS
+        )
 
     async def search(self, query: str) -> list[dict[str, Any]]:
         """Query the search engine and return structured results.
@@ -40,7 +55,7 @@ class SearXNGClient:
 
         try:
             logger.debug("[SEARCH STARTED] for query: %s", query)
-            resp = await self._client.get(self._search_url, params=params)
+            resp = await self._client.get(self._search_url, params=params, timeout=self._timeout)
             resp.raise_for_status()
 
         except httpx.HTTPStatusError as e:
@@ -50,7 +65,7 @@ class SearXNGClient:
             raise SearXNGError(f"Service did not respond: {e}") from e
 
         try:
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except ValueError as e:
             raise SearXNGError(f"Invalid JSON response: {e}") from e
 
@@ -59,6 +74,7 @@ class SearXNGClient:
         return results
 
     async def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client and release resources, unless it is shared."""
         logger.debug("Closing SearXNG client")
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
@@ -1,9 +1,13 @@
 """MCP server for web search with SearXNG and content extraction with Crawl4AI."""
 
-from collections.abc import AsyncIterator
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from itertools import islice
+from operator import itemgetter
 from typing import Annotated, Any
 
+import httpx
 from fastmcp import Context, FastMCP
 from fastmcp.exceptions import ToolError
 from fastmcp.server.dependencies import get_http_request
@@ -12,12 +16,15 @@ from ssmcp.config import settings
 from ssmcp.exceptions import SSMCPError
 from ssmcp.logger import logger, setup_logging
 from ssmcp.middleware.redis_middleware import RedisLoggingMiddleware
-from ssmcp.oauth import OAuthTokenVerifier
+from ssmcp.oauth import get_token_verifier
 from ssmcp.parser.parser import Parser
-from ssmcp.searxng_client import SearXNGClient
+from ssmcp.searxng_client import CONNECTION_LIMITS, SearXNGClient
 from ssmcp.timing import timeit
 from ssmcp.youtube_client import YouTubeClient
 
+if sys.platform != "win32":
+    import uvloop
+
 # Initialize logging as soon as possible
 setup_logging()
 
@@ -35,7 +42,7 @@ class TypedFastMCP(FastMCP):
         """Initialize TypedFastMCP with state set to None."""
         super().__init__(*args, **kwargs)
         self.state = None
-        self.oauth_verifier = OAuthTokenVerifier() if settings.oauth_enabled else None
+        self.oauth_verifier = get_token_verifier() if settings.oauth_enabled else None
 
 
 class ServerState:
@@ -47,26 +54,34 @@ class ServerState:
 
     def __init__(self) -> None:
         """Initialize the server state."""
+        # One connection pool serves searches and page revalidation alike
+        self.http_client = httpx.AsyncClient(http2=True, limits=CONNECTION_LIMITS)
         self.searxng_client = SearXNGClient(
             search_url=settings.searxng_search_url,
             timeout=settings.searxng_timeout,
+            http_client=self.http_client,
         )
-        self.parser = Parser(settings)
+        self.parser = Parser(settings, http_client=self.http_client)
         self.youtube_client = YouTubeClient(
             language=settings.youtube_subtitle_language,
             cookies_path=settings.youtube_cookies_path,
+            workers=settings.youtube_workers,
+            cache_ttl=settings.youtube_cache_ttl_seconds,
         )
 
     async def start(self) -> None:
         """Startup logic for client resources."""
         logger.info("Starting SSMCP server resources...")
         await self.parser.start()
+        self.youtube_client.start()
 
     async def stop(self) -> None:
         """Cleanup logic for client resources."""
         logger.info("Stopping SSMCP server resources...")
         await self.parser.close()
+        await self.youtube_client.close()
         await self.searxng_client.close()
+        await self.http_client.aclose()
 
     async def search_and_enrich(self, query: str, ctx: Context) -> list[dict[str, Any]]:
         """Perform search and enrich results with page content.
@@ -81,12 +96,31 @@ class ServerState:
         """
         search_results = await self.searxng_client.search(query)
         logger.debug("Processing first %d results...", settings.searxng_max_results)
-        urls_to_fetch = [r["url"] for r in search_results[:settings.searxng_max_results]]
+        # URLs are fed lazily, parse_pages consumes them in a single pass
+        urls_to_fetch = islice(map(itemgetter("url"), search_results), settings.searxng_max_results)
 
-        content_map = await self.parser.parse_pages(urls_to_fetch, ctx)
+        content_map = await self.parser.parse_pages(
+            urls_to_fetch, ctx, deadline=settings.parser_search_deadline or None
+        )
         return [{"url": url, "content": content} for url, content in content_map.items()]
 
 
+def _collect_hooks(app: TypedFastMCP, name: str) -> list[Callable[[], Awaitable[None]]]:
+    """Collect a lifecycle hook from every middleware that defines it.
+
+    Args:
+        app: Server whose middleware is inspected.
+        name: Name of the hook method, e.g. 'startup'.
+
+    Returns:
+        Bound hook methods in middleware order.
+
+    """
+    return [
+        hook for middleware in app.middleware if callable(hook := getattr(middleware, name, None))
+    ]
+
+
 @asynccontextmanager
 async def lifespan(app: TypedFastMCP) -> AsyncIterator[dict[str, Any]]:
     """Manage application lifespan: initialize and cleanup HTTP clients."""
@@ -96,18 +130,26 @@ async def lifespan(app: TypedFastMCP) -> AsyncIterator[dict[str, Any]]:
     # Attach state to the typed mcp object
     app.state = state
 
-    # Initialize middleware if present
+    # Middleware is registered at import time, so its lifecycle hooks are collected once
+    startup_hooks = _collect_hooks(app, "startup")
+    shutdown_hooks = _collect_hooks(app, "shutdown")
+
+    for startup in startup_hooks:
+        await startup()
+
+    # Subtitles are cached through the logging middleware's connection pool
     for middleware in app.middleware:
-        if hasattr(middleware, "startup"):
-            await middleware.startup()
+        if isinstance(middleware, RedisLoggingMiddleware):
+            state.youtube_client.use_cache(middleware.redis_client, settings.redis_key_prefix)
 
     try:
         yield {"state": state}
     finally:
-        # Cleanup middleware if present
-        for middleware in app.middleware:
-            if hasattr(middleware, "shutdown"):
-                await middleware.shutdown()
+        for shutdown in shutdown_hooks:
+            await shutdown()
+
+        if app.oauth_verifier is not None:
+            await app.oauth_verifier.aclose()
 
         await state.stop()
 
@@ -171,16 +213,6 @@ def get_state() -> ServerState:
     return mcp.state
 
 
-def get_parser(state: ServerState) -> Parser:
-    """Get the parser client from server state."""
-    return state.parser
-
-
-def get_youtube_client(state: ServerState) -> YouTubeClient:
-    """Get the YouTube client from server state."""
-    return state.youtube_client
-
-
 # Add Redis middleware if enabled
 mcp = TypedFastMCP("ssmcp", lifespan=lifespan)
 if settings.redis_url:
@@ -219,7 +251,7 @@ async def web_fetch(
     """Fetch content from a specified URL and convert to Markdown."""
     user_id = await get_user_id()
     log_tool_call("web_fetch", f"URL: {url}", user_id)
-    parser = get_parser(get_state())
+    parser = get_state().parser
     try:
         result = await parser.parse_pages([url], ctx)
     except SSMCPError as e:
@@ -238,7 +270,7 @@ async def youtube_get_subtitles(
     """Get subtitles from a YouTube video and return the text content."""
     user_id = await get_user_id()
     log_tool_call("youtube_get_subtitles", f"URL: {url}", user_id)
-    youtube = get_youtube_client(get_state())
+    youtube = get_state().youtube_client
     try:
         result = await youtube.get_subtitles(url)
     except SSMCPError as e:
@@ -247,8 +279,13 @@ async def youtube_get_subtitles(
 
 
 def main() -> None:
-    """Run the MCP server."""
-    mcp.run(transport="streamable-http", host=settings.host, port=settings.port)
+    """Run the MCP server, on the uvloop event loop where it is supported."""
+    if sys.platform == "win32":
+        mcp.run(transport="streamable-http", host=settings.host, port=settings.port)
+    else:
+        uvloop.run(
+            mcp.run_async(transport="streamable-http", host=settings.host, port=settings.port)
+        )
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from collections.abc import Callable, Generator
+from collections.abc import Awaitable, Callable, Generator
 from contextlib import contextmanager
 from functools import wraps
 from typing import ParamSpec, TypeVar, cast
@@ -15,11 +15,16 @@ __all__ = ["timeit", "timer"]
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Timings are taken in integer nanoseconds and only converted to seconds for logging
+NS_PER_SECOND = 1_000_000_000
+
 
 @contextmanager
 def timer(name: str = "Operation", log_level: int = logging.INFO) -> Generator[None]:
     """Context manager for timing code blocks.
 
+    Nothing is measured when the logger discards records at ``log_level``.
+
     Args:
         name: Name of the operation being timed
         log_level: Logging level to use (default: INFO)
@@ -32,11 +37,15 @@ def timer(name: str = "Operation", log_level: int = logging.INFO) -> Generator[N
         ...     data = fetch_data()
 
     """
-    start_time = time.perf_counter()
+    if not logger.isEnabledFor(log_level):
+        yield
+        return
+
+    start_time = time.perf_counter_ns()
     try:
         yield
     finally:
-        elapsed_time = time.perf_counter() - start_time
+        elapsed_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
         logger.log(log_level, "%s took %.4f seconds", name, elapsed_time)
 
 
@@ -45,6 +54,10 @@ def timeit(
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Time function execution (supports both sync and async).
 
+    Calls run untimed while the logger discards records at ``log_level``.
+    The level is checked per call, since functions are decorated at import
+    time, before logging is configured.
+
     Args:
         name: Custom name for the operation (default: uses function name)
         log_level: Logging level to use (default: INFO)
@@ -74,29 +87,35 @@ def timeit(
 
     """
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        operation_name = name or f"{func.__module__}.{func.__name__}"
+
         # Check if function is async
         if asyncio.iscoroutinefunction(func):
+            # Typed once here, so calls don't go through typing.cast
+            async_func = cast("Callable[P, Awaitable[R]]", func)
+
             @wraps(func)
             async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                operation_name = name or f"{func.__module__}.{func.__name__}"
-                start_time = time.perf_counter()
+                if not logger.isEnabledFor(log_level):
+                    return await async_func(*args, **kwargs)
+                start_time = time.perf_counter_ns()
                 try:
-                    result = await func(*args, **kwargs)
-                    return cast("R", result)
+                    return await async_func(*args, **kwargs)
                 finally:
-                    elapsed_time = time.perf_counter() - start_time
+                    elapsed_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
                     logger.log(log_level, "%s took %.4f seconds", operation_name, elapsed_time)
             return async_wrapper  # type: ignore[return-value]
         else:
             @wraps(func)
             def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                operation_name = name or f"{func.__module__}.{func.__name__}"
-                start_time = time.perf_counter()
+                if not logger.isEnabledFor(log_level):
+                    return func(*args, **kwargs)
+                start_time = time.perf_counter_ns()
                 try:
                     result = func(*args, **kwargs)
                     return result
                 finally:
-                    elapsed_time = time.perf_counter() - start_time
+                    elapsed_time = (time.perf_counter_ns() - start_time) / NS_PER_SECOND
                     logger.log(log_level, "%s took %.4f seconds", operation_name, elapsed_time)
             return sync_wrapper
     return decorator
@@ -1,14 +1,20 @@
 """YouTube client for downloading subtitles using yt-dlp."""
 
 import asyncio
+import importlib
 import logging
+import multiprocessing
+import re
 import tempfile
-from io import StringIO
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, pairwise
 from pathlib import Path
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
 
-import webvtt
-import yt_dlp
+from redis.asyncio import Redis
 
 from ssmcp.exceptions import YoutubeError
 from ssmcp.logger import logger
@@ -16,87 +22,296 @@ from ssmcp.timing import timer
 
 FALLBACK_LANGUAGE = "en"
 
+# Default time in seconds parsed subtitles stay cached; they practically never change
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# A complete YouTube video ID; matched against the whole candidate, so longer values are rejected
+_VIDEO_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{11}")
+
+# youtube.com paths that carry the video ID as their second segment
+_VIDEO_PATH_PREFIXES = frozenset(("shorts", "embed", "live"))
+
+# Cue start time and the lines following the cue timings line up to the next blank
+# or whitespace-only line, which ends a cue block as it does for webvtt
+_CUE_PATTERN = re.compile(
+    r"^((?:\d{2}:)?\d{2}:\d{2}\.\d{3}) --> [^\n]*\n?((?:[^\S\n]*\S[^\n]*(?:\n|\Z))*)",
+    re.MULTILINE,
+)
+
+# Cue text tags such as <c>, <i> and YouTube's inline <00:00:01.000> word timings
+_CUE_TAG_PATTERN = re.compile(r"<.*?>")
+
+
+def _extract_video_id(url: str) -> str | None:
+    """Return the 11-character video ID of a YouTube URL, or None if it has none.
+
+    Only youtube.com and youtu.be URLs yield an ID, so a URL on another host that
+    happens to contain ``v=`` never maps onto a real video's cache entry.
+    """
+    # Scheme-less URLs such as youtu.be/<id> would otherwise be parsed as a bare path
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    host = parts.hostname or ""
+    segments = parts.path.strip("/").split("/")
+
+    if host == "youtu.be":
+        candidate = segments[0]
+    elif host == "youtube.com" or host.endswith(".youtube.com"):
+        if segments[0] == "watch":
+            candidate = parse_qs(parts.query).get("v", [""])[0]
+        elif segments[0] in _VIDEO_PATH_PREFIXES and len(segments) > 1:
+            candidate = segments[1]
+        else:
+            return None
+    else:
+        return None
+
+    return candidate if _VIDEO_ID_PATTERN.fullmatch(candidate) else None
+
+
+def _import_yt_dlp() -> Any:
+    """Import yt-dlp on first use; it takes a third of a second to load."""
+    return importlib.import_module("yt_dlp")
+
+
+def _import_webvtt() -> Any:
+    """Import webvtt on first use, alongside yt-dlp."""
+    return importlib.import_module("webvtt")
+
+
+def _parse_youtube_vtt(text: str) -> Iterator[tuple[str, str]]:
+    """Extract cues from VTT content with a single regex pass.
+
+    YouTube's VTT output is regular enough that cue blocks can be matched
+    directly, without validating the file or building caption objects. Start
+    times are normalized to HH:MM:SS.mmm like webvtt's.
+
+    Args:
+        text: Content of a VTT file.
+
+    Yields:
+        Tuples of cue start time and cue text without tags.
+
+    """
+    for match in _CUE_PATTERN.finditer(text):
+        start, cue_text = match.groups()
+        if len(start) < len("00:00:00.000"):
+            start = f"00:{start}"
+        yield start, _CUE_TAG_PATTERN.sub("", cue_text)
+
+
+def _find_overlap(words1: list[str], words2: list[str]) -> int:
+    """Find the length of overlapping words between the end of words1 and the start of words2.
+
+    This is used to detect 'rolling' captions where each new segment repeats the
+    previous words before adding new ones. Only positions where words1 holds the
+    first word of words2 can start an overlap, so just those are compared,
+    longest overlap first.
+    """
+    if not words2:
+        return 0
+
+    first_word = words2[0]
+    # An overlap can't be longer than words2
+    start = max(0, len(words1) - len(words2))
+    while True:
+        try:
+            start = words1.index(first_word, start)
+        except ValueError:
+            return 0
+        if words1[start:] == words2[: len(words1) - start]:
+            return len(words1) - start
+        start += 1
+
+
+def _deduplicate_cues(raw_cues: Iterable[tuple[str, str]]) -> Iterator[str]:
+    """Remove overlapping and duplicate cues from raw VTT subtitles.
+
+    YouTube's automated captions often arrive in 'rolling' bursts where segment B
+    contains segment A plus a few new words. This algorithm identifies those
+    overlaps to produce a clean, readable transcript. Cues are consumed one at a
+    time with a single cue of lookahead, and formatted lines are yielded as they
+    are found.
+    """
+    prev_words: list[str] = []
+
+    # The empty sentinel pairs with the last cue and never extends it
+    for (timestamp, current_text), (_, next_text) in pairwise(chain(raw_cues, [("", "")])):
+        # Skip cues where the current text is just a subset of the next burst
+        if next_text.startswith(current_text):
+            continue
+
+        # Identify if the previous burst ended with the same words this one starts with
+        cleaned_text = current_text
+        words = current_text.split()
+        if prev_words:
+            overlap_words = _find_overlap(prev_words, words)
+            if overlap_words > 0:
+                cleaned_text = " ".join(words[overlap_words:])
+
+                if not cleaned_text:
+                    continue
+
+        yield f"[{timestamp}] {cleaned_text}"
+        prev_words = words
 
-class YouTubeClient:
-    """Downloads and parses subtitles from YouTube videos using yt-dlp."""
 
-    def __init__(self, language: str, cookies_path: str | None = None) -> None:
+def _get_subtitles_in_worker(language: str, cookies_path: str | None, url: str) -> str:
+    """Download and parse subtitles inside a subtitle worker process.
+
+    yt-dlp errors hold traceback objects that can't be pickled back to the
+    server, so they are re-raised as YoutubeError with the same message.
+    """
+    try:
+        return YouTubeClient(language, cookies_path)._get_subtitles_sync(url)
+    except YoutubeError:
+        raise
+    except Exception as e:
+        raise YoutubeError(f"{type(e).__name__}: {e}") from None
+
+
+class YouTubeClient:
+    """Downloads and parses subtitles from YouTube videos using yt-dlp.
+
+    yt-dlp runs in a thread by default. With workers set, downloads run in a
+    process pool instead, so concurrent requests don't contend for the GIL
+    while yt-dlp extracts metadata and the subtitles are parsed. Once a Redis
+    client is attached, parsed subtitles are cached by video ID and language,
+    so repeated requests for a video skip yt-dlp entirely.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        cookies_path: str | None = None,
+        workers: int = 0,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+    ) -> None:
         """Initialize the YouTube client.
 
         Args:
             language: Language code to use for subtitles (e.g., 'en', 'es', 'fr').
             cookies_path: Path to the YouTube cookies file.
+            workers: Number of worker processes; 0 downloads in a thread.
+            cache_ttl: Time in seconds parsed subtitles stay cached in Redis.
 
         """
         self._language = language
+        # Languages tried in order before settling for any available one
+        self._preferred_languages = tuple(dict.fromkeys((language, FALLBACK_LANGUAGE)))
         self._cookies_path = Path(cookies_path) if cookies_path else None
+        self._workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._cache_ttl = cache_ttl
+        self._redis: Redis | None = None
+        self._cache_key_prefix = ""
+
+    def use_cache(self, redis_client: Redis | None, key_prefix: str) -> None:
+        """Cache parsed subtitles in Redis.
 
-    def _find_overlap(self, text1: str, text2: str) -> int:
-        """Find the length of overlapping words between the end of text1 and the start of text2.
+        Args:
+            redis_client: Redis client to cache in; None disables caching.
+            key_prefix: Namespace of the deployment's Redis keys.
 
-        This is used to detect 'rolling' captions where each new segment repeats the
-        previous words before adding new ones.
         """
-        words1 = text1.split()
-        words2 = text2.split()
+        self._redis = redis_client
+        self._cache_key_prefix = key_prefix
 
-        max_overlap = 0
-        max_range = min(len(words1), len(words2)) + 1
-        for i in range(1, max_range):
-            if words1[-i:] == words2[:i]:
-                max_overlap = i
+    def start(self) -> None:
+        """Start the subtitle worker pool if workers are configured."""
+        if self._workers > 0:
+            self._executor = self._create_executor()
 
-        return max_overlap
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Create the subtitle worker pool."""
+        # Forking would copy the server's running threads into the workers
+        return ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+        )
 
-    def _deduplicate_cues(self, raw_cues: list[tuple[str, str]]) -> list[str]:
-        """Remove overlapping and duplicate cues from raw VTT subtitles.
+    def _replace_broken_executor(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Replace the worker pool after one of its processes died.
 
-        YouTube's automated captions often arrive in 'rolling' bursts where segment B
-        contains segment A plus a few new words. This algorithm identifies those
-        overlaps to produce a clean, readable transcript.
-        """
-        result: list[str] = []
-        prev_text = ""
-
-        for i, (timestamp, current_text) in enumerate(raw_cues):
-            # Skip indices where the current text is just a subset of the next burst
-            if i + 1 < len(raw_cues):
-                next_text = raw_cues[i + 1][1]
-                if next_text.startswith(current_text):
-                    continue
+        Concurrent requests all see the same broken pool, so only the first
+        one to get here replaces it.
 
-            # Identify if the previous burst ended with the same words this one starts with
-            cleaned_text = current_text
-            if prev_text:
-                overlap_words = self._find_overlap(prev_text, current_text)
-                if overlap_words > 0:
-                    words = current_text.split()
-                    cleaned_text = " ".join(words[overlap_words:])
+        Args:
+            broken: Pool that raised BrokenProcessPool.
 
-                    if not cleaned_text.strip():
-                        continue
+        Returns:
+            Worker pool to use from now on.
 
-            result.append(f"[{timestamp}] {cleaned_text}")
-            prev_text = current_text
+        Raises:
+            YoutubeError: If the client was closed in the meantime.
 
-        return result
+        """
+        if self._executor is broken:
+            logger.warning("Subtitle worker process died, restarting the worker pool")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+        if self._executor is None:
+            raise YoutubeError("Subtitle worker pool is closed")
+        return self._executor
+
+    async def close(self) -> None:
+        """Shut down the subtitle worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _parse_vtt(self, vtt_path: Path) -> str:
+        """Parse a VTT subtitle file into readable text with timestamps.
+
+        Cues are matched with a regex tuned for YouTube's output; webvtt only
+        parses files in which no cue was found that way.
+        """
+        cues = _parse_youtube_vtt(vtt_path.read_text(encoding="utf-8"))
+        first_cue = next(cues, None)
+        if first_cue is None:
+            captions = _import_webvtt().read(str(vtt_path), encoding="utf-8")
+            cues = ((caption.start, caption.text) for caption in captions)
+        else:
+            cues = chain([first_cue], cues)
+
+        raw_cues = (
+            (start, text) for start, cue_text in cues if (text := " ".join(cue_text.split()))
+        )
+        return "\n".join(_deduplicate_cues(raw_cues))
 
-    def _parse_vtt(self, vtt_content: str) -> str:
-        """Parse VTT subtitle content into readable text with timestamps."""
-        raw_cues: list[tuple[str, str]] = []
+    async def get_subtitles(self, url: str) -> str:
+        """Download and parse subtitles from a YouTube video.
 
-        buffer = StringIO(vtt_content)
-        for caption in webvtt.from_buffer(buffer):
-            text = " ".join(caption.text.split())
-            if not text:
-                continue
-            raw_cues.append((caption.start, text))
+        Args:
+            url: YouTube video URL.
 
-        result = self._deduplicate_cues(raw_cues)
-        return "\n".join(result)
+        Returns:
+            String containing parsed subtitles with timestamps.
 
-    async def get_subtitles(self, url: str) -> str:
-        """Download and parse subtitles from a YouTube video.
+        """
+        video_id = _extract_video_id(url)
+        if self._redis is None or video_id is None:
+            return await self._fetch_subtitles(url)
+
+        cache_key = f"{self._cache_key_prefix}:ytsub:{video_id}:{self._language}"
+        try:
+            cached = await self._redis.get(cache_key)
+        except Exception as e:
+            # The cache is an optimization, so an unreachable Redis only costs a download
+            logger.warning("Failed to read cached subtitles for %s: %s", video_id, e)
+            cached = None
+
+        if cached is not None:
+            logger.debug("Serving cached subtitles for %s", video_id)
+            return bytes(cached).decode()
+
+        subtitles = await self._fetch_subtitles(url)
+        try:
+            await self._redis.setex(cache_key, self._cache_ttl, subtitles.encode())
+        except Exception as e:
+            logger.warning("Failed to cache subtitles for %s: %s", video_id, e)
+        return subtitles
+
+    async def _fetch_subtitles(self, url: str) -> str:
+        """Download and parse subtitles in a thread or the worker pool.
 
         Args:
             url: YouTube video URL.
@@ -104,11 +319,30 @@ class YouTubeClient:
         Returns:
             String containing parsed subtitles with timestamps.
 
+        Raises:
+            YoutubeError: If the worker process died while fetching the subtitles.
+
         """
         logger.debug("Fetching subtitles...")
         # yt-dlp is a synchronous library performing blocking I/O (network/file).
         # We wrap it in a thread to prevent blocking the main event loop.
-        return await asyncio.to_thread(self._get_subtitles_sync, url)
+        if self._executor is None:
+            return await asyncio.to_thread(self._get_subtitles_sync, url)
+
+        cookies_path = str(self._cookies_path) if self._cookies_path else None
+        executor = self._executor
+        try:
+            future = executor.submit(_get_subtitles_in_worker, self._language, cookies_path, url)
+        except BrokenProcessPool:
+            # The pool broke before this request got there, so it's safe to send it again
+            executor = self._replace_broken_executor(executor)
+            future = executor.submit(_get_subtitles_in_worker, self._language, cookies_path, url)
+
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool as e:
+            self._replace_broken_executor(executor)
+            raise YoutubeError(f"Subtitle worker died while fetching {url}") from e
 
     def _get_subtitles_sync(self, url: str) -> str:
         """Perform subtitle retrieval using yt-dlp synchronously.
@@ -129,15 +363,9 @@ class YouTubeClient:
         if self._cookies_path and self._cookies_path.exists():
             ydl_opts["cookiefile"] = str(self._cookies_path)
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            with timer("ydl.extract_info call", logging.DEBUG):
-                info = ydl.extract_info(url, download=False)
-            subtitles = info.get("subtitles", {})
-            auto_captions = info.get("automatic_captions", {})
-
-        selected_lang = self._select_language(subtitles, auto_captions)
-        if not selected_lang:
-            raise YoutubeError(f"No subtitles available for: {url}")
+        # Configured and fallback languages are requested up front, so the common
+        # case needs a single yt-dlp run
+        preferred_langs = list(self._preferred_languages)
 
         # yt-dlp doesn't have a 'return subtitles as string' option, so we
         # download them to a temporary scratchpad and read them back.
@@ -147,21 +375,39 @@ class YouTubeClient:
                 {
                     "writesubtitles": True,
                     "writeautomaticsub": True,
-                    "subtitleslangs": [selected_lang],
+                    "subtitleslangs": preferred_langs,
                     "subtitlesformat": "vtt",
                     "outtmpl": str(temp_path / "%(id)s.%(ext)s"),
                 }
             )
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl, timer("ydl.download", logging.DEBUG):
-                ydl.download([url])
-
-            vtt_files = list(temp_path.glob("*.vtt"))
+            yt_dlp = _import_yt_dlp()
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                with timer("ydl.extract_info call", logging.DEBUG):
+                    info = ydl.extract_info(url, download=True)
+
+                requested = info.get("requested_subtitles") or {}
+                selected_lang = next((lang for lang in preferred_langs if lang in requested), None)
+
+                if selected_lang is None:
+                    # Neither language exists, so fetch whatever the video has instead
+                    selected_lang = self._select_language(
+                        info.get("subtitles", {}), info.get("automatic_captions", {})
+                    )
+                    if not selected_lang:
+                        raise YoutubeError(f"No subtitles available for: {url}")
+
+                    # The extracted info is processed again by the same instance,
+                    # so the video page isn't extracted a second time
+                    ydl.params["subtitleslangs"] = [selected_lang]
+                    with timer("ydl.process_ie_result", logging.DEBUG):
+                        ydl.process_ie_result(ydl.sanitize_info(info), download=True)
+
+            vtt_files = list(temp_path.glob(f"*.{selected_lang}.vtt"))
             if not vtt_files:
                 raise YoutubeError(f"Subtitle file not found after download for: {url}")
 
-            vtt_content = vtt_files[0].read_text(encoding="utf-8")
-            parsed_subtitles = self._parse_vtt(vtt_content)
+            parsed_subtitles = self._parse_vtt(vtt_files[0])
 
         if not parsed_subtitles:
             raise YoutubeError(f"Subtitle parsing resulted in empty text for: {url}")
@@ -172,7 +418,7 @@ class YouTubeClient:
         self, subtitles: dict[str, Any], auto_captions: dict[str, Any]
     ) -> str | None:
         """Select the best available language for subtitles."""
-        for lang in [self._language, FALLBACK_LANGUAGE]:
+        for lang in self._preferred_languages:
             if lang in subtitles or lang in auto_captions:
                 logger.debug("Language set to %s", lang)
                 return lang
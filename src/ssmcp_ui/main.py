@@ -1,18 +1,48 @@
-"""Web UI for monitoring ssmcp requests and responses."""
+"""Web UI for monitoring ssmcp requests and responses.
 
-import json
-import re
-from collections.abc import AsyncIterator
+Page views are bound by Redis round trips, followed by a short stretch of
+Python CPU for template rendering. Optimizations therefore target fewer round
+trips and fewer bytes read: the sorted-set index, paging, pipelined HMGET of
+only the listed fields and a pooled client. After that they target less Python
+work per row: precompiled templates, lazily built rows and memoized timestamps.
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Iterator
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, cast
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ResponseError
 
 from ssmcp.config import settings
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+# Templates compiled once at startup and rendered directly by the handlers
+TEMPLATE_NAMES = ("index.html", "detail.html", "error.html")
+
+# Requests listed per index page unless the size query parameter says otherwise
+DEFAULT_PAGE_SIZE = 50
+
+# Upper bound for the size query parameter
+MAX_PAGE_SIZE = 500
+
+# Formatted timestamps remembered; keys logged within the same second share an entry
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Connections the UI keeps open to Redis; concurrent page views beyond this wait for one
+REDIS_MAX_CONNECTIONS = 64
+
+# Idle seconds after which a pooled connection is pinged before reuse
+REDIS_HEALTH_CHECK_INTERVAL = 30
+
 
 class UIState:
     """Application state for UI server."""
@@ -20,11 +50,44 @@ class UIState:
     def __init__(self) -> None:
         """Initialize UI state."""
         self.redis_client: Redis | None = None
+        self.templates: dict[str, Template] = {}
+        self.empty_index = ""
 
     async def start(self) -> None:
-        """Initialize Redis connection."""
+        """Initialize Redis connection and compile the page templates."""
         if settings.redis_url:
-            self.redis_client = Redis.from_url(settings.redis_url)
+            # Replies are decoded to str by the client's parser, so handlers never decode keys.
+            # Connections are pooled and kept alive, so page views reuse open sockets.
+            pool = BlockingConnectionPool.from_url(
+                settings.redis_url,
+                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+                socket_keepalive=True,
+            )
+            # The client owns the pool and disconnects it when closed
+            self.redis_client = Redis.from_pool(pool)
+
+        # Templates don't change while the server runs, so their files aren't re-checked
+        templates.env.auto_reload = False
+        self.templates = {name: templates.get_template(name) for name in TEMPLATE_NAMES}
+        # The first page without any requests always looks the same
+        self.empty_index = self.templates["index.html"].render(
+            requests=(), page=0, size=DEFAULT_PAGE_SIZE, has_next=False
+        )
+
+    def render(self, name: str, **context: object) -> HTMLResponse:
+        """Render a precompiled template into an HTML response.
+
+        Args:
+            name: Template file name.
+            **context: Variables available to the template.
+
+        Returns:
+            HTML response with the rendered page.
+
+        """
+        return HTMLResponse(self.templates[name].render(**context))
 
     async def stop(self) -> None:
         """Cleanup Redis connection."""
@@ -44,82 +107,131 @@ async def lifespan(app: FastAPI) -> AsyncIterator[dict[str, UIState]]:
         await state.stop()
 
 
-app = FastAPI(title="ssmcp Monitor", lifespan=lifespan)
+# JSON endpoints are serialized by orjson rather than the stdlib json module
+app = FastAPI(title="ssmcp Monitor", lifespan=lifespan, default_response_class=ORJSONResponse)
 templates = Jinja2Templates(directory="src/ssmcp_ui/templates")
 
-# Pattern to validate Redis key format: prefix:timestamp:unique_id
-KEY_PATTERN = re.compile(rf"^{re.escape(settings.redis_key_prefix)}:\d+:[a-f0-9]+$")
+# Prefix every logged request key starts with: prefix:timestamp_ns:sequence
+KEY_PREFIX = settings.redis_key_prefix
+
+
+def is_valid_key(key: str) -> bool:
+    """Check that a string has the prefix:timestamp_ns:sequence request key format.
+
+    Plain string checks are used instead of a regex, as this runs on every detail view.
+
+    Args:
+        key: Candidate Redis key.
+
+    Returns:
+        True if the key is a request key, False otherwise.
+
+    """
+    head, _, sequence = key.rpartition(":")
+    prefix, _, timestamp = head.rpartition(":")
+    return prefix == KEY_PREFIX and key.isascii() and timestamp.isdigit() and sequence.isdigit()
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _format_seconds(ts: int) -> str:
+    """Format a Unix timestamp in seconds as local date and time."""
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
 
 
 def format_timestamp(key: str) -> str:
     """Extract and format timestamp from Redis key.
 
-    Key format: prefix:timestamp:unique_id
+    Key format: prefix:timestamp_ns:sequence
     """
     try:
         parts = key.split(":")
-        ts = int(parts[1])  # Second part is the timestamp
-        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+        ts = int(parts[1]) // 1_000_000_000  # Second part is the timestamp in nanoseconds
+        return _format_seconds(ts)
     except (ValueError, IndexError):
         return "Unknown"
 
 
+def iter_requests(keys: list[str], rows: list[Any]) -> Iterator[dict[str, str]]:
+    """Yield the index rows for stored requests, skipping missing or unreadable entries.
+
+    Rows are built while the template renders, so no intermediate list is kept.
+
+    Args:
+        keys: Redis keys of the requests.
+        rows: HMGET reply of tool name and params for each key, or the error Redis
+            returned for it.
+
+    Yields:
+        Row with the request id, timestamp, tool name and compact JSON params.
+
+    """
+    for key, row in zip(keys, rows, strict=True):
+        # Expired entries come back as all-None fields; errors are kept as exceptions
+        if isinstance(row, Exception) or row[1] is None:
+            continue
+        tool, params = row
+        yield {
+            "id": key,
+            "timestamp": format_timestamp(key),
+            "tool": tool or "Unknown",
+            # Stored as compact JSON and indented by the browser
+            "params": params,
+        }
+
+
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request) -> HTMLResponse:
-    """List all requests stored in Redis."""
+async def index(
+    page: Annotated[int, Query(ge=0)] = 0,
+    size: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> HTMLResponse:
+    """List one page of the requests stored in Redis, newest first.
+
+    Args:
+        page: Zero-based page number.
+        size: Number of requests per page.
+
+    Returns:
+        HTML response with the request list.
+
+    """
     state: UIState = app.state.ui_state
     redis_client = state.redis_client
 
     if not redis_client:
-        return templates.TemplateResponse(
-            "error.html",
-            {"request": request, "message": "Redis not configured"},
-        )
-
-    # Use SCAN instead of KEYS for production safety
-    pattern = f"{settings.redis_key_prefix}:*"
-    keys: list[bytes] = []
-    cursor = 0
-    while True:
-        cursor, batch = await redis_client.scan(cursor, match=pattern, count=100)
-        keys.extend(batch)
-        if cursor == 0:
-            break
-
-    # Sort keys by timestamp (descending)
-    keys.sort(reverse=True)
-
-    # Use mget for batch fetching to reduce Redis round trips
-    requests = []
+        return state.render("error.html", message="Redis not configured")
+
+    # The middleware indexes keys in a sorted set, so only the requested page is read.
+    # One extra key is fetched to tell whether a next page exists.
+    start = page * size
+    keys: list[str] = await redis_client.zrevrange(settings.redis_index_key, start, start + size)
+    has_next = len(keys) > size
+    keys = keys[:size]
+    if not keys and page == 0:
+        return HTMLResponse(state.empty_index)
+
+    # Only the fields shown in the list are read; responses stay in Redis.
+    # Errors, e.g. for a key of another type, are returned per key instead of raised.
+    rows: list[Any] = []
     if keys:
-        values = await redis_client.mget(keys)
-        for key, data_raw in zip(keys, values, strict=True):
-            if data_raw:
-                key_str = key.decode("utf-8")
-                try:
-                    data = json.loads(data_raw)
-                    requests.append({
-                        "id": key_str,
-                        "timestamp": format_timestamp(key_str),
-                        "tool": data.get("tool", "Unknown"),
-                        "params": json.dumps(data.get("params", {}), indent=2),
-                    })
-                except json.JSONDecodeError:
-                    # Skip corrupted data
-                    continue
-
-    return templates.TemplateResponse(
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hmget(key, ["tool", "params"])
+            rows = await pipe.execute(raise_on_error=False)
+
+    return state.render(
         "index.html",
-        {"request": request, "requests": requests},
+        requests=iter_requests(keys, rows),
+        page=page,
+        size=size,
+        has_next=has_next,
     )
 
 
 @app.get("/request/{request_id:path}", response_class=HTMLResponse)
-async def request_detail(request: Request, request_id: str) -> HTMLResponse:
+async def request_detail(request_id: str) -> HTMLResponse:
     """Show details for a specific request.
 
     Args:
-        request: FastAPI request object
         request_id: Redis key to lookup (validated against expected pattern)
 
     Returns:
@@ -135,27 +247,29 @@ async def request_detail(request: Request, request_id: str) -> HTMLResponse:
     if not redis_client:
         raise HTTPException(status_code=500, detail="Redis not configured")
 
-    # Security: Validate request_id matches expected pattern (prevent path traversal)
-    if not KEY_PATTERN.match(request_id):
+    # Security: Validate request_id matches expected format (prevent path traversal)
+    if not is_valid_key(request_id):
         raise HTTPException(status_code=400, detail="Invalid request ID format")
 
-    data_raw = await redis_client.get(request_id)
-    if not data_raw:
+    try:
+        # redis-py types hash replies for both its sync and async clients
+        data = await cast("Awaitable[dict[str, str]]", redis_client.hgetall(request_id))
+    except ResponseError:
+        # Entries logged before the switch to hashes are strings; the list skips them too
+        data = {}
+    if not data:
         raise HTTPException(status_code=404, detail="Request not found")
 
     try:
-        data = json.loads(data_raw)
-    except json.JSONDecodeError as e:
+        params = orjson.loads(data.get("params", "{}"))
+    except orjson.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail="Corrupted data in Redis") from e
 
-    return templates.TemplateResponse(
+    return state.render(
         "detail.html",
-        {
-            "request": request,
-            "id": request_id,
-            "timestamp": format_timestamp(request_id),
-            "tool": data.get("tool", "Unknown"),
-            "params": json.dumps(data.get("params", {}), indent=2),
-            "response": data.get("response", ""),
-        },
+        id=request_id,
+        timestamp=format_timestamp(request_id),
+        tool=data.get("tool", "Unknown"),
+        params=orjson.dumps(params, option=orjson.OPT_INDENT_2).decode(),
+        response=data.get("response", ""),
     )
@@ -7,9 +7,9 @@ These tests require:
 Run: make test
 """
 
-import json
 from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 from fastmcp.server.middleware import MiddlewareContext
 from redis.asyncio import Redis
@@ -47,23 +47,29 @@ async def test_redis_logging_integration() -> None:
 
     await middleware.on_call_tool(context, call_next)
 
+    # Flush queued entries to Redis
+    await middleware.shutdown()
+
     # Verify data in Redis
+    # The index sorted set shares the prefix, so it is not an entry
+    index_key = settings.redis_index_key.encode()
     new_keys = await redis_client.keys(f"{settings.redis_key_prefix}:*")
-    added_keys = set(new_keys) - set(initial_keys)
+    added_keys = set(new_keys) - set(initial_keys) - {index_key}
 
     assert len(added_keys) >= 1
 
     # Check the content of one of the new keys
     key = next(iter(added_keys))
-    data_json = await redis_client.get(key)
-    assert data_json is not None
+    assert await redis_client.zscore(index_key, key) is not None
+    data = await redis_client.hgetall(key)
+    assert data
 
-    data = json.loads(data_json)
-    assert data["tool"] == "integration_test_tool"
-    assert data["params"] == {"q": "integration-test"}
-    assert data["response"] == "integration-test-response"
+    assert data[b"tool"] == b"integration_test_tool"
+    assert orjson.loads(data[b"params"]) == {"q": "integration-test"}
+    assert data[b"response"] == b"integration-test-response"
 
     # Cleanup
     for k in added_keys:
         await redis_client.delete(k)
+    await redis_client.zrem(index_key, *added_keys)
     await redis_client.aclose()
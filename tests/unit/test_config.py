@@ -1,12 +1,14 @@
 """Unit tests for configuration."""
 
 import os
+from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
 
-from ssmcp.config import Settings
+from ssmcp.config import Settings, get_settings
 
 # Test constants
 DEFAULT_MAX_RESULTS = 5
@@ -16,15 +18,18 @@ ZERO_VALUE = 0
 TEST_PORT = 8000
 
 
+@pytest.fixture(scope="module")
+def base_settings() -> Settings:
+    """Build one Settings instance shared by tests that don't exercise validation."""
+    return Settings(searxng_search_url="http://test.com")
+
+
 class TestSettings:
     """Test application settings."""
 
     def test_settings_default_values(self) -> None:
         """Test that default values are correctly set."""
-        with (
-            patch.dict(os.environ, {"SEARXNG_SEARCH_URL": "http://test.com"}, clear=True),
-            patch("pydantic_settings.sources.DotEnvSettingsSource.__call__", return_value={}),
-        ):
+        with patch.dict(os.environ, {"SEARXNG_SEARCH_URL": "http://test.com"}, clear=True):
             settings = Settings(searxng_search_url="http://test.com")
             assert settings.searxng_search_url == "http://test.com"
             assert settings.ssmcp_debug is False  # Default should be False
@@ -45,47 +50,29 @@ class TestSettings:
 
     def test_required_fields(self) -> None:
         """Test that missing required fields raise ValidationError."""
-        with (
-            patch.dict(os.environ, {}, clear=True),
-            patch("pydantic_settings.sources.DotEnvSettingsSource.__call__", return_value={}),
-            pytest.raises(ValidationError),
-        ):
-            # We must also ensure .env is not found or ignored
+        # Settings never reads .env itself (env_file=None), so clearing the environment is enough
+        with patch.dict(os.environ, {}, clear=True), pytest.raises(ValidationError):
             # Settings requires searxng_search_url which is not provided
             Settings() # type: ignore[call-arg]
 
-    def test_oauth_validation_missing_jwks_url(self) -> None:
-        """Test that OAuth validation fails when jwks_url is missing."""
-        with pytest.raises(ValueError, match="OAUTH_JWKS_URL must be set"):
-            Settings(
-                searxng_search_url="http://test.com",
-                oauth_enabled=True,
-                oauth_jwks_url="",
-                oauth_client_id="test-client",
-                oauth_issuer="https://auth.com",
-            )
-
-    def test_oauth_validation_missing_client_id(self) -> None:
-        """Test that OAuth validation fails when client_id is missing."""
-        with pytest.raises(ValueError, match="OAUTH_CLIENT_ID must be set"):
-            Settings(
-                searxng_search_url="http://test.com",
-                oauth_enabled=True,
-                oauth_jwks_url="https://auth.com/jwks",
-                oauth_client_id="",
-                oauth_issuer="https://auth.com",
-            )
-
-    def test_oauth_validation_missing_issuer(self) -> None:
-        """Test that OAuth validation fails when issuer is missing."""
-        with pytest.raises(ValueError, match="OAUTH_ISSUER must be set"):
-            Settings(
-                searxng_search_url="http://test.com",
-                oauth_enabled=True,
-                oauth_jwks_url="https://auth.com/jwks",
-                oauth_client_id="test-client",
-                oauth_issuer="",
-            )
+    @pytest.mark.parametrize(
+        ("field", "message"),
+        [
+            ("oauth_jwks_url", "OAUTH_JWKS_URL must be set"),
+            ("oauth_client_id", "OAUTH_CLIENT_ID must be set"),
+            ("oauth_issuer", "OAUTH_ISSUER must be set"),
+        ],
+    )
+    def test_oauth_validation_missing_field(self, field: str, message: str) -> None:
+        """Test that OAuth validation fails when a required field is missing."""
+        oauth_fields: dict[str, Any] = {
+            "oauth_jwks_url": "https://auth.com/jwks",
+            "oauth_client_id": "test-client",
+            "oauth_issuer": "https://auth.com",
+        }
+        oauth_fields[field] = ""
+        with pytest.raises(ValueError, match=message):
+            Settings(searxng_search_url="http://test.com", oauth_enabled=True, **oauth_fields)
 
     def test_oauth_disabled_allows_empty_fields(self) -> None:
         """Test that OAuth validation passes when OAuth is disabled, even with empty fields."""
@@ -153,3 +140,36 @@ class TestSettings:
         )
         assert settings.redis_url == ""
         assert settings.oauth_jwks_url == ""
+
+    def test_settings_are_frozen(self, base_settings: Settings) -> None:
+        """Test that settings cannot be modified after validation."""
+        with pytest.raises(ValidationError):
+            base_settings.searxng_max_results = CUSTOM_MAX_RESULTS
+
+    def test_redis_index_key_uses_prefix(self, base_settings: Settings) -> None:
+        """Test that the request index key is derived from the key prefix."""
+        settings = base_settings.model_copy(update={"redis_key_prefix": "custom"})
+        assert settings.redis_index_key == "custom:index"
+
+
+class TestGetSettings:
+    """Test the cached settings factory."""
+
+    def test_loads_env_file_without_overriding_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that .env values fill in missing variables but never override them."""
+        (tmp_path / ".env").write_text(
+            "SEARXNG_SEARCH_URL=http://dotenv.com\nSEARXNG_MAX_RESULTS=10\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        get_settings.cache_clear()
+        try:
+            with patch.dict(os.environ, {"SEARXNG_SEARCH_URL": "http://env.com"}, clear=True):
+                settings = get_settings()
+        finally:
+            get_settings.cache_clear()
+
+        assert settings.searxng_search_url == "http://env.com"
+        assert settings.searxng_max_results == CUSTOM_MAX_RESULTS
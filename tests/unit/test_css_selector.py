@@ -1,14 +1,34 @@
 """Unit tests for CSS selector filter functionality."""
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
-from bs4 import BeautifulSoup
 
+from ssmcp.parser.dom import parse_html, to_html
 from ssmcp.parser.filters.css_selector import CssSelectorFilter
+from ssmcp.parser.protocols import ContentFilter
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
 
-@pytest.fixture
+
+@lru_cache
+def parse_sample(html: str) -> "HtmlElement":
+    """Parse a sample document once; the selector filter only reads the tree, so tests share it."""
+    tree = parse_html(html)
+    assert tree is not None
+    return tree
+
+
+def apply_filter(content_filter: ContentFilter, html: str) -> str | None:
+    """Parse HTML, run the filter on the tree and serialize the result."""
+    result = content_filter.apply(parse_sample(html))
+    return None if result is None else to_html(result)
+
+
+@pytest.fixture(scope="class")
 def mock_settings() -> MagicMock:
     """Create mock settings for testing."""
     settings = MagicMock()
@@ -20,134 +40,126 @@ def mock_settings() -> MagicMock:
     return settings
 
 
-@pytest.fixture
-def stackoverflow_like_html() -> str:
-    """HTML similar to Stack Overflow with #content div."""
-    return """
-    <html>
-    <head><title>Test Page</title></head>
-    <body>
-        <header>
-            <nav>Navigation Menu</nav>
-        </header>
-        <div id="content" class="snippet-hidden">
-            <div class="question">
-                <h1>How to fix RVM is not a function error?</h1>
-                <p>I'm trying to use RVM but getting an error that says "RVM is not a function".
-                   This happens when I try to run rvm use 2.0.0. The error message tells me that
-                   selecting rubies with rvm use will not work. I've installed RVM using the
-                   official installation script but still facing this issue. How can I resolve this?
-                   I need to switch between different Ruby versions for my projects.</p>
-                <div class="answer">
-                    <p>The issue occurs because RVM needs to be loaded as a shell function, not just
-                       a regular command. You need to add the RVM loading script to your shell
-                       configuration file. For bash, add this line to your ~/.bashrc or
-                       ~/.bash_profile: source "$HOME/.rvm/scripts/rvm". After adding this, restart
-                       your terminal or source the file again. This will properly load RVM as a
-                       function and allow you to use commands like rvm use to switch Ruby
-                       versions.</p>
-                </div>
+# HTML similar to Stack Overflow with #content div
+STACKOVERFLOW_LIKE_HTML = """
+<html>
+<head><title>Test Page</title></head>
+<body>
+    <header>
+        <nav>Navigation Menu</nav>
+    </header>
+    <div id="content" class="snippet-hidden">
+        <div class="question">
+            <h1>How to fix RVM is not a function error?</h1>
+            <p>I'm trying to use RVM but getting an error that says "RVM is not a function".
+               This happens when I try to run rvm use 2.0.0. The error message tells me that
+               selecting rubies with rvm use will not work. I've installed RVM using the
+               official installation script but still facing this issue. How can I resolve this?
+               I need to switch between different Ruby versions for my projects.</p>
+            <div class="answer">
+                <p>The issue occurs because RVM needs to be loaded as a shell function, not just
+                   a regular command. You need to add the RVM loading script to your shell
+                   configuration file. For bash, add this line to your ~/.bashrc or
+                   ~/.bash_profile: source "$HOME/.rvm/scripts/rvm". After adding this, restart
+                   your terminal or source the file again. This will properly load RVM as a
+                   function and allow you to use commands like rvm use to switch Ruby
+                   versions.</p>
             </div>
         </div>
-        <footer>Copyright 2024</footer>
-    </body>
-    </html>
-    """
-
-
-@pytest.fixture
-def article_tag_html() -> str:
-    """HTML with semantic article tag."""
-    return """
-    <html>
-    <body>
-        <nav>Site Navigation</nav>
-        <article>
-            <h1>Understanding Python Decorators</h1>
-            <p>Python decorators are a powerful feature that allows you to modify the behavior
-               of functions or classes. They are commonly used for logging, authentication,
-               caching, and more. A decorator is essentially a function that takes another
-               function as an argument and returns a new function. This pattern provides a
-               clean and reusable way to extend functionality without modifying the original
-               code. Decorators use the @ symbol for a cleaner syntax.</p>
-            <p>For example, you can create a simple timing decorator that measures how long
-               a function takes to execute. This is useful for performance optimization and
-               identifying bottlenecks in your code. The decorator wraps the original function
-               and adds timing logic before and after execution.</p>
-        </article>
-        <aside>Related articles</aside>
-    </body>
-    </html>
-    """
-
-
-@pytest.fixture
-def role_main_html() -> str:
-    """HTML with role="main" attribute."""
-    return """
-    <html>
-    <body>
-        <header>Header content</header>
-        <div role="main">
-            <h1>Machine Learning Basics</h1>
-            <p>Machine learning is a subset of artificial intelligence that focuses on building
-               systems that can learn from data. Instead of being explicitly programmed, these
-               systems improve their performance through experience. There are three main types
-               of machine learning: supervised learning, unsupervised learning, and reinforcement
-               learning. Each type has different use cases and approaches.</p>
-            <p>Supervised learning involves training a model on labeled data, where the correct
-               answers are already known. This is used for tasks like classification and regression.
-               Unsupervised learning finds patterns in unlabeled data, useful for clustering and
-               dimensionality reduction. Reinforcement learning trains agents through rewards and
-               penalties, commonly used in robotics and game playing.</p>
+    </div>
+    <footer>Copyright 2024</footer>
+</body>
+</html>
+"""
+
+
+# HTML with semantic article tag
+ARTICLE_TAG_HTML = """
+<html>
+<body>
+    <nav>Site Navigation</nav>
+    <article>
+        <h1>Understanding Python Decorators</h1>
+        <p>Python decorators are a powerful feature that allows you to modify the behavior
+           of functions or classes. They are commonly used for logging, authentication,
+           caching, and more. A decorator is essentially a function that takes another
+           function as an argument and returns a new function. This pattern provides a
+           clean and reusable way to extend functionality without modifying the original
+           code. Decorators use the @ symbol for a cleaner syntax.</p>
+        <p>For example, you can create a simple timing decorator that measures how long
+           a function takes to execute. This is useful for performance optimization and
+           identifying bottlenecks in your code. The decorator wraps the original function
+           and adds timing logic before and after execution.</p>
+    </article>
+    <aside>Related articles</aside>
+</body>
+</html>
+"""
+
+
+# HTML with role="main" attribute
+ROLE_MAIN_HTML = """
+<html>
+<body>
+    <header>Header content</header>
+    <div role="main">
+        <h1>Machine Learning Basics</h1>
+        <p>Machine learning is a subset of artificial intelligence that focuses on building
+           systems that can learn from data. Instead of being explicitly programmed, these
+           systems improve their performance through experience. There are three main types
+           of machine learning: supervised learning, unsupervised learning, and reinforcement
+           learning. Each type has different use cases and approaches.</p>
+        <p>Supervised learning involves training a model on labeled data, where the correct
+           answers are already known. This is used for tasks like classification and regression.
+           Unsupervised learning finds patterns in unlabeled data, useful for clustering and
+           dimensionality reduction. Reinforcement learning trains agents through rewards and
+           penalties, commonly used in robotics and game playing.</p>
+    </div>
+    <footer>Footer content</footer>
+</body>
+</html>
+"""
+
+
+# HTML where none of the priority selectors match
+NO_SELECTOR_MATCH_HTML = """
+<html>
+<body>
+    <div class="page-wrapper">
+        <div class="some-container">
+            <h1>Short Content</h1>
+            <p>This page has minimal content that doesn't match any priority selectors.</p>
         </div>
-        <footer>Footer content</footer>
-    </body>
-    </html>
-    """
-
-
-@pytest.fixture
-def no_selector_match_html() -> str:
-    """HTML where none of the priority selectors match."""
-    return """
-    <html>
-    <body>
-        <div class="page-wrapper">
-            <div class="some-container">
-                <h1>Short Content</h1>
-                <p>This page has minimal content that doesn't match any priority selectors.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-
-
-@pytest.fixture
-def low_word_count_html() -> str:
-    """HTML where selector matches but word count is too low."""
-    return """
-    <html>
-    <body>
-        <div id="content">
-            <h1>Title</h1>
-            <p>Very short content here.</p>
-        </div>
-    </body>
-    </html>
-    """
+    </div>
+</body>
+</html>
+"""
+
+
+# HTML where selector matches but word count is too low
+LOW_WORD_COUNT_HTML = """
+<html>
+<body>
+    <div id="content">
+        <h1>Title</h1>
+        <p>Very short content here.</p>
+    </div>
+</body>
+</html>
+"""
 
 
 class TestCssSelectorFilter:
     """Test suite for CSS selector filter."""
 
-    def test_finds_content_id_selector(
-        self, mock_settings: MagicMock, stackoverflow_like_html: str
-    ) -> None:
+    @pytest.fixture(scope="class")
+    def filter_instance(self, mock_settings: MagicMock) -> CssSelectorFilter:
+        """Create one filter shared by the tests that use the default settings."""
+        return CssSelectorFilter(mock_settings)
+
+    def test_finds_content_id_selector(self, filter_instance: CssSelectorFilter) -> None:
         """Test that #content selector is found and extracted."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(stackoverflow_like_html)
+        result = apply_filter(filter_instance, STACKOVERFLOW_LIKE_HTML)
 
         assert result is not None
         assert 'id="content"' in result
@@ -155,10 +167,9 @@ class TestCssSelectorFilter:
         assert 'Navigation Menu' not in result  # Header should be excluded
         assert 'Copyright 2024' not in result  # Footer should be excluded
 
-    def test_finds_article_tag(self, mock_settings: MagicMock, article_tag_html: str) -> None:
+    def test_finds_article_tag(self, filter_instance: CssSelectorFilter) -> None:
         """Test that article tag is found (higher priority than #content)."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(article_tag_html)
+        result = apply_filter(filter_instance, ARTICLE_TAG_HTML)
 
         assert result is not None
         assert '<article>' in result or '<article' in result
@@ -166,10 +177,9 @@ class TestCssSelectorFilter:
         assert 'Site Navigation' not in result
         assert 'Related articles' not in result
 
-    def test_finds_role_main(self, mock_settings: MagicMock, role_main_html: str) -> None:
+    def test_finds_role_main(self, filter_instance: CssSelectorFilter) -> None:
         """Test that role="main" is found."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(role_main_html)
+        result = apply_filter(filter_instance, ROLE_MAIN_HTML)
 
         assert result is not None
         assert 'role="main"' in result
@@ -177,38 +187,32 @@ class TestCssSelectorFilter:
         assert 'Header content' not in result
         assert 'Footer content' not in result
 
-    def test_no_selector_match_returns_none(
-        self, mock_settings: MagicMock, no_selector_match_html: str
-    ) -> None:
+    def test_no_selector_match_returns_none(self, filter_instance: CssSelectorFilter) -> None:
         """Test that None is returned when no selector matches."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(no_selector_match_html)
+        result = apply_filter(filter_instance, NO_SELECTOR_MATCH_HTML)
         assert result is None
 
-    def test_low_word_count_returns_none(
-        self, mock_settings: MagicMock, low_word_count_html: str
-    ) -> None:
+    def test_low_word_count_returns_none(self, filter_instance: CssSelectorFilter) -> None:
         """Test that None is returned when word count is insufficient."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(low_word_count_html)
+        result = apply_filter(filter_instance, LOW_WORD_COUNT_HTML)
         assert result is None
 
     def test_word_count_threshold_respected(
-        self, mock_settings: MagicMock, stackoverflow_like_html: str
+        self, mock_settings: MagicMock, filter_instance: CssSelectorFilter
     ) -> None:
         """Test that word count threshold is properly checked."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(stackoverflow_like_html)
+        result = apply_filter(filter_instance, STACKOVERFLOW_LIKE_HTML)
 
         # Extract the text and verify word count
         assert result is not None
-        soup = BeautifulSoup(result, 'html.parser')
-        text = soup.get_text(strip=True)
+        tree = parse_html(result)
+        assert tree is not None
+        text = tree.text_content()
         word_count = len(text.split())
 
         assert word_count >= mock_settings.css_selector_min_words
 
-    def test_selector_priority_order(self, mock_settings: MagicMock) -> None:
+    def test_selector_priority_order(self, filter_instance: CssSelectorFilter) -> None:
         """Test that selectors are tried in priority order."""
         # HTML with both article and #content
         html_with_both = """
@@ -224,8 +228,7 @@ class TestCssSelectorFilter:
         </html>
         """
 
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(html_with_both)
+        result = apply_filter(filter_instance, html_with_both)
 
         # Should match article first (higher priority)
         assert result is not None
@@ -233,16 +236,14 @@ class TestCssSelectorFilter:
         assert 'word word word' in result  # From article
         assert 'different' not in result  # #content should not be selected
 
-    def test_empty_html_returns_none(self, mock_settings: MagicMock) -> None:
+    def test_empty_html_returns_none(self, filter_instance: CssSelectorFilter) -> None:
         """Test that None is returned for empty HTML."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply("")
+        result = apply_filter(filter_instance, "<html><body></body></html>")
         assert result is None
 
-    def test_parse_selector_list(self, mock_settings: MagicMock) -> None:
+    def test_selector_list_parsed_on_init(self, filter_instance: CssSelectorFilter) -> None:
         """Test that selector list is correctly parsed from settings."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        selectors = filter_instance._parse_selector_list()
+        selectors = [selector.css for selector in filter_instance._selectors]
 
         expected_selector_count = 8  # Expected number of selectors in the priority list
         assert 'article' in selectors
@@ -251,7 +252,21 @@ class TestCssSelectorFilter:
         assert '#content' in selectors
         assert len(selectors) == expected_selector_count
 
-    def test_custom_min_words_threshold(self, stackoverflow_like_html: str) -> None:
+    def test_exact_min_words_threshold_matches(self) -> None:
+        """Test that an element with exactly the minimum word count is selected."""
+        min_words = 5
+        custom_settings = MagicMock()
+        custom_settings.css_selector_priority_list = '#content'
+        custom_settings.css_selector_min_words = min_words
+        filter_instance = CssSelectorFilter(custom_settings)
+
+        words = " ".join(["word"] * min_words)
+        assert apply_filter(filter_instance, f'<div id="content">{words}</div>') is not None
+
+        fewer_words = " ".join(["word"] * (min_words - 1))
+        assert apply_filter(filter_instance, f'<div id="content">{fewer_words}</div>') is None
+
+    def test_custom_min_words_threshold(self) -> None:
         """Test with custom minimum word threshold returns None when threshold not met."""
         custom_threshold = 200  # Very high threshold for testing
         custom_settings = MagicMock()
@@ -259,25 +274,23 @@ class TestCssSelectorFilter:
         custom_settings.css_selector_min_words = custom_threshold
 
         filter_instance = CssSelectorFilter(custom_settings)
-        result = filter_instance.apply(stackoverflow_like_html)
+        result = apply_filter(filter_instance, STACKOVERFLOW_LIKE_HTML)
         assert result is None
 
-    def test_preserves_html_structure(
-        self, mock_settings: MagicMock, stackoverflow_like_html: str
-    ) -> None:
+    def test_preserves_html_structure(self, filter_instance: CssSelectorFilter) -> None:
         """Test that the matched HTML preserves its internal structure."""
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(stackoverflow_like_html)
+        result = apply_filter(filter_instance, STACKOVERFLOW_LIKE_HTML)
 
         assert result is not None
-        soup = BeautifulSoup(result, 'html.parser')
+        tree = parse_html(result)
+        assert tree is not None
 
         # Should preserve nested structure
-        assert soup.find('h1') is not None
-        assert soup.find('div', class_='question') is not None
-        assert soup.find('div', class_='answer') is not None
+        assert tree.find('.//h1') is not None
+        assert tree.find(".//div[@class='question']") is not None
+        assert tree.find(".//div[@class='answer']") is not None
 
-    def test_multiple_classes_on_content_div(self, mock_settings: MagicMock) -> None:
+    def test_multiple_classes_on_content_div(self, filter_instance: CssSelectorFilter) -> None:
         """Test that #content is found even with multiple classes."""
         html = """
         <html>
@@ -289,8 +302,7 @@ class TestCssSelectorFilter:
         </html>
         """
 
-        filter_instance = CssSelectorFilter(mock_settings)
-        result = filter_instance.apply(html)
+        result = apply_filter(filter_instance, html)
 
         assert result is not None
         assert 'id="content"' in result
@@ -0,0 +1,55 @@
+"""Unit tests for HTML parsing helpers."""
+
+from ssmcp.parser.dom import parse_html, to_html
+
+
+class TestParseHtml:
+    """Test parse_html function."""
+
+    def test_parses_document(self) -> None:
+        """Test that a full document is parsed into its root element."""
+        tree = parse_html("<html><body><p>Some text</p></body></html>")
+
+        assert tree is not None
+        assert tree.tag == "html"
+        assert tree.text_content() == "Some text"
+
+    def test_wraps_fragment(self) -> None:
+        """Test that a fragment is wrapped into html and body."""
+        tree = parse_html("<article><p>Some text</p></article>")
+
+        assert tree is not None
+        assert tree.find("body/article") is not None
+
+    def test_empty_document_returns_none(self) -> None:
+        """Test that empty or whitespace-only input returns None."""
+        assert parse_html("") is None
+        assert parse_html("   \n ") is None
+
+    def test_strips_scripts_and_styles(self) -> None:
+        """Test that script and style elements are dropped but trailing text is kept."""
+        tree = parse_html(
+            "<p>Before<script>var x = 1;</script> middle<style>p {}</style> after</p>"
+        )
+
+        assert tree is not None
+        assert tree.text_content() == "Before middle after"
+
+    def test_ignores_encoding_declaration(self) -> None:
+        """Test that an XML encoding declaration in the markup is accepted."""
+        tree = parse_html('<?xml version="1.0" encoding="ISO-8859-1"?><p>Café text</p>')
+
+        assert tree is not None
+        assert tree.text_content() == "Café text"
+
+
+class TestToHtml:
+    """Test to_html function."""
+
+    def test_excludes_tail_text(self) -> None:
+        """Test that text following the element is not serialized."""
+        tree = parse_html("<div><p>Inside</p>Outside</div>")
+
+        assert tree is not None
+        paragraph = tree.find(".//p")
+        assert to_html(paragraph) == "<p>Inside</p>"
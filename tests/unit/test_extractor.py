@@ -4,10 +4,11 @@ import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from ssmcp.exceptions import Crawl4AIError, ExtractorError
-from ssmcp.parser.extractor import ExtractionResult, Extractor
+from ssmcp.parser.extractor import MAX_USES_PER_SESSION, ExtractionResult, Extractor
 
 
 @pytest.fixture
@@ -51,7 +52,7 @@ class TestExtractor:
             assert mock_crawler_class.call_count == pool_size
             assert mock_crawler.start.call_count == pool_size
             assert len(extractor._crawlers) == pool_size
-            assert extractor._crawler_queue.qsize() == pool_size
+            assert len(extractor._free_crawlers) == pool_size
 
     @pytest.mark.asyncio
     async def test_close_cleans_up_browser_pool(
@@ -69,8 +70,21 @@ class TestExtractor:
 
             pool_size = mock_settings.crawl4ai_browser_pool_size
             assert mock_crawler.close.call_count == pool_size
+
             assert len(extractor._crawlers) == 0
-            assert extractor._crawler_queue.qsize() == 0
+            assert len(extractor._free_crawlers) == 0
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_http_client_open(self, mock_settings: MagicMock) -> None:
+        """Test that a shared HTTP client is left for its owner to close."""
+        http_client = AsyncMock()
+        extractor = Extractor(mock_settings, http_client)
+
+        with patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=AsyncMock()):
+            await extractor.start()
+            await extractor.close()
+
+        http_client.aclose.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_extract_html_url_mode(self, mock_settings: MagicMock) -> None:
@@ -100,6 +114,7 @@ class TestExtractor:
             mock_crawler.arun.assert_called_once()
             call_kwargs = mock_crawler.arun.call_args
             assert call_kwargs.kwargs["url"] == "https://example.com"
+            assert call_kwargs.kwargs["config"].session_id.startswith("pool-")
 
     @pytest.mark.asyncio
     async def test_extract_html_raw_mode(self, mock_settings: MagicMock) -> None:
@@ -130,6 +145,7 @@ class TestExtractor:
             call_kwargs = mock_crawler.arun.call_args
             assert call_kwargs.kwargs["url"] == f"raw:{html_input}"
             assert not call_kwargs.kwargs["url"].startswith(("http://", "https://"))
+            assert call_kwargs.kwargs["config"] is extractor._crawler_config
 
     @pytest.mark.asyncio
     async def test_extract_html_returns_cleaned_html(
@@ -199,7 +215,7 @@ class TestExtractor:
     async def test_browser_pool_queue_management(
         self, mock_settings: MagicMock
     ) -> None:
-        """Test that crawlers are properly returned to the queue."""
+        """Test that crawlers are properly returned to the pool."""
         mock_settings.crawl4ai_browser_pool_size = 1
         extractor = Extractor(mock_settings)
 
@@ -214,20 +230,20 @@ class TestExtractor:
 
             await extractor.start()
 
-            # Queue should have 1 crawler
-            assert extractor._crawler_queue.qsize() == 1
+            # Pool should have 1 free crawler
+            assert len(extractor._free_crawlers) == 1
 
             # Extract HTML (should take and return crawler)
             await extractor.extract_html("https://example.com")
 
-            # Queue should still have 1 crawler
-            assert extractor._crawler_queue.qsize() == 1
+            # Pool should still have 1 free crawler
+            assert len(extractor._free_crawlers) == 1
 
     @pytest.mark.asyncio
     async def test_crawler_returned_even_on_error(
         self, mock_settings: MagicMock
     ) -> None:
-        """Test that crawler is returned to queue even when extraction fails."""
+        """Test that crawler is returned to the pool even when extraction fails."""
         mock_settings.crawl4ai_browser_pool_size = 1
         extractor = Extractor(mock_settings)
 
@@ -241,13 +257,13 @@ class TestExtractor:
 
             await extractor.start()
 
-            assert extractor._crawler_queue.qsize() == 1
+            assert len(extractor._free_crawlers) == 1
 
             with pytest.raises(Crawl4AIError):
                 await extractor.extract_html("https://example.com")
 
-            # Crawler should still be returned to queue
-            assert extractor._crawler_queue.qsize() == 1
+            # Crawler should still be returned to the pool
+            assert len(extractor._free_crawlers) == 1
 
     @pytest.mark.asyncio
     async def test_crawler_config_uses_settings(
@@ -370,5 +386,194 @@ class TestExtractor:
                 "URLs should be processed in parallel using the browser pool."
             )
 
-            # Verify all crawlers are back in the queue
-            assert extractor._crawler_queue.qsize() == pool_size
+            # Verify all crawlers are back in the pool
+            assert len(extractor._free_crawlers) == pool_size
+
+
+class TestExtractorSessions:
+    """Test reuse and recycling of pooled browser sessions."""
+
+    @pytest.fixture
+    def mock_crawler(self) -> AsyncMock:
+        """Create a mock crawler returning a page without HTTP validators."""
+        mock_crawler = AsyncMock()
+        mock_crawler.crawler_strategy = MagicMock()
+        mock_crawler.crawler_strategy.browser_manager.kill_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.html = "<html>content</html>"
+        mock_result.cleaned_html = "<body>content</body>"
+        mock_result.response_headers = {}
+        mock_crawler.arun.return_value = mock_result
+        return mock_crawler
+
+    async def test_each_crawler_gets_own_session(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that every pooled crawler navigates through a distinct session."""
+        extractor = Extractor(mock_settings)
+
+        with patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler):
+            await extractor.start()
+
+        session_ids = {pooled.config.session_id for pooled in extractor._free_crawlers}
+        assert session_ids == {"pool-0", "pool-1"}
+        assert extractor._crawler_config.session_id is None
+
+    async def test_session_recycled_after_max_uses(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that a session is closed once it served MAX_USES_PER_SESSION pages."""
+        mock_settings.crawl4ai_browser_pool_size = 1
+        extractor = Extractor(mock_settings)
+        kill_session = mock_crawler.crawler_strategy.browser_manager.kill_session
+
+        with patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler):
+            await extractor.start()
+
+            for _ in range(MAX_USES_PER_SESSION - 1):
+                await extractor.extract_html("https://example.com")
+            kill_session.assert_not_called()
+
+            await extractor.extract_html("https://example.com")
+
+        kill_session.assert_awaited_once_with("pool-0")
+        assert extractor._free_crawlers[0].uses == 0
+
+    async def test_session_recycled_after_failure(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that a failed navigation closes the session but keeps the crawler."""
+        mock_settings.crawl4ai_browser_pool_size = 1
+        mock_crawler.arun.side_effect = RuntimeError("Page crashed")
+        extractor = Extractor(mock_settings)
+        kill_session = mock_crawler.crawler_strategy.browser_manager.kill_session
+
+        with patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler):
+            await extractor.start()
+
+            with pytest.raises(RuntimeError):
+                await extractor.extract_html("https://example.com")
+
+        kill_session.assert_awaited_once_with("pool-0")
+        assert len(extractor._free_crawlers) == 1
+
+    async def test_raw_html_does_not_use_session(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that raw HTML processing neither counts nor recycles session uses."""
+        mock_settings.crawl4ai_browser_pool_size = 1
+        extractor = Extractor(mock_settings)
+
+        with patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler):
+            await extractor.start()
+            await extractor.extract_html("<p>content</p>")
+
+        assert extractor._free_crawlers[0].uses == 0
+        mock_crawler.crawler_strategy.browser_manager.kill_session.assert_not_called()
+
+
+class TestExtractorPageCache:
+    """Test conditional revalidation of extracted pages."""
+
+    @pytest.fixture
+    def mock_crawler(self) -> AsyncMock:
+        """Create a mock crawler returning a page with an ETag."""
+        mock_crawler = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.html = "<html>content</html>"
+        mock_result.cleaned_html = "<body>content</body>"
+        mock_result.response_headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}
+        mock_crawler.arun.return_value = mock_result
+        return mock_crawler
+
+    async def test_unchanged_page_served_from_cache(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that a 304 response returns the cached result without crawling."""
+        extractor = Extractor(mock_settings)
+
+        with (
+            patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler),
+            patch.object(extractor._http, "head", new_callable=AsyncMock) as mock_head,
+        ):
+            mock_head.return_value = httpx.Response(httpx.codes.NOT_MODIFIED)
+            await extractor.start()
+
+            first = await extractor.extract_html("https://example.com")
+            second = await extractor.extract_html("https://example.com")
+
+        assert second == first
+        mock_crawler.arun.assert_called_once()
+        headers = mock_head.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024"}
+
+    async def test_modified_page_is_crawled_again(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that a changed page is extracted with the browser again."""
+        extractor = Extractor(mock_settings)
+
+        with (
+            patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler),
+            patch.object(extractor._http, "head", new_callable=AsyncMock) as mock_head,
+        ):
+            mock_head.return_value = httpx.Response(httpx.codes.OK)
+            await extractor.start()
+
+            await extractor.extract_html("https://example.com")
+            await extractor.extract_html("https://example.com")
+
+        expected_crawls = 2
+        assert mock_crawler.arun.call_count == expected_crawls
+
+    async def test_revalidation_error_falls_back_to_crawling(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that a failed conditional request does not fail extraction."""
+        extractor = Extractor(mock_settings)
+
+        with (
+            patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler),
+            patch.object(extractor._http, "head", new_callable=AsyncMock) as mock_head,
+        ):
+            mock_head.side_effect = httpx.ConnectError("Connection refused")
+            await extractor.start()
+
+            await extractor.extract_html("https://example.com")
+            result = await extractor.extract_html("https://example.com")
+
+        assert result.raw_html == "<html>content</html>"
+        expected_crawls = 2
+        assert mock_crawler.arun.call_count == expected_crawls
+
+    async def test_page_without_validators_is_not_cached(
+        self, mock_settings: MagicMock, mock_crawler: AsyncMock
+    ) -> None:
+        """Test that pages without ETag or Last-Modified are not revalidated."""
+        mock_crawler.arun.return_value.response_headers = {"Content-Type": "text/html"}
+        extractor = Extractor(mock_settings)
+
+        with (
+            patch("ssmcp.parser.extractor.AsyncWebCrawler", return_value=mock_crawler),
+            patch.object(extractor._http, "head", new_callable=AsyncMock) as mock_head,
+        ):
+            await extractor.start()
+
+            await extractor.extract_html("https://example.com")
+            await extractor.extract_html("https://example.com")
+
+        mock_head.assert_not_called()
+        assert extractor._page_cache == {}
+
+    def test_cache_is_bounded(self, mock_settings: MagicMock) -> None:
+        """Test that the oldest pages are evicted beyond the cache size."""
+        extractor = Extractor(mock_settings)
+        result = ExtractionResult(raw_html="<html></html>", cleaned_html="")
+
+        with patch("ssmcp.parser.extractor.PAGE_CACHE_MAX_SIZE", 2):
+            for i in range(3):
+                extractor._cache_page(f"https://example.com/{i}", {"ETag": '"v"'}, result)
+
+        assert list(extractor._page_cache) == ["https://example.com/1", "https://example.com/2"]
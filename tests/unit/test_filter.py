@@ -3,12 +3,14 @@
 from unittest.mock import MagicMock
 
 import pytest
+from lxml.html import fragment_fromstring
 
 from ssmcp.parser.filter import Filter
 from ssmcp.parser.filters.css_selector import CssSelectorFilter
 from ssmcp.parser.filters.residual_junk import ResidualJunkFilter
 
 EXPECTED_FILTER_COUNT = 2
+SINGLE_WORD_SPAN_COUNT = 60
 
 
 @pytest.fixture
@@ -19,6 +21,9 @@ def mock_settings() -> MagicMock:
     settings.css_selector_min_words = 50
     settings.junk_filter_enabled = True
     settings.junk_filter_letter_ratio_threshold = 0.3
+    settings.crawl4ai_excluded_tags = "nav,footer,aside"
+    settings.crawl4ai_exclude_external_links = True
+    settings.crawl4ai_word_count_threshold = 1
     return settings
 
 
@@ -96,52 +101,57 @@ class TestFilter:
         """Test that all filters are applied sequentially, passing output to next."""
         content_filter = Filter(mock_settings)
 
-        # Create mock filters that transform the HTML
+        node_1 = fragment_fromstring("<div>After filter 1</div>")
+        node_2 = fragment_fromstring("<div>After filter 2</div>")
+        node_3 = fragment_fromstring("<div>After filter 3</div>")
+
+        # Create mock filters that transform the tree
         mock_filter_1 = MagicMock()
-        mock_filter_1.apply.return_value = "<html>After filter 1</html>"
+        mock_filter_1.apply.return_value = node_1
 
         mock_filter_2 = MagicMock()
-        mock_filter_2.apply.return_value = "<html>After filter 2</html>"
+        mock_filter_2.apply.return_value = node_2
 
         mock_filter_3 = MagicMock()
-        mock_filter_3.apply.return_value = "<html>After filter 3</html>"
+        mock_filter_3.apply.return_value = node_3
 
         # Replace filters with mocks
         content_filter._filters = [mock_filter_1, mock_filter_2, mock_filter_3]
 
-        result = content_filter.apply_all("<html>original</html>")
+        result = content_filter.apply_all("<html><body>original</body></html>")
 
-        # Should return result from last filter
-        assert result == "<html>After filter 3</html>"
+        # Should return serialized result from last filter
+        assert result == "<div>After filter 3</div>"
 
         # Verify all filters were called in order with correct inputs
-        mock_filter_1.apply.assert_called_once_with("<html>original</html>")
-        mock_filter_2.apply.assert_called_once_with("<html>After filter 1</html>")
-        mock_filter_3.apply.assert_called_once_with("<html>After filter 2</html>")
+        root = mock_filter_1.apply.call_args.args[0]
+        assert root.tag == "html"
+        assert root.text_content() == "original"
+        mock_filter_2.apply.assert_called_once_with(node_1)
+        mock_filter_3.apply.assert_called_once_with(node_2)
 
     def test_apply_all_continues_when_filter_returns_none(
         self, mock_settings: MagicMock
     ) -> None:
-        """Test that apply_all continues with same HTML when filter returns None."""
+        """Test that apply_all continues with same node when filter returns None."""
         content_filter = Filter(mock_settings)
 
         mock_filter_1 = MagicMock()
         mock_filter_1.apply.return_value = None  # First filter fails
 
         mock_filter_2 = MagicMock()
-        mock_filter_2.apply.return_value = "<html>After filter 2</html>"
+        mock_filter_2.apply.return_value = fragment_fromstring("<div>After filter 2</div>")
 
         content_filter._filters = [mock_filter_1, mock_filter_2]
 
-        result = content_filter.apply_all("<html>original</html>")
+        result = content_filter.apply_all("<html><body>original</body></html>")
 
         # Should return result from filter 2 since it succeeded
-        assert result == "<html>After filter 2</html>"
+        assert result == "<div>After filter 2</div>"
 
-        # First filter called with original HTML
-        mock_filter_1.apply.assert_called_once_with("<html>original</html>")
-        # Second filter called with same HTML (since first returned None)
-        mock_filter_2.apply.assert_called_once_with("<html>original</html>")
+        # Second filter called with the same tree (since first returned None)
+        root = mock_filter_1.apply.call_args.args[0]
+        mock_filter_2.apply.assert_called_once_with(root)
 
     def test_apply_all_returns_none_when_all_filters_fail(
         self, mock_settings: MagicMock
@@ -157,14 +167,28 @@ class TestFilter:
 
         content_filter._filters = [mock_filter_1, mock_filter_2]
 
-        result = content_filter.apply_all("<html>test</html>")
+        result = content_filter.apply_all("<html><body>test</body></html>")
 
         # Should return None since all filters failed
         assert result is None
 
-        # Both filters should have been called with same HTML
-        mock_filter_1.apply.assert_called_once_with("<html>test</html>")
-        mock_filter_2.apply.assert_called_once_with("<html>test</html>")
+        # Both filters should have been called with the same tree
+        root = mock_filter_1.apply.call_args.args[0]
+        mock_filter_2.apply.assert_called_once_with(root)
+
+    def test_apply_all_keeps_tree_when_junk_filter_finds_no_text(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that the selected content is returned when junk filtering would empty it."""
+        content_filter = Filter(mock_settings)
+
+        html = "<article>" + "<span>word</span> " * SINGLE_WORD_SPAN_COUNT + "</article>"
+
+        result = content_filter.apply_all(html)
+
+        assert result is not None
+        assert result.startswith("<article>")
+        assert result.count("<span>word</span>") == SINGLE_WORD_SPAN_COUNT
 
     def test_filter_with_complex_html(self, mock_settings: MagicMock) -> None:
         """Test filter with realistic complex HTML."""
@@ -198,6 +222,96 @@ class TestFilter:
         assert "<article>" in result or "<article" in result
         assert "Main Article" in result
 
+    def test_apply_all_drops_excluded_tags(self, mock_settings: MagicMock) -> None:
+        """Test that tags excluded by the crawler config are removed from the result."""
+        content_filter = Filter(mock_settings)
+
+        html = """
+        <html>
+        <body>
+            <article>
+                <nav>Previous article Next article</nav>
+                <p>""" + " ".join(["content"] * 60) + """</p>
+                <aside>Related reading list</aside> and trailing text
+            </article>
+        </body>
+        </html>
+        """
+
+        result = content_filter.apply_all(html)
+
+        assert result is not None
+        assert "<article>" in result
+        assert "Previous article" not in result
+        assert "Related reading list" not in result
+        assert "and trailing text" in result
+
+    def test_apply_all_drops_external_and_social_links(self, mock_settings: MagicMock) -> None:
+        """Test that external links, social media links and external images are removed."""
+        mock_settings.junk_filter_enabled = False
+        content_filter = Filter(mock_settings)
+
+        html = (
+            "<article><p>" + " ".join(["content"] * 60) + "</p>"
+            '<p><a href="/docs">Internal docs</a> '
+            '<a href="https://blog.example.com/post">Blog post</a> '
+            '<a href="https://other.org/page">Other site</a> '
+            '<a href="https://twitter.com/example">Follow us</a> after links</p>'
+            '<img src="/logo.png"><img src="https://cdn.other.org/ad.png"></article>'
+        )
+
+        result = content_filter.apply_all(html, "https://www.example.com/article")
+
+        assert result is not None
+        assert "Internal docs" in result
+        assert "Blog post" in result
+        assert "Other site" not in result
+        assert "Follow us" not in result
+        assert "after links" in result
+        assert "/logo.png" in result
+        assert "cdn.other.org" not in result
+
+    def test_apply_all_keeps_external_links_when_allowed(self, mock_settings: MagicMock) -> None:
+        """Test that external links stay when exclusion is disabled, except social media."""
+        mock_settings.junk_filter_enabled = False
+        mock_settings.crawl4ai_exclude_external_links = False
+        content_filter = Filter(mock_settings)
+
+        html = (
+            "<article><p>" + " ".join(["content"] * 60) + "</p>"
+            '<p><a href="https://other.org/page">Other site</a> '
+            '<a href="https://www.facebook.com/example">Like us</a></p></article>'
+        )
+
+        result = content_filter.apply_all(html, "https://example.com/article")
+
+        assert result is not None
+        assert "Other site" in result
+        assert "Like us" not in result
+
+    def test_apply_all_drops_elements_below_word_count_threshold(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that leaf elements with too few words are removed, keeping code blocks."""
+        mock_settings.junk_filter_enabled = False
+        mock_settings.crawl4ai_word_count_threshold = 3
+        content_filter = Filter(mock_settings)
+
+        html = (
+            "<article><p>" + " ".join(["content"] * 60) + "</p>"
+            "<div><span>Share</span></div><p>Short</p> tail text"
+            "<pre><code><span>x</span> = 1</code></pre></article>"
+        )
+
+        result = content_filter.apply_all(html)
+
+        assert result is not None
+        assert "Share" not in result
+        assert "<div>" not in result
+        assert "Short" not in result
+        assert "tail text" in result
+        assert "<span>x</span>" in result
+
     def test_filter_respects_css_selector_settings(
         self, mock_settings: MagicMock
     ) -> None:
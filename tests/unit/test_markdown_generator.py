@@ -1,11 +1,12 @@
 """Unit tests for MarkdownGenerator module."""
 
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from ssmcp.exceptions import MarkdownGeneratorError
-from ssmcp.parser.markdown_generator import MarkdownGenerator
+from ssmcp.parser.markdown_generator import MARKDOWN_CACHE_MAX_SIZE, MarkdownGenerator
 
 
 @pytest.fixture
@@ -240,3 +241,78 @@ class TestMarkdownGenerator:
             assert options["escape_html"] == mock_settings.crawl4ai_escape_html
             assert options["body_width"] == mock_settings.crawl4ai_body_width
             assert options["include_sup_sub"] == mock_settings.crawl4ai_include_sup_sub
+
+
+class TestMarkdownGeneratorCache:
+    """Test caching of converted documents."""
+
+    @pytest.fixture
+    def mock_md_gen(self) -> Generator[MagicMock]:
+        """Patch the Crawl4AI generator to return a fixed result."""
+        mock_result = MagicMock()
+        mock_result.fit_markdown = "# Content"
+        mock_result.raw_markdown = ""
+
+        with patch(
+            "ssmcp.parser.markdown_generator.DefaultMarkdownGenerator"
+        ) as mock_md_gen_class:
+            mock_md_gen = MagicMock()
+            mock_md_gen.generate_markdown.return_value = mock_result
+            mock_md_gen_class.return_value = mock_md_gen
+            yield mock_md_gen
+
+    def test_repeated_html_converted_once(
+        self, mock_settings: MagicMock, mock_md_gen: MagicMock
+    ) -> None:
+        """Test that converting the same HTML twice reuses the first result."""
+        generator = MarkdownGenerator(mock_settings)
+
+        first = generator.convert("<p>Same page</p>")
+        second = generator.convert("<p>Same page</p>")
+
+        assert second == first
+        mock_md_gen.generate_markdown.assert_called_once()
+
+    def test_different_html_converted_separately(
+        self, mock_settings: MagicMock, mock_md_gen: MagicMock
+    ) -> None:
+        """Test that different HTML is not served from the cache."""
+        generator = MarkdownGenerator(mock_settings)
+
+        generator.convert("<p>First page</p>")
+        generator.convert("<p>Second page</p>")
+
+        expected_calls = 2
+        assert mock_md_gen.generate_markdown.call_count == expected_calls
+
+    def test_least_recently_used_entry_evicted(
+        self, mock_settings: MagicMock, mock_md_gen: MagicMock
+    ) -> None:
+        """Test that the cache is bounded and evicts the least recently used entry."""
+        generator = MarkdownGenerator(mock_settings)
+
+        for index in range(MARKDOWN_CACHE_MAX_SIZE):
+            generator.convert(f"<p>Page {index}</p>")
+        # Touch the oldest entry so the second one becomes least recently used
+        generator.convert("<p>Page 0</p>")
+        generator.convert("<p>One more page</p>")
+        mock_md_gen.generate_markdown.reset_mock()
+
+        generator.convert("<p>Page 0</p>")
+        mock_md_gen.generate_markdown.assert_not_called()
+        generator.convert("<p>Page 1</p>")
+        mock_md_gen.generate_markdown.assert_called_once()
+        assert len(generator._cache) == MARKDOWN_CACHE_MAX_SIZE
+
+    def test_failed_conversion_not_cached(
+        self, mock_settings: MagicMock, mock_md_gen: MagicMock
+    ) -> None:
+        """Test that a conversion error is raised again instead of being cached."""
+        mock_md_gen.generate_markdown.return_value.fit_markdown = ""
+        generator = MarkdownGenerator(mock_settings)
+
+        for _ in range(2):
+            with pytest.raises(MarkdownGeneratorError):
+                generator.convert("<p>Empty</p>")
+
+        assert not generator._cache
@@ -19,7 +19,13 @@ from ssmcp.exceptions import (
     TokenExpiredError,
     TokenValidationError,
 )
-from ssmcp.oauth import JWKSProvider, OAuthTokenVerifier
+from ssmcp.oauth import (
+    MAX_STALENESS_RATIO,
+    TOKEN_CACHE_MAX_TTL,
+    JWKSProvider,
+    OAuthTokenVerifier,
+    get_token_verifier,
+)
 
 # Test configuration
 TEST_ISSUER = "https://auth.example.com"
@@ -116,10 +122,12 @@ class TestJWKSProvider:
         # Mock the httpx.AsyncClient.get method
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -139,10 +147,12 @@ class TestJWKSProvider:
         """Test key retrieval with non-existent key ID."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -164,7 +174,7 @@ class TestJWKSProvider:
                 request=Mock(),
                 response=Mock(status_code=500)
             )
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+            mock_client.return_value.get = mock_get
 
             provider = JWKSProvider(mock_jwks_url)
 
@@ -179,10 +189,12 @@ class TestJWKSProvider:
         """Test key retrieval when JWKS endpoint returns invalid JSON."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(side_effect=Exception("Invalid JSON"))
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -200,10 +212,12 @@ class TestJWKSProvider:
         """Test key retrieval when JWKS response is missing 'keys' field."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value={})
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -218,19 +232,21 @@ class TestJWKSProvider:
         mock_jwks_url: str,
         sample_jwks_response: dict[str, Any],
     ) -> None:
-        """Test that cache expires after TTL."""
+        """Test that stale keys are served while the cache refreshes in the background."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("httpx.AsyncClient") as mock_client:
             get_mock = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = get_mock
+            mock_client.return_value.get = get_mock
 
             provider = JWKSProvider(mock_jwks_url, cache_ttl=1)
 
             # First call - should fetch
-            await provider.get_key("test-key-id")
+            first_key = await provider.get_key("test-key-id")
             assert get_mock.call_count == 1
 
             # Second call within TTL - should use cache
@@ -240,10 +256,269 @@ class TestJWKSProvider:
             # Wait for cache to expire
             await asyncio.sleep(1.1)
 
-            # Third call after TTL - should fetch again
-            await provider.get_key("test-key-id")
+            # Third call after TTL - stale key returned, refresh scheduled
+            stale_key = await provider.get_key("test-key-id")
+            assert stale_key is first_key
+            assert provider._refresh_task is not None
+
+            await provider._refresh_task
             assert get_mock.call_count == EXPECTED_NUM_FETCHES
 
+    @pytest.mark.asyncio
+    async def test_background_refresh_failure_keeps_keys(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a failed background refresh keeps serving cached keys."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            get_mock = AsyncMock(return_value=mock_response)
+            mock_client.return_value.get = get_mock
+
+            provider = JWKSProvider(mock_jwks_url, cache_ttl=1)
+            await provider.get_key("test-key-id")
+
+            get_mock.side_effect = httpx.ConnectError("Connection refused")
+            provider._last_fetch_attempt -= 10
+
+            key = await provider.get_key("test-key-id")
+            assert provider._refresh_task is not None
+            await provider._refresh_task
+
+            assert key is not None
+            assert "test-key-id" in provider._keys
+
+    @pytest.mark.asyncio
+    async def test_expired_keys_rejected_when_refresh_fails(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that keys past the staleness bound aren't served while the endpoint is down."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            get_mock = AsyncMock(return_value=mock_response)
+            mock_client.return_value.get = get_mock
+
+            provider = JWKSProvider(mock_jwks_url, cache_ttl=1)
+            await provider.get_key("test-key-id")
+
+            get_mock.side_effect = httpx.ConnectError("Connection refused")
+            provider._cache_time -= provider.cache_ttl * MAX_STALENESS_RATIO + 1
+
+            with pytest.raises(InvalidJWKSURLError):
+                await provider.get_key("test-key-id")
+
+            get_mock.side_effect = None
+            key = await provider.get_key("test-key-id")
+            assert key is not None
+            assert not provider._is_expired()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refresh_rate_limited(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that unknown key IDs don't trigger a refresh on every request."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            get_mock = AsyncMock(return_value=mock_response)
+            mock_client.return_value.get = get_mock
+
+            provider = JWKSProvider(mock_jwks_url)
+            await provider.get_key("test-key-id")
+
+            for _ in range(3):
+                with pytest.raises(InvalidJWKSURLError, match="not found"):
+                    await provider.get_key("rotated-key-id")
+
+            assert get_mock.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_conditional_refresh_not_modified(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a 304 response keeps parsed keys and sends validators."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers(
+            {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        not_modified = AsyncMock()
+        not_modified.status_code = httpx.codes.NOT_MODIFIED
+        not_modified.headers = httpx.Headers()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            get_mock = AsyncMock(side_effect=[mock_response, not_modified])
+            mock_client.return_value.get = get_mock
+
+            provider = JWKSProvider(mock_jwks_url)
+            key = await provider.get_key("test-key-id")
+            first_cache_time = provider._cache_time
+
+            provider._last_fetch_attempt = 0.0
+            await provider._refresh_cache()
+
+            headers = get_mock.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"v1"'
+            assert headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+            assert provider._keys["test-key-id"] is key
+            assert provider._cache_time >= first_cache_time
+            assert mock_response.json.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_ttl_from_max_age(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that Cache-Control max-age extends but never shortens the TTL."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers({"Cache-Control": "public, max-age=7200"})
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.get = AsyncMock(
+                return_value=mock_response
+            )
+
+            provider = JWKSProvider(mock_jwks_url)
+            await provider.get_key("test-key-id")
+            assert provider.cache_ttl == 2 * DEFAULT_CACHE_TTL
+
+            mock_response.headers = httpx.Headers({"Cache-Control": "max-age=60"})
+            provider._last_fetch_attempt = 0.0
+            await provider._refresh_cache()
+            assert provider.cache_ttl == DEFAULT_CACHE_TTL
+
+    @pytest.mark.asyncio
+    async def test_refresh_reuses_unchanged_keys(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a refresh only parses keys whose material changed."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.get = AsyncMock(
+                return_value=mock_response
+            )
+
+            provider = JWKSProvider(mock_jwks_url)
+            key = await provider.get_key("test-key-id")
+
+            provider._last_fetch_attempt = 0.0
+            with patch.object(provider, "_parse_jwk") as mock_parse:
+                await provider._refresh_cache()
+
+            mock_parse.assert_not_called()
+            assert provider._keys["test-key-id"] is key
+
+    @pytest.mark.asyncio
+    async def test_refresh_reuses_http_client(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that refreshes share one HTTP client which aclose releases."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            provider = JWKSProvider(mock_jwks_url)
+            await provider.get_key("test-key-id")
+            provider._last_fetch_attempt = 0.0
+            await provider._refresh_cache()
+
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.get.call_count == EXPECTED_NUM_FETCHES
+
+            await provider.aclose()
+            mock_client.return_value.aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_after_aclose_opens_new_client(
+        self,
+        mock_jwks_url: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a closed provider opens a fresh HTTP client on its next refresh."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            provider = JWKSProvider(mock_jwks_url)
+            await provider.aclose()
+            assert mock_client.call_count == 0
+
+            await provider.get_key("test-key-id")
+            await provider.aclose()
+            provider._last_fetch_attempt = 0.0
+            await provider._refresh_cache()
+
+            assert mock_client.call_count == EXPECTED_NUM_FETCHES
+            mock_client.return_value.aclose.assert_called_once()
+
+    def test_parse_jwk(
+        self,
+        mock_jwks_url: str,
+        rsa_keys: tuple[bytes, dict[str, Any]],
+    ) -> None:
+        """Test JWK parsing for valid, incomplete and unsupported keys."""
+        _, jwk_data = rsa_keys
+        provider = JWKSProvider(mock_jwks_url)
+
+        key = provider._parse_jwk(jwk_data)
+        assert isinstance(key, rsa.RSAPublicKey)
+
+        incomplete = {k: v for k, v in jwk_data.items() if k != "n"}
+        with pytest.raises(InvalidJWKSURLError, match="Failed to parse JWK"):
+            provider._parse_jwk(incomplete)
+
+        with pytest.raises(InvalidJWKSURLError, match="Unsupported key type: EC"):
+            provider._parse_jwk({**jwk_data, "kty": "EC"})
+
     @pytest.mark.asyncio
     async def test_concurrent_refresh(
         self,
@@ -253,11 +528,13 @@ class TestJWKSProvider:
         """Test that concurrent refreshes are handled correctly."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("httpx.AsyncClient") as mock_client:
             get_mock = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.get = get_mock
+            mock_client.return_value.get = get_mock
 
             # Use a positive TTL to allow caching
             provider = JWKSProvider(mock_jwks_url, cache_ttl=10)
@@ -414,6 +691,8 @@ class TestOAuthTokenVerifier:
         """Test successful token verification."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         # Patch settings directly in oauth module
@@ -423,7 +702,7 @@ class TestOAuthTokenVerifier:
             mock_settings.oauth_issuer = TEST_ISSUER
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                mock_client.return_value.get = AsyncMock(
                     return_value=mock_response
                 )
 
@@ -443,6 +722,8 @@ class TestOAuthTokenVerifier:
         """Test verification of expired token."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("ssmcp.oauth.settings") as mock_settings:
@@ -451,7 +732,7 @@ class TestOAuthTokenVerifier:
             mock_settings.oauth_issuer = TEST_ISSUER
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                mock_client.return_value.get = AsyncMock(
                     return_value=mock_response
                 )
 
@@ -468,6 +749,8 @@ class TestOAuthTokenVerifier:
         """Test verification of token with wrong audience."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("ssmcp.oauth.settings") as mock_settings:
@@ -476,7 +759,7 @@ class TestOAuthTokenVerifier:
             mock_settings.oauth_issuer = TEST_ISSUER
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                mock_client.return_value.get = AsyncMock(
                     return_value=mock_response
                 )
 
@@ -495,6 +778,8 @@ class TestOAuthTokenVerifier:
         """Test verification of token missing subject claim."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("ssmcp.oauth.settings") as mock_settings:
@@ -503,7 +788,7 @@ class TestOAuthTokenVerifier:
             mock_settings.oauth_issuer = TEST_ISSUER
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                mock_client.return_value.get = AsyncMock(
                     return_value=mock_response
                 )
 
@@ -548,6 +833,8 @@ class TestOAuthTokenVerifier:
         """Test verification of token with invalid signature."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("ssmcp.oauth.settings") as mock_settings:
@@ -556,7 +843,7 @@ class TestOAuthTokenVerifier:
             mock_settings.oauth_issuer = TEST_ISSUER
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                mock_client.return_value.get = AsyncMock(
                     return_value=mock_response
                 )
 
@@ -598,6 +885,8 @@ class TestOAuthTokenVerifier:
         """Test verification of token with wrong issuer."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
         mock_response.json = Mock(return_value=sample_jwks_response)
 
         with patch("ssmcp.oauth.settings") as mock_settings:
@@ -606,7 +895,7 @@ class TestOAuthTokenVerifier:
             mock_settings.oauth_issuer = TEST_ISSUER
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+                mock_client.return_value.get = AsyncMock(
                     return_value=mock_response
                 )
 
@@ -629,3 +918,308 @@ class TestOAuthTokenVerifier:
             verifier = OAuthTokenVerifier()
             with pytest.raises(TokenValidationError, match="Invalid token"):
                 await verifier.verify_token("not-a-valid-jwt-token")
+
+    @pytest.mark.asyncio
+    async def test_verify_token_cached(
+        self,
+        sample_token: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a verified token is served from cache on reuse."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_client.return_value.get = AsyncMock(
+                    return_value=mock_response
+                )
+
+                verifier = OAuthTokenVerifier()
+                first = await verifier.verify_token(sample_token)
+
+                with patch("ssmcp.oauth.jwt.decode") as mock_decode:
+                    second = await verifier.verify_token(sample_token)
+
+                mock_decode.assert_not_called()
+                assert second == first
+                # Callers get copies, so mutating one doesn't leak into later hits
+                second["sub"] = "tampered"
+                third = await verifier.verify_token(sample_token)
+                assert third["sub"] == first["sub"] != "tampered"
+
+    @pytest.mark.asyncio
+    async def test_verify_token_cache_ttl_capped(
+        self,
+        sample_token: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a long-lived token is cached no longer than TOKEN_CACHE_MAX_TTL."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_client.return_value.get = AsyncMock(
+                    return_value=mock_response
+                )
+
+                verifier = OAuthTokenVerifier()
+                result = await verifier.verify_token(sample_token)
+
+                expires_at, _ = next(iter(verifier._token_cache.values()))
+                assert expires_at <= time.time() + TOKEN_CACHE_MAX_TTL
+                assert expires_at < result["payload"]["exp"]
+
+    @pytest.mark.asyncio
+    async def test_verify_token_cache_expired_entry(
+        self,
+        sample_token: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a cached token past its exp is verified again."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_client.return_value.get = AsyncMock(
+                    return_value=mock_response
+                )
+
+                verifier = OAuthTokenVerifier()
+                await verifier.verify_token(sample_token)
+
+                # Pretend the cached entry expired
+                cache_key = next(iter(verifier._token_cache))
+                _, result = verifier._token_cache[cache_key]
+                verifier._token_cache[cache_key] = (time.time() - 1, result)
+
+                with (
+                    patch("ssmcp.oauth.jwt.decode", side_effect=jwt.ExpiredSignatureError),
+                    pytest.raises(TokenExpiredError),
+                ):
+                    await verifier.verify_token(sample_token)
+
+                assert cache_key not in verifier._token_cache
+
+    @pytest.mark.asyncio
+    async def test_verify_token_failure_not_cached(
+        self,
+        wrong_audience_token: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that failed verifications are never cached."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_client.return_value.get = AsyncMock(
+                    return_value=mock_response
+                )
+
+                verifier = OAuthTokenVerifier()
+                with pytest.raises(AudienceMismatchError):
+                    await verifier.verify_token(wrong_audience_token)
+
+                assert len(verifier._token_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_verify_token_cache_eviction(
+        self,
+        sample_token: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that the oldest cached token is evicted when the cache is full."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            with (
+                patch("httpx.AsyncClient") as mock_client,
+                patch("ssmcp.oauth.TOKEN_CACHE_MAX_SIZE", 1),
+            ):
+                mock_client.return_value.get = AsyncMock(
+                    return_value=mock_response
+                )
+
+                verifier = OAuthTokenVerifier()
+                verifier._token_cache[b"stale"] = (time.time() + 3600, {"sub": "other"})
+                await verifier.verify_token(sample_token)
+
+                assert b"stale" not in verifier._token_cache
+                assert len(verifier._token_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_verify_token_cache_evicts_least_recently_used(
+        self,
+        sample_token: str,
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a cache hit protects the token from being evicted next."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            with (
+                patch("httpx.AsyncClient") as mock_client,
+                patch("ssmcp.oauth.TOKEN_CACHE_MAX_SIZE", 2),
+            ):
+                mock_client.return_value.get = AsyncMock(
+                    return_value=mock_response
+                )
+
+                verifier = OAuthTokenVerifier()
+                await verifier.verify_token(sample_token)
+                verifier._token_cache[b"other"] = (time.time() + 3600, {"sub": "other"})
+
+                # The hit makes the sample token the most recently used entry
+                await verifier.verify_token(sample_token)
+                verifier._cache_token(b"newest", {"exp": time.time() + 3600}, {"sub": "newest"})
+
+                assert b"other" not in verifier._token_cache
+                assert b"newest" in verifier._token_cache
+                with patch("ssmcp.oauth.jwt.decode") as mock_decode:
+                    await verifier.verify_token(sample_token)
+                mock_decode.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_verify_token_expired_skips_signature_check(
+        self,
+        expired_token: str,
+    ) -> None:
+        """Test that expired tokens are rejected before any key lookup."""
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            verifier = OAuthTokenVerifier()
+            with (
+                patch.object(verifier.jwks_provider, "get_key") as mock_get_key,
+                pytest.raises(TokenExpiredError, match="Token has expired"),
+            ):
+                await verifier.verify_token(expired_token)
+
+            mock_get_key.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_verify_token_audience_list(
+        self,
+        rsa_keys: tuple[bytes, dict[str, Any]],
+        sample_jwks_response: dict[str, Any],
+    ) -> None:
+        """Test that a token listing several audiences is matched against the client ID."""
+        private_pem, jwk_data = rsa_keys
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = httpx.codes.OK
+        mock_response.headers = httpx.Headers()
+        mock_response.json = Mock(return_value=sample_jwks_response)
+
+        def make_token(aud: list[str]) -> str:
+            payload = {
+                "iss": TEST_ISSUER,
+                "sub": "user@example.com",
+                "aud": aud,
+                "exp": int(time.time()) + 3600,
+            }
+            return jwt.encode(
+                payload, private_pem, algorithm="RS256", headers={"kid": jwk_data["kid"]}
+            )
+
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_client.return_value.get = AsyncMock(
+                    return_value=mock_response
+                )
+
+                verifier = OAuthTokenVerifier()
+                result = await verifier.verify_token(make_token(["other", "test-client-id"]))
+                assert result["sub"] == "user@example.com"
+
+                with pytest.raises(AudienceMismatchError, match="Token audience does not match"):
+                    await verifier.verify_token(make_token(["other"]))
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "bm90LWpzb24.e30.sig",  # header is not JSON
+            "WzFd.e30.sig",  # header is a JSON array
+        ],
+    )
+    async def test_verify_token_malformed_header(self, token: str) -> None:
+        """Test that malformed token headers are rejected as invalid tokens."""
+        with patch("ssmcp.oauth.settings") as mock_settings:
+            mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+            mock_settings.oauth_client_id = "test-client-id"
+            mock_settings.oauth_issuer = TEST_ISSUER
+
+            verifier = OAuthTokenVerifier()
+            with pytest.raises(TokenValidationError, match=r"^Invalid token"):
+                await verifier.verify_token(token)
+
+class TestGetTokenVerifier:
+    """Tests for the get_token_verifier factory."""
+
+    def test_returns_singleton(self) -> None:
+        """Test that the token verifier factory always returns the same instance."""
+        get_token_verifier.cache_clear()
+        try:
+            with patch("ssmcp.oauth.settings") as mock_settings:
+                mock_settings.oauth_jwks_url = "https://auth.example.com/jwks"
+                verifier = get_token_verifier()
+
+            assert isinstance(verifier, OAuthTokenVerifier)
+            assert get_token_verifier() is verifier
+        finally:
+            get_token_verifier.cache_clear()
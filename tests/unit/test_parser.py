@@ -1,12 +1,21 @@
 """Unit tests for Parser module."""
 
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from ssmcp.exceptions import SSMCPError
+from ssmcp.config import Settings
+from ssmcp.exceptions import ParserError, SSMCPError
 from ssmcp.parser.extractor import ExtractionResult
-from ssmcp.parser.parser import Parser
+from ssmcp.parser.parser import Parser, _convert_page_in_worker, _init_worker
+
+# Seconds a process pool gets to notice that one of its workers was killed
+WORKER_CRASH_DETECTION_TIMEOUT = 10
 
 
 @pytest.fixture
@@ -17,6 +26,10 @@ def mock_settings() -> MagicMock:
     settings.css_selector_min_words = 50
     settings.junk_filter_enabled = True
     settings.junk_filter_letter_ratio_threshold = 0.3
+    settings.crawl4ai_excluded_tags = "nav,footer"
+    settings.crawl4ai_exclude_external_links = True
+    settings.crawl4ai_word_count_threshold = 1
+    settings.parser_page_timeout = 0
     return settings
 
 
@@ -102,6 +115,127 @@ class TestParser:
             with pytest.raises(ValueError, match="Unexpected error"):
                 await parser.parse_pages(["https://error.com"], mock_context)
 
+    async def test_parse_pages_keeps_input_order(
+        self, mock_settings: MagicMock, mock_context: AsyncMock
+    ) -> None:
+        """Test that results follow the input URL order, not completion order."""
+        parser = Parser(mock_settings)
+
+        urls = ["https://slow.com", "https://fast.com"]
+
+        async def side_effect(url: str) -> str:
+            if url == "https://slow.com":
+                await asyncio.sleep(0.05)
+            return f"# Content from {url}"
+
+        with patch.object(parser, "_run_pipeline", side_effect=side_effect):
+            result = await parser.parse_pages(urls, mock_context)
+
+        assert list(result) == urls
+        # Progress is still reported in completion order
+        last_progress = mock_context.report_progress.call_args_list[1][0][2]
+        assert last_progress == "Completed 1/2: https://fast.com"
+
+    async def test_parse_pages_deduplicates_urls(
+        self, mock_settings: MagicMock, mock_context: AsyncMock
+    ) -> None:
+        """Test that a URL listed more than once is parsed only once."""
+        parser = Parser(mock_settings)
+        urls = ["https://a.com", "https://b.com", "https://a.com"]
+
+        with patch.object(parser, "_run_pipeline") as mock_pipeline:
+            mock_pipeline.return_value = "# Content"
+            result = await parser.parse_pages(urls, mock_context)
+
+        assert list(result) == ["https://a.com", "https://b.com"]
+        assert [call.args[0] for call in mock_pipeline.call_args_list] == list(result)
+        expected_total = 2
+        assert mock_context.report_progress.call_args.args[1] == expected_total
+
+    async def test_parse_pages_accepts_iterator(
+        self, mock_settings: MagicMock, mock_context: AsyncMock
+    ) -> None:
+        """Test that URLs can be passed as a one-shot iterator."""
+        parser = Parser(mock_settings)
+        urls = iter(["https://a.com", "https://b.com"])
+
+        with patch.object(parser, "_run_pipeline", return_value="# Content"):
+            result = await parser.parse_pages(urls, mock_context)
+
+        assert list(result) == ["https://a.com", "https://b.com"]
+
+    async def test_parse_pages_cancels_pending_on_unexpected_error(
+        self, mock_settings: MagicMock, mock_context: AsyncMock
+    ) -> None:
+        """Test that remaining pages are cancelled when one fails unexpectedly."""
+        parser = Parser(mock_settings)
+        cancelled = asyncio.Event()
+
+        async def side_effect(url: str) -> str:
+            if url == "https://error.com":
+                raise ValueError("Unexpected error")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # Cleanup such as releasing a browser may itself need to await
+                await asyncio.sleep(0)
+                cancelled.set()
+                raise
+            return "# Never"
+
+        with (
+            patch.object(parser, "_run_pipeline", side_effect=side_effect),
+            pytest.raises(ValueError, match="Unexpected error"),
+        ):
+            await parser.parse_pages(["https://slow.com", "https://error.com"], mock_context)
+
+        # Cancelled pages have finished by the time parse_pages returns
+        assert cancelled.is_set()
+
+    async def test_parse_pages_drops_page_over_timeout(
+        self, mock_settings: MagicMock, mock_context: AsyncMock
+    ) -> None:
+        """Test that a page exceeding the page timeout is left out of the results."""
+        mock_settings.parser_page_timeout = 0.05
+        parser = Parser(mock_settings)
+
+        async def side_effect(url: str) -> str:
+            if url == "https://slow.com":
+                await asyncio.sleep(10)
+            return f"# {url}"
+
+        with patch.object(parser, "_run_pipeline", side_effect=side_effect):
+            result = await parser.parse_pages(
+                ["https://slow.com", "https://fast.com"], mock_context
+            )
+
+        assert result == {"https://fast.com": "# https://fast.com"}
+
+    async def test_parse_pages_returns_partial_results_at_deadline(
+        self, mock_settings: MagicMock, mock_context: AsyncMock
+    ) -> None:
+        """Test that pages still pending at the deadline are cancelled and dropped."""
+        parser = Parser(mock_settings)
+        cancelled = asyncio.Event()
+
+        async def side_effect(url: str) -> str:
+            if url == "https://slow.com":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(0)
+                    cancelled.set()
+                    raise
+            return f"# {url}"
+
+        with patch.object(parser, "_run_pipeline", side_effect=side_effect):
+            result = await parser.parse_pages(
+                ["https://slow.com", "https://fast.com"], mock_context, deadline=0.05
+            )
+
+        assert result == {"https://fast.com": "# https://fast.com"}
+        assert cancelled.is_set()
+
     async def test_parse_pages_progress_reporting(
         self, mock_settings: MagicMock, mock_context: AsyncMock
     ) -> None:
@@ -189,9 +323,9 @@ class TestParser:
             result = await parser._run_pipeline("https://example.com")
 
             assert result == "# Markdown Output"
-            # Should call extract twice (once for URL, once for filtered content)
-            expected_extract_calls = 2
-            assert mock_extract.call_count == expected_extract_calls
+            # Filtered content is converted directly, without re-extraction
+            mock_extract.assert_called_once()
+            mock_convert.assert_called_once_with("<article>filtered content</article>")
 
     async def test_run_pipeline_without_filter_match(
         self, mock_settings: MagicMock
@@ -241,6 +375,220 @@ class TestParser:
         assert result == {}
 
 
+class TestParserWorkers:
+    """Test running filtering and Markdown conversion in worker processes."""
+
+    async def test_start_without_workers_uses_threads(self, mock_settings: MagicMock) -> None:
+        """Test that no process pool is created when parser_workers is 0."""
+        mock_settings.parser_workers = 0
+        parser = Parser(mock_settings)
+
+        with (
+            patch.object(parser._extractor, "start", new_callable=AsyncMock),
+            patch("ssmcp.parser.parser.ProcessPoolExecutor") as mock_pool_class,
+        ):
+            await parser.start()
+
+        mock_pool_class.assert_not_called()
+        assert parser._executor is None
+
+    async def test_run_pipeline_without_workers_converts_in_thread(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that pages are converted off the event loop thread without a pool."""
+        parser = Parser(mock_settings)
+        conversion_threads = []
+
+        def convert(html: str) -> str:
+            conversion_threads.append(threading.get_ident())
+            return "# Markdown"
+
+        with (
+            patch.object(parser._extractor, "extract_html", new_callable=AsyncMock) as mock_extract,
+            patch.object(parser._filter, "apply_all", return_value=None),
+            patch.object(parser._markdown_generator, "convert", side_effect=convert),
+        ):
+            mock_extract.return_value = ExtractionResult("<html></html>", "<p>Cleaned</p>")
+            result = await parser._run_pipeline("https://example.com")
+
+        assert result == "# Markdown"
+        assert len(conversion_threads) == 1
+        assert conversion_threads[0] != threading.get_ident()
+
+    async def test_start_and_close_manage_process_pool(self, mock_settings: MagicMock) -> None:
+        """Test that the process pool is created on start and shut down on close."""
+        workers = 2
+        mock_settings.parser_workers = workers
+        parser = Parser(mock_settings)
+
+        with (
+            patch.object(parser._extractor, "start", new_callable=AsyncMock),
+            patch.object(parser._extractor, "close", new_callable=AsyncMock),
+            patch("ssmcp.parser.parser.ProcessPoolExecutor") as mock_pool_class,
+        ):
+            await parser.start()
+
+            kwargs = mock_pool_class.call_args.kwargs
+            assert kwargs["max_workers"] == workers
+            assert kwargs["initializer"] is _init_worker
+            assert kwargs["initargs"] == (mock_settings,)
+
+            await parser.close()
+
+        mock_pool_class.return_value.shutdown.assert_called_once_with(
+            wait=False, cancel_futures=True
+        )
+        assert parser._executor is None
+
+    async def test_run_pipeline_dispatches_to_worker_pool(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that pages are queued and converted by the worker pool when present."""
+        mock_settings.parser_workers = 1
+        parser = Parser(mock_settings)
+
+        with (
+            patch(
+                "ssmcp.parser.parser.ProcessPoolExecutor",
+                return_value=ThreadPoolExecutor(max_workers=1),
+            ),
+            patch.object(parser._extractor, "start", new_callable=AsyncMock),
+            patch.object(parser._extractor, "close", new_callable=AsyncMock),
+            patch.object(parser._extractor, "extract_html") as mock_extract,
+            patch.object(parser._filter, "apply_all") as mock_local_filter,
+            patch("ssmcp.parser.parser._convert_page_in_worker") as mock_worker_convert,
+        ):
+            await parser.start()
+            mock_extract.return_value = ExtractionResult(
+                raw_html="<html>raw</html>", cleaned_html="<body>cleaned</body>"
+            )
+            mock_worker_convert.return_value = "# Worker Markdown"
+
+            result = await parser._run_pipeline("https://example.com")
+            await parser.close()
+
+        assert result == "# Worker Markdown"
+        mock_worker_convert.assert_called_once_with(
+            "https://example.com", "<html>raw</html>", "<body>cleaned</body>"
+        )
+        mock_local_filter.assert_not_called()
+        assert parser._dispatchers == []
+
+    async def test_worker_errors_propagate_to_pipeline(self, mock_settings: MagicMock) -> None:
+        """Test that an error raised in the worker pool reaches the caller."""
+        mock_settings.parser_workers = 1
+        parser = Parser(mock_settings)
+
+        with (
+            patch(
+                "ssmcp.parser.parser.ProcessPoolExecutor",
+                return_value=ThreadPoolExecutor(max_workers=1),
+            ),
+            patch.object(parser._extractor, "start", new_callable=AsyncMock),
+            patch.object(parser._extractor, "close", new_callable=AsyncMock),
+            patch.object(parser._extractor, "extract_html") as mock_extract,
+            patch("ssmcp.parser.parser._convert_page_in_worker") as mock_worker_convert,
+        ):
+            await parser.start()
+            mock_extract.return_value = ExtractionResult(raw_html="<html></html>", cleaned_html="")
+            mock_worker_convert.side_effect = SSMCPError("Conversion failed")
+
+            with pytest.raises(SSMCPError, match="Conversion failed"):
+                await parser._run_pipeline("https://example.com")
+            await parser.close()
+
+    async def test_worker_crash_fails_page_and_replaces_pool(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that a page whose worker dies fails with ParserError and the pool is rebuilt."""
+        mock_settings.parser_workers = 1
+        parser = Parser(mock_settings)
+
+        crashed: Future[str] = Future()
+        crashed.set_exception(BrokenProcessPool("worker died"))
+        converted: Future[str] = Future()
+        converted.set_result("# Markdown")
+        broken_pool = MagicMock()
+        broken_pool.submit.return_value = crashed
+        fresh_pool = MagicMock()
+        fresh_pool.submit.return_value = converted
+
+        with (
+            patch(
+                "ssmcp.parser.parser.ProcessPoolExecutor", side_effect=[broken_pool, fresh_pool]
+            ),
+            patch.object(parser._extractor, "start", new_callable=AsyncMock),
+            patch.object(parser._extractor, "close", new_callable=AsyncMock),
+            patch.object(parser._extractor, "extract_html") as mock_extract,
+        ):
+            await parser.start()
+            mock_extract.return_value = ExtractionResult(raw_html="<html></html>", cleaned_html="")
+
+            with pytest.raises(ParserError, match="worker died"):
+                await parser._run_pipeline("https://example.com/crash")
+            assert await parser._run_pipeline("https://example.com") == "# Markdown"
+            await parser.close()
+
+        broken_pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        fresh_pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    async def test_worker_pool_recovers_after_worker_is_killed(
+        self, mock_context: AsyncMock
+    ) -> None:
+        """Test that pages are parsed again after a worker process was killed."""
+        settings = Settings(searxng_search_url="http://test.com", parser_workers=1)
+        parser = Parser(settings)
+        html = "<html><body><article><p>" + " ".join(["word"] * 60) + "</p></article></body></html>"
+
+        with (
+            patch.object(parser._extractor, "start", new_callable=AsyncMock),
+            patch.object(parser._extractor, "close", new_callable=AsyncMock),
+            patch.object(
+                parser._extractor,
+                "extract_html",
+                return_value=ExtractionResult(raw_html=html, cleaned_html=""),
+            ),
+        ):
+            await parser.start()
+            try:
+                assert await parser.parse_pages(["https://example.com/1"], mock_context)
+
+                killed_pool = parser._executor
+                assert killed_pool is not None
+                for process in list(killed_pool._processes.values()):
+                    process.kill()
+                    process.join()
+                # The pool's management thread marks it broken and exits
+                # typeshed mistypes the attribute as the pool's wakeup pipe
+                manager_thread = cast("threading.Thread", killed_pool._executor_manager_thread)
+                await asyncio.to_thread(manager_thread.join, WORKER_CRASH_DETECTION_TIMEOUT)
+                assert killed_pool._broken
+
+                result = await parser.parse_pages(["https://example.com/2"], mock_context)
+            finally:
+                await parser.close()
+
+        assert "word" in result["https://example.com/2"]
+        assert parser._executor is None
+
+    def test_worker_functions_use_initialized_components(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Test that worker functions run the components built by the initializer."""
+        _init_worker(mock_settings)
+
+        html = "<html><body><article><p>" + " ".join(["word"] * 60) + "</p></article></body></html>"
+        with patch(
+            "ssmcp.parser.markdown_generator.MarkdownGenerator.convert",
+            return_value="# Markdown",
+        ) as mock_convert:
+            result = _convert_page_in_worker("https://example.com", html, "<body>cleaned</body>")
+
+        assert result == "# Markdown"
+        converted_html = mock_convert.call_args.args[0]
+        assert converted_html.startswith("<article>")
+
+
 class TestParserCssSelectorFlow:
     """Integration-style tests for Parser pipeline with CSS selector filtering."""
 
@@ -264,6 +612,10 @@ class TestParserCssSelectorFlow:
         settings.crawl4ai_include_sup_sub = True
         settings.junk_filter_enabled = True
         settings.junk_filter_letter_ratio_threshold = 0.3
+        settings.crawl4ai_excluded_tags = "nav,footer"
+        settings.crawl4ai_exclude_external_links = True
+        settings.crawl4ai_word_count_threshold = 1
+        settings.parser_page_timeout = 0
         return settings
 
     @pytest.fixture
@@ -309,32 +661,20 @@ class TestParserCssSelectorFlow:
         </html>
         """
 
-        call_count = 0
-
-        async def mock_extract(url_or_html: str) -> ExtractionResult:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return ExtractionResult(
-                    raw_html=raw_html_with_content,
-                    cleaned_html=cleaned_html_without_content,
-                )
-            else:
-                cleaned_html = (
-                    '<div id="content"><div class="question">'
-                    "<h1>How to use Python decorators?</h1>"
-                    "<p>I'm learning about Python decorators...</p>"
-                    "</div></div>"
-                )
-                return ExtractionResult(raw_html="", cleaned_html=cleaned_html)
-
-        with patch.object(parser._extractor, "extract_html", side_effect=mock_extract):
+        with patch.object(parser._extractor, "extract_html") as mock_ext:
+            mock_ext.return_value = ExtractionResult(
+                raw_html=raw_html_with_content,
+                cleaned_html=cleaned_html_without_content,
+            )
             result = await parser.parse_pages(["http://example.com"], mock_ctx)
 
         markdown = result["http://example.com"]
         assert markdown is not None
         assert "Python decorators" in markdown
-        assert "learning about Python decorators" in markdown
+        assert "web applications" in markdown
+        # Only the selected content is converted
+        assert "Navigation" not in markdown
+        assert "Copyright" not in markdown
 
     async def test_no_css_selector_match_uses_cleaned_html(
         self, flow_mock_settings: MagicMock, mock_ctx: AsyncMock
@@ -430,32 +770,23 @@ class TestParserCssSelectorFlow:
         urls = ["http://stackoverflow.com", "http://blog.com", "http://unknown.com"]
 
         async def mock_extract(url_or_html: str) -> ExtractionResult:
-            # Initial URL extractions (start with http)
-            if url_or_html.startswith("http://"):
-                if "stackoverflow" in url_or_html:
-                    return ExtractionResult(
-                        raw_html='<html><body><div id="content">'
-                        + " ".join(["word"] * 60)
-                        + "</div></body></html>",
-                        cleaned_html="<html><body>" + " ".join(["word"] * 60) + "</body></html>",
-                    )
-                elif "blog" in url_or_html:
-                    return ExtractionResult(
-                        raw_html="<html><body><article>"
-                        + " ".join(["post"] * 60)
-                        + "</article></body></html>",
-                        cleaned_html="<html><body><article>"
-                        + " ".join(["post"] * 60)
-                        + "</article></body></html>",
-                    )
-                else:
-                    raise SSMCPError("Not found")
-            else:
-                # Re-extraction of filtered HTML fragments
+            if "stackoverflow" in url_or_html:
+                return ExtractionResult(
+                    raw_html='<html><body><div id="content">'
+                    + " ".join(["word"] * 60)
+                    + "</div></body></html>",
+                    cleaned_html="<html><body>" + " ".join(["word"] * 60) + "</body></html>",
+                )
+            if "blog" in url_or_html:
                 return ExtractionResult(
-                    raw_html="",
-                    cleaned_html="<html><body>filtered content</body></html>",
+                    raw_html="<html><body><article>"
+                    + " ".join(["post"] * 60)
+                    + "</article></body></html>",
+                    cleaned_html="<html><body><article>"
+                    + " ".join(["post"] * 60)
+                    + "</article></body></html>",
                 )
+            raise SSMCPError("Not found")
 
         with patch.object(parser._extractor, "extract_html", side_effect=mock_extract):
             result = await parser.parse_pages(urls, mock_ctx)
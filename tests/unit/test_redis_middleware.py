@@ -1,15 +1,31 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp.server.middleware import MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
 
 from ssmcp.config import settings
-from ssmcp.middleware.redis_middleware import RedisLoggingMiddleware
+from ssmcp.middleware.redis_middleware import CIRCUIT_FAILURE_THRESHOLD, RedisLoggingMiddleware
 
 REDIS_TTL_SECONDS = 3600  # 1 hour
-KEY_PARTS_COUNT = 3  # prefix:timestamp:unique_id
-UNIQUE_ID_LENGTH = 8  # 4-byte hex = 8 characters
+KEY_PARTS_COUNT = 3  # prefix:timestamp_ns:sequence
+TIMESTAMP_NS_LENGTH = 19  # nanoseconds since epoch
+BATCHED_CALLS = 3
+
+
+def make_redis_mock() -> AsyncMock:
+    """Create a Redis client mock whose pipeline records hset calls."""
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock()
+
+    redis = AsyncMock()
+    redis.pipeline = MagicMock(return_value=pipe)
+    return redis
 
 
 @pytest.mark.asyncio
@@ -33,7 +49,7 @@ async def test_middleware_with_redis() -> None:
     redis_url = "redis://redis:6379"
 
     with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
-        mock_redis = AsyncMock()
+        mock_redis = make_redis_mock()
         mock_from_url.return_value = mock_redis
 
         middleware = RedisLoggingMiddleware(redis_url=redis_url)
@@ -47,26 +63,29 @@ async def test_middleware_with_redis() -> None:
         call_next = AsyncMock(return_value="tool response")
 
         result = await middleware.on_call_tool(context, call_next)
-
         assert result == "tool response"
-        assert mock_redis.setex.called
+
+        # Wait for the queued entry to be flushed
+        await middleware.shutdown()
+        pipe = mock_redis.pipeline.return_value
+        assert pipe.hset.called
 
         # Check data stored in Redis
-        args, _ = mock_redis.setex.call_args
+        args, kwargs = pipe.hset.call_args
         key = args[0]
-        ttl = args[1]
-        data = json.loads(args[2])
+        data = kwargs["mapping"]
+        pipe.expire.assert_any_call(key, REDIS_TTL_SECONDS)
 
-        # Verify key format: prefix:timestamp:unique_id
+        # Verify key format: prefix:timestamp_ns:sequence
         key_parts = key.split(":")
         assert len(key_parts) == KEY_PARTS_COUNT
         assert key_parts[0] == settings.redis_key_prefix
         assert key_parts[1].isdigit()  # timestamp
-        assert len(key_parts[2]) == UNIQUE_ID_LENGTH
+        assert len(key_parts[1]) == TIMESTAMP_NS_LENGTH
+        assert key_parts[2].isdigit()  # sequence
 
-        assert ttl == REDIS_TTL_SECONDS
         assert data["tool"] == "test_tool"
-        assert data["params"] == {"q": "test"}
+        assert json.loads(data["params"]) == {"q": "test"}
         assert data["response"] == "tool response"
 
 
@@ -76,8 +95,8 @@ async def test_middleware_redis_error() -> None:
     redis_url = "redis://redis:6379"
 
     with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
-        mock_redis = AsyncMock()
-        mock_redis.setex.side_effect = Exception("Redis down")
+        mock_redis = make_redis_mock()
+        mock_redis.pipeline.return_value.execute.side_effect = Exception("Redis down")
         mock_from_url.return_value = mock_redis
 
         middleware = RedisLoggingMiddleware(redis_url=redis_url)
@@ -92,9 +111,10 @@ async def test_middleware_redis_error() -> None:
 
         # should not raise exception
         result = await middleware.on_call_tool(context, call_next)
+        await middleware.shutdown()
 
         assert result == "ok"
-        assert mock_redis.setex.called
+        assert mock_redis.pipeline.return_value.hset.called
 
 
 @pytest.mark.asyncio
@@ -103,7 +123,7 @@ async def test_middleware_lifecycle() -> None:
     redis_url = "redis://redis:6379"
 
     with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
-        mock_redis = AsyncMock()
+        mock_redis = make_redis_mock()
         mock_from_url.return_value = mock_redis
 
         middleware = RedisLoggingMiddleware(redis_url=redis_url)
@@ -120,3 +140,235 @@ async def test_middleware_lifecycle() -> None:
         await middleware.shutdown()
         assert middleware.redis_client is None
         mock_redis.aclose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_middleware_serializes_structured_result() -> None:
+    """Test that list and dict tool results are stored as indented JSON."""
+    redis_url = "redis://redis:6379"
+
+    with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
+        mock_redis = make_redis_mock()
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url=redis_url)
+        await middleware.startup()
+
+        context = MagicMock(spec=MiddlewareContext)
+        context.message = MagicMock()
+        context.message.name = "web_search"
+        context.message.arguments = {"query": "test"}
+
+        tool_result = [{"url": "https://example.com", "content": "text"}]
+        call_next = AsyncMock(return_value=tool_result)
+
+        result = await middleware.on_call_tool(context, call_next)
+        await middleware.shutdown()
+
+        assert result is tool_result
+        _, kwargs = mock_redis.pipeline.return_value.hset.call_args
+        assert kwargs["mapping"]["response"] == json.dumps(tool_result, indent=2)
+
+
+@pytest.mark.asyncio
+async def test_middleware_serializes_non_str_keys() -> None:
+    """Test that params and results with non-str dict keys are still logged."""
+    with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
+        mock_redis = make_redis_mock()
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url="redis://redis:6379")
+        await middleware.startup()
+
+        context = MagicMock(spec=MiddlewareContext)
+        context.message = MagicMock()
+        context.message.name = "test_tool"
+        context.message.arguments = {"ids": {1: "first"}}
+
+        tool_result = {200: "ok", None: "missing"}
+        await middleware.on_call_tool(context, AsyncMock(return_value=tool_result))
+        await middleware.shutdown()
+
+        _, kwargs = mock_redis.pipeline.return_value.hset.call_args
+        assert json.loads(kwargs["mapping"]["params"]) == {"ids": {"1": "first"}}
+        assert kwargs["mapping"]["response"] == json.dumps(tool_result, indent=2)
+
+
+@pytest.mark.asyncio
+async def test_middleware_batches_writes() -> None:
+    """Test that tool calls are returned immediately and written in one pipeline."""
+    redis_url = "redis://redis:6379"
+    write_released = asyncio.Event()
+
+    async def blocked_execute() -> None:
+        await write_released.wait()
+
+    with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
+        mock_redis = make_redis_mock()
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = blocked_execute
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url=redis_url)
+        await middleware.startup()
+
+        context = MagicMock(spec=MiddlewareContext)
+        context.message = MagicMock()
+        context.message.name = "test_tool"
+        context.message.arguments = {}
+
+        for _ in range(BATCHED_CALLS):
+            result = await middleware.on_call_tool(context, AsyncMock(return_value="ok"))
+            assert result == "ok"
+
+        # Nothing has been written yet, the tool path only queues entries
+        pipe.execute.assert_not_called()
+
+        write_released.set()
+        await middleware.shutdown()
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.hset.call_count == BATCHED_CALLS
+        keys = {call.args[0] for call in pipe.hset.call_args_list}
+        assert len(keys) == BATCHED_CALLS
+        pipe.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_middleware_indexes_keys() -> None:
+    """Test that written keys are added to the index sorted set and expired ones trimmed."""
+    redis_url = "redis://redis:6379"
+    with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
+        mock_redis = make_redis_mock()
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url=redis_url)
+        await middleware.startup()
+
+        context = MagicMock(spec=MiddlewareContext)
+        context.message = MagicMock()
+        context.message.name = "test_tool"
+        context.message.arguments = {}
+
+        await middleware.on_call_tool(context, AsyncMock(return_value="ok"))
+        await middleware.shutdown()
+
+        pipe = mock_redis.pipeline.return_value
+        index_key, members = pipe.zadd.call_args.args
+        assert index_key == settings.redis_index_key
+        assert set(members) == {call.args[0] for call in pipe.hset.call_args_list}
+
+        trim_key, _, max_score = pipe.zremrangebyscore.call_args.args
+        assert trim_key == settings.redis_index_key
+        assert max_score == min(members.values()) - settings.redis_expiration_seconds
+        pipe.expire.assert_called_with(settings.redis_index_key, settings.redis_expiration_seconds)
+
+
+@pytest.mark.asyncio
+async def test_middleware_joins_tool_result_content() -> None:
+    """Test that ToolResult content blocks are joined into the stored response."""
+    redis_url = "redis://redis:6379"
+
+    with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
+        mock_redis = make_redis_mock()
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url=redis_url)
+        await middleware.startup()
+
+        context = MagicMock(spec=MiddlewareContext)
+        context.message = MagicMock()
+        context.message.name = "web_fetch"
+        context.message.arguments = {"url": "https://example.com"}
+
+        tool_result = ToolResult(
+            content=[TextContent(type="text", text="first"), TextContent(type="text", text="")]
+        )
+        await middleware.on_call_tool(context, AsyncMock(return_value=tool_result))
+        await middleware.shutdown()
+
+        _, kwargs = mock_redis.pipeline.return_value.hset.call_args
+        assert kwargs["mapping"]["response"] == "first\n"
+
+
+@pytest.mark.asyncio
+async def test_middleware_circuit_opens_after_failures() -> None:
+    """Test that repeated Redis failures suspend logging on the tool path."""
+    redis_url = "redis://redis:6379"
+
+    with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
+        mock_redis = make_redis_mock()
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = Exception("Redis down")
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url=redis_url)
+        await middleware.startup()
+
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            await middleware._write_batch(mock_redis, [("key", {"tool": "test_tool"})])
+
+        assert pipe.execute.call_count == CIRCUIT_FAILURE_THRESHOLD
+
+        context = MagicMock(spec=MiddlewareContext)
+        context.message = MagicMock()
+        context.message.name = "test_tool"
+        context.message.arguments = {}
+
+        with patch.object(middleware, "_build_entry") as mock_build_entry:
+            result = await middleware.on_call_tool(context, AsyncMock(return_value="ok"))
+
+        assert result == "ok"
+        mock_build_entry.assert_not_called()
+
+        # Writes are dropped without contacting Redis while the circuit is open
+        await middleware._write_batch(mock_redis, [("key", {"tool": "test_tool"})])
+        assert pipe.execute.call_count == CIRCUIT_FAILURE_THRESHOLD
+
+        await middleware.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_middleware_shutdown_with_dead_flush_loop_and_full_queue() -> None:
+    """Test that shutdown returns when the flush loop died and the queue is full."""
+    with patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url:
+        mock_redis = make_redis_mock()
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url="redis://redis:6379")
+        middleware._queue = asyncio.Queue(1)
+        with patch.object(middleware, "_write_batch", side_effect=RuntimeError("loop bug")):
+            await middleware.startup()
+            await middleware._queue.put(("key", {"tool": "test_tool"}))
+            assert middleware._flush_task is not None
+            await asyncio.wait([middleware._flush_task])
+
+        middleware._queue.put_nowait(("key", {"tool": "test_tool"}))
+
+        await asyncio.wait_for(middleware.shutdown(), timeout=1.0)
+
+        assert middleware._flush_task is None
+        mock_redis.aclose.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_middleware_shutdown_cancels_stuck_flush_loop() -> None:
+    """Test that shutdown gives up on a flush loop that doesn't finish in time."""
+    with (
+        patch("ssmcp.middleware.redis_middleware.Redis.from_url") as mock_from_url,
+        patch("ssmcp.middleware.redis_middleware.SHUTDOWN_TIMEOUT", 0.05),
+    ):
+        mock_redis = make_redis_mock()
+        mock_redis.pipeline.return_value.execute.side_effect = asyncio.Event().wait
+        mock_from_url.return_value = mock_redis
+
+        middleware = RedisLoggingMiddleware(redis_url="redis://redis:6379")
+        await middleware.startup()
+        flush_task = middleware._flush_task
+        await middleware._queue.put(("key", {"tool": "test_tool"}))
+
+        await asyncio.wait_for(middleware.shutdown(), timeout=1.0)
+
+        assert flush_task is not None
+        assert flush_task.cancelled()
+        mock_redis.aclose.assert_called_once()
@@ -1,10 +1,20 @@
 """Unit tests for ResidualJunkFilter module."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ssmcp.parser.dom import parse_html, to_html
 from ssmcp.parser.filters.residual_junk import ResidualJunkFilter
+from ssmcp.parser.protocols import ContentFilter
+
+
+def apply_filter(content_filter: ContentFilter, html: str) -> str | None:
+    """Parse HTML, run the filter on the tree and serialize the result."""
+    tree = parse_html(html)
+    assert tree is not None
+    result = content_filter.apply(tree)
+    return None if result is None else to_html(result)
 
 
 @pytest.fixture
@@ -31,7 +41,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_empty)
+        result = apply_filter(junk_filter, html_with_empty)
 
         assert result is not None
         assert "Good content" in result
@@ -51,7 +61,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_junk)
+        result = apply_filter(junk_filter, html_with_junk)
 
         assert result is not None
         assert "Good content here" in result
@@ -70,7 +80,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_content)
+        result = apply_filter(junk_filter, html_with_content)
 
         assert result is not None
         assert "This is good content with multiple words" in result
@@ -88,7 +98,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_tooltip)
+        result = apply_filter(junk_filter, html_with_tooltip)
 
         assert result is not None
         assert "Good content" in result
@@ -107,7 +117,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_code)
+        result = apply_filter(junk_filter, html_with_code)
 
         assert result is not None
         assert "<code>x = 5</code>" in result
@@ -127,7 +137,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_nested)
+        result = apply_filter(junk_filter, html_with_nested)
 
         assert result is not None
         # Content outside pre is preserved
@@ -147,7 +157,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_heading)
+        result = apply_filter(junk_filter, html_with_heading)
 
         assert result is not None
         # Headings are protected and kept
@@ -167,7 +177,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_heading)
+        result = apply_filter(junk_filter, html_with_heading)
 
         assert result is not None
         # Multi-word heading is preserved
@@ -187,7 +197,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html_with_special)
+        result = apply_filter(junk_filter, html_with_special)
 
         assert result is not None
         assert "Content here" in result
@@ -208,7 +218,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is not None
         assert "Content here with multiple words" in result
@@ -229,17 +239,40 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        tree = parse_html(html)
+
+        result = junk_filter.apply(tree)
+
+        assert result is tree
+        assert "42" in to_html(tree)
+
+    def test_clean_tree_returned_without_text_check(self, mock_settings: MagicMock) -> None:
+        """Test that a tree without junk is returned as is without a second walk."""
+        junk_filter = ResidualJunkFilter(mock_settings)
+
+        html = "<article><p>First paragraph here</p><p>Second paragraph here</p></article>"
+        tree = parse_html(html)
+        assert tree is not None
+
+        with patch.object(junk_filter, "_has_text_left") as mock_has_text_left:
+            result = junk_filter.apply(tree)
 
-        assert result == html
+        assert result is tree
+        mock_has_text_left.assert_not_called()
+        assert to_html(tree.find("body/article")) == html
 
-    def test_empty_html_returns_none(self, mock_settings: MagicMock) -> None:
-        """Test that empty HTML returns None."""
+    def test_empty_content_returns_none(self, mock_settings: MagicMock) -> None:
+        """Test that a tree without text returns None."""
         junk_filter = ResidualJunkFilter(mock_settings)
 
-        result = junk_filter.apply("")
+        tree = parse_html("<div><span></span></div>")
+        assert tree is not None
+
+        result = junk_filter.apply(tree)
 
         assert result is None
+        # The tree is left untouched when nothing would survive
+        assert tree.find(".//span") is not None
 
     def test_all_junk_removed_returns_none(self, mock_settings: MagicMock) -> None:
         """Test that HTML with only junk returns None."""
@@ -252,7 +285,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is None
 
@@ -277,7 +310,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is not None
         assert "Article Title" in result  # Multi-word heading kept
@@ -302,7 +335,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is not None
         assert "Content here" in result
@@ -322,7 +355,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is not None
         # First occurrence kept
@@ -346,7 +379,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is not None
         assert "Good content here" in result
@@ -369,7 +402,7 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is not None
         assert "Good content here" in result
@@ -386,9 +419,17 @@ class TestResidualJunkFilter:
         </article>
         """
 
-        result = junk_filter.apply(html)
+        result = apply_filter(junk_filter, html)
 
         assert result is not None
         # The <code> element is protected, so its parent <strong> should also be kept
         assert "AsyncWebCrawler" in result
         assert "<code>AsyncWebCrawler</code>" in result
+
+    def test_letter_ratio_ignores_whitespace(self, mock_settings: MagicMock) -> None:
+        """Test that spaces, tabs and newlines do not count towards the letter ratio."""
+        junk_filter = ResidualJunkFilter(mock_settings)
+
+        assert not junk_filter._has_low_letter_ratio("ab \t\n  \n1", 0.6)
+        assert junk_filter._has_low_letter_ratio("ab 12", 0.6)
+        assert not junk_filter._has_low_letter_ratio(" \t\n", 0.6)
@@ -3,10 +3,11 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 
 from ssmcp.exceptions import SearXNGError
-from ssmcp.searxng_client import SearXNGClient
+from ssmcp.searxng_client import CONNECTION_LIMITS, SearXNGClient
 
 # Test constants
 EXPECTED_RESULTS_COUNT = 2
@@ -46,7 +47,7 @@ class TestSearXNGClient:
         ]
 
         mock_response = AsyncMock()
-        mock_response.json = MagicMock(return_value={"results": mock_results})
+        mock_response.content = orjson.dumps({"results": mock_results})
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(client._client, "get", return_value=mock_response):
@@ -60,7 +61,7 @@ class TestSearXNGClient:
     async def test_search_empty_results(self, client: SearXNGClient) -> None:
         """Test search with no results returns empty list."""
         mock_response = AsyncMock()
-        mock_response.json = MagicMock(return_value={"results": []})
+        mock_response.content = b'{"results": []}'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(client._client, "get", return_value=mock_response):
@@ -71,7 +72,7 @@ class TestSearXNGClient:
     async def test_search_missing_results_key(self, client: SearXNGClient) -> None:
         """Test search handles missing results key by returning empty list."""
         mock_response = AsyncMock()
-        mock_response.json = MagicMock(return_value={})
+        mock_response.content = b"{}"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(client._client, "get", return_value=mock_response):
@@ -107,7 +108,7 @@ class TestSearXNGClient:
     async def test_search_invalid_json_response(self, client: SearXNGClient) -> None:
         """Test that invalid JSON response raises SearXNGError."""
         mock_response = AsyncMock()
-        mock_response.json = MagicMock(side_effect=ValueError("Invalid JSON"))
+        mock_response.content = b"<html>Not JSON</html>"
         mock_response.raise_for_status = MagicMock()
 
         with (
@@ -116,8 +117,29 @@ class TestSearXNGClient:
         ):
             await client.search("query")
 
+    def test_client_enables_http2_and_pool_limits(self) -> None:
+        """Test that the HTTP client is created with HTTP/2 and connection limits."""
+        with patch("ssmcp.searxng_client.httpx.AsyncClient") as mock_client_class:
+            SearXNGClient(search_url=SEARCH_URL, timeout=TEST_TIMEOUT)
+
+        mock_client_class.assert_called_once_with(
+            http2=True, timeout=TEST_TIMEOUT, limits=CONNECTION_LIMITS
+        )
+
     async def test_close_client(self, client: SearXNGClient) -> None:
         """Test that close properly closes the HTTP client."""
         with patch.object(client._client, "aclose", new_callable=AsyncMock) as mock_close:
             await client.close()
             mock_close.assert_called_once()
+
+    async def test_shared_client_used_and_left_open(self) -> None:
+        """Test that a shared HTTP client is used with the search timeout and not closed."""
+        http_client = AsyncMock()
+        http_client.get.return_value = MagicMock(content=orjson.dumps({"results": []}))
+        client = SearXNGClient(search_url=SEARCH_URL, timeout=TEST_TIMEOUT, http_client=http_client)
+
+        await client.search("query")
+        await client.close()
+
+        assert http_client.get.call_args.kwargs["timeout"] == TEST_TIMEOUT
+        http_client.aclose.assert_not_called()
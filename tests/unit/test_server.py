@@ -7,15 +7,15 @@ from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
 from ssmcp.exceptions import ParserError, SearXNGError, YoutubeError
+from ssmcp.middleware.redis_middleware import RedisLoggingMiddleware
 from ssmcp.server import (
     ServerState,
     TypedFastMCP,
-    get_parser,
     get_state,
     get_user_id,
-    get_youtube_client,
     lifespan,
     log_tool_call,
+    main,
     web_fetch,
     web_search,
     youtube_get_subtitles,
@@ -27,6 +27,7 @@ LOG_ARGS_WITH_USER = 4  # format_str, user_id, tool_name, details
 
 # Constants for test values
 TEST_MAX_RESULTS = 2
+TEST_SEARCH_DEADLINE = 45.0
 TEST_PORT = 8000
 TEST_TIMEOUT = 5.0
 
@@ -40,6 +41,10 @@ def mock_settings() -> MagicMock:
     settings.searxng_max_results = 5
     settings.youtube_subtitle_language = "en"
     settings.youtube_cookies_path = "/app/deploy/docker/ssmcp/cookies.txt"
+    settings.youtube_workers = 0
+    settings.youtube_cache_ttl_seconds = 604800
+    settings.parser_page_timeout = 0
+    settings.parser_search_deadline = 0
     settings.oauth_enabled = False
     settings.oauth_jwks_url = ""
     settings.oauth_client_id = ""
@@ -74,9 +79,10 @@ class TestTypedFastMCP:
         with patch("ssmcp.server.settings") as mock_settings:
             mock_settings.oauth_enabled = True
             mock_settings.oauth_jwks_url = "https://auth.com/jwks"
-            mcp = TypedFastMCP("test")
+            with patch("ssmcp.server.get_token_verifier") as mock_get_verifier:
+                mcp = TypedFastMCP("test")
             assert mcp.state is None
-            assert mcp.oauth_verifier is not None
+            assert mcp.oauth_verifier is mock_get_verifier.return_value
 
 
 class TestServerState:
@@ -90,6 +96,9 @@ class TestServerState:
             assert state.searxng_client is not None
             assert state.parser is not None
             assert state.youtube_client is not None
+            # Searches and page revalidation share one connection pool
+            assert state.searxng_client._client is state.http_client
+            assert state.parser._extractor._http is state.http_client
 
     @pytest.mark.asyncio
     async def test_start_initializes_parser(self, mock_settings: MagicMock) -> None:
@@ -110,10 +119,18 @@ class TestServerState:
                 patch.object(
                     state.searxng_client, "close", new_callable=AsyncMock
                 ) as mock_searxng_close,
+                patch.object(
+                    state.youtube_client, "close", new_callable=AsyncMock
+                ) as mock_youtube_close,
+                patch.object(
+                    state.http_client, "aclose", new_callable=AsyncMock
+                ) as mock_http_close,
             ):
                 await state.stop()
                 mock_parser_close.assert_called_once()
                 mock_searxng_close.assert_called_once()
+                mock_youtube_close.assert_called_once()
+                mock_http_close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_search_and_enrich_success(
@@ -122,6 +139,7 @@ class TestServerState:
         """Test successful search and enrichment flow."""
         # Create more results than max_results to test slicing
         mock_settings.searxng_max_results = TEST_MAX_RESULTS
+        mock_settings.parser_search_deadline = TEST_SEARCH_DEADLINE
 
         with patch("ssmcp.server.settings", mock_settings):
             state = ServerState()
@@ -156,8 +174,9 @@ class TestServerState:
 
                 # Verify only max_results URLs were processed
                 mock_parse.assert_called_once()
-                call_urls = mock_parse.call_args[0][0]
+                call_urls = list(mock_parse.call_args[0][0])
                 assert len(call_urls) == TEST_MAX_RESULTS
+                assert mock_parse.call_args.kwargs["deadline"] == TEST_SEARCH_DEADLINE
 
 
 class TestLogToolCall:
@@ -263,28 +282,6 @@ class TestGetState:
                 get_state()
 
 
-class TestDependencyGetters:
-    """Test dependency getter functions."""
-
-    def test_get_parser_returns_parser_from_state(self) -> None:
-        """Test that get_parser returns parser from state."""
-        mock_state = MagicMock()
-        mock_parser = MagicMock()
-        mock_state.parser = mock_parser
-
-        result = get_parser(mock_state)
-        assert result == mock_parser
-
-    def test_get_youtube_client_returns_client_from_state(self) -> None:
-        """Test that get_youtube_client returns client from state."""
-        mock_state = MagicMock()
-        mock_client = MagicMock()
-        mock_state.youtube_client = mock_client
-
-        result = get_youtube_client(mock_state)
-        assert result == mock_client
-
-
 class TestLifespan:
     """Test lifespan context manager."""
 
@@ -297,6 +294,7 @@ class TestLifespan:
             with patch("ssmcp.server.TypedFastMCP") as mock_app:
                 mock_app.middleware = []
                 mock_app.state = None
+                mock_app.oauth_verifier = None
 
                 with patch("ssmcp.server.ServerState") as mock_state_class:
                     mock_state = AsyncMock()
@@ -323,6 +321,7 @@ class TestLifespan:
                 mock_middleware.shutdown = AsyncMock()
                 mock_app.middleware = [mock_middleware]
                 mock_app.state = None
+                mock_app.oauth_verifier = None
 
                 with patch("ssmcp.server.ServerState") as mock_state_class:
                     mock_state = AsyncMock()
@@ -333,6 +332,62 @@ class TestLifespan:
 
                     mock_middleware.shutdown.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_lifespan_skips_middleware_without_hooks(self) -> None:
+        """Test that middleware without startup/shutdown hooks is left alone."""
+        with patch("ssmcp.server.TypedFastMCP") as mock_app:
+            plain_middleware = MagicMock(spec=[])
+            hooked_middleware = AsyncMock()
+            mock_app.middleware = [plain_middleware, hooked_middleware]
+            mock_app.state = None
+            mock_app.oauth_verifier = None
+
+            with patch("ssmcp.server.ServerState", return_value=AsyncMock()):
+                async with lifespan(mock_app):
+                    hooked_middleware.startup.assert_called_once()
+
+                hooked_middleware.shutdown.assert_called_once()
+            assert plain_middleware.mock_calls == []
+
+    @pytest.mark.asyncio
+    async def test_lifespan_shares_redis_client_with_youtube_cache(self) -> None:
+        """Test that subtitles are cached through the Redis logging middleware's client."""
+        with patch("ssmcp.server.TypedFastMCP") as mock_app:
+            mock_middleware = MagicMock(spec=RedisLoggingMiddleware)
+            mock_middleware.redis_client = MagicMock()
+            mock_app.middleware = [mock_middleware]
+            mock_app.state = None
+            mock_app.oauth_verifier = None
+
+            with (
+                patch("ssmcp.server.ServerState") as mock_state_class,
+                patch("ssmcp.server.settings") as mock_settings,
+            ):
+                mock_state = AsyncMock()
+                mock_state.youtube_client = MagicMock()
+                mock_state_class.return_value = mock_state
+                mock_settings.redis_key_prefix = "custom"
+
+                async with lifespan(mock_app):
+                    mock_state.youtube_client.use_cache.assert_called_once_with(
+                        mock_middleware.redis_client, "custom"
+                    )
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_oauth_verifier(self) -> None:
+        """Test that lifespan releases the OAuth verifier on shutdown."""
+        with patch("ssmcp.server.TypedFastMCP") as mock_app:
+            mock_app.middleware = []
+            mock_app.state = None
+            mock_app.oauth_verifier = AsyncMock()
+
+            with patch("ssmcp.server.ServerState") as mock_state_class:
+                mock_state_class.return_value = AsyncMock()
+
+                async with lifespan(mock_app):
+                    mock_app.oauth_verifier.aclose.assert_not_called()
+
+                mock_app.oauth_verifier.aclose.assert_called_once()
 
 class TestMCPTools:
     """Test MCP tool functions."""
@@ -473,3 +528,21 @@ class TestMCPTools:
             mock_get_state.return_value = mock_state
 
             await tool_fn("https://youtube.com/watch?v=123")
+
+
+class TestMain:
+    """Test server entrypoint."""
+
+    def test_main_runs_server_on_uvloop(self, mock_settings: MagicMock) -> None:
+        """Test that main runs the streamable HTTP server on uvloop."""
+        with (
+            patch("ssmcp.server.settings", mock_settings),
+            patch("ssmcp.server.mcp") as mock_mcp,
+            patch("ssmcp.server.uvloop") as mock_uvloop,
+        ):
+            main()
+
+        mock_mcp.run_async.assert_called_once_with(
+            transport="streamable-http", host="127.0.0.1", port=TEST_PORT
+        )
+        mock_uvloop.run.assert_called_once_with(mock_mcp.run_async.return_value)
@@ -31,6 +31,20 @@ class TestTimer:
         assert isinstance(args[3], float)
         assert args[3] >= MIN_EXECUTION_TIME
 
+    @patch("ssmcp.timing.time.perf_counter_ns")
+    @patch("ssmcp.timing.logger")
+    def test_timer_skipped_when_level_disabled(
+        self, mock_logger: MagicMock, mock_perf_counter_ns: MagicMock
+    ) -> None:
+        """Test that nothing is measured or logged when the log level is disabled."""
+        mock_logger.isEnabledFor.return_value = False
+        with timer("Test operation", log_level=logging.DEBUG):
+            pass
+
+        mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        mock_perf_counter_ns.assert_not_called()
+        mock_logger.log.assert_not_called()
+
 
 class TestTimeit:
     """Test timeit decorator."""
@@ -80,3 +94,25 @@ class TestTimeit:
         mock_logger.log.assert_called_once()
         args = mock_logger.log.call_args[0]
         assert "Failing operation" in args[2]
+
+    @patch("ssmcp.timing.logger")
+    async def test_timeit_skipped_when_level_disabled(self, mock_logger: MagicMock) -> None:
+        """Test that calls are not timed while the log level is disabled."""
+        mock_logger.isEnabledFor.return_value = False
+
+        @timeit("Quiet operation", log_level=logging.DEBUG)
+        def sync_function(x: int, y: int) -> int:
+            return x + y
+
+        @timeit("Quiet async operation", log_level=logging.DEBUG)
+        async def async_function(x: int, y: int) -> int:
+            return x * y
+
+        assert sync_function(2, 3) == EXPECTED_SUM_RESULT
+        assert await async_function(3, 4) == EXPECTED_MULTIPLY_RESULT
+        mock_logger.log.assert_not_called()
+
+        # The level is checked per call, so enabling it later takes effect
+        mock_logger.isEnabledFor.return_value = True
+        sync_function(2, 3)
+        mock_logger.log.assert_called_once()
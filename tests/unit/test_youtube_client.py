@@ -2,17 +2,27 @@
 
 import shutil
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ssmcp.exceptions import YoutubeError
-from ssmcp.youtube_client import FALLBACK_LANGUAGE, YouTubeClient
+from ssmcp.youtube_client import (
+    FALLBACK_LANGUAGE,
+    YouTubeClient,
+    _deduplicate_cues,
+    _extract_video_id,
+    _find_overlap,
+    _get_subtitles_in_worker,
+    _parse_youtube_vtt,
+)
 
 # Test constants
-EXPECTED_YTDLP_CALLS = 2  # One for extract_info, one for download
+EXPECTED_YTDLP_CALLS = 1  # extract_info downloads the subtitles in the same run
 EXPECTED_OVERLAP_NORMAL = 2
 EXPECTED_OVERLAP_NONE = 0
 EXPECTED_OVERLAP_MULTI = 2
@@ -27,24 +37,34 @@ class TestYouTubeClient:
         """Create a YouTube client for testing."""
         return YouTubeClient(language="en")
 
-    def test_find_overlap(self, client: YouTubeClient) -> None:
-        """Test overlap detection between two strings."""
+    def test_find_overlap(self) -> None:
+        """Test overlap detection between two word lists."""
         text1 = "Hello world today"
         text2 = "world today is great"
-        overlap = client._find_overlap(text1, text2)
+        overlap = _find_overlap(text1.split(), text2.split())
         assert overlap == EXPECTED_OVERLAP_NORMAL  # "world today"
 
         text1 = "Hello world"
         text2 = "Goodbye world"
-        overlap = client._find_overlap(text1, text2)
+        overlap = _find_overlap(text1.split(), text2.split())
         assert overlap == EXPECTED_OVERLAP_NONE
 
         text1 = "one two three"
         text2 = "two three four"
-        overlap = client._find_overlap(text1, text2)
+        overlap = _find_overlap(text1.split(), text2.split())
         assert overlap == EXPECTED_OVERLAP_MULTI
 
-    def test_deduplicate_cues(self, client: YouTubeClient) -> None:
+    def test_find_overlap_prefers_longest(self) -> None:
+        """Test that the longest overlap wins when the first word repeats."""
+        words1 = ["go", "go", "go"]
+        words2 = ["go", "go", "now"]
+        assert _find_overlap(words1, words2) == EXPECTED_OVERLAP_MULTI
+
+        # The whole of words2 can overlap, but never more than its length
+        assert _find_overlap(["a", "b", "c"], ["c"]) == 1
+        assert _find_overlap(["a", "b", "c"], []) == EXPECTED_OVERLAP_NONE
+
+    def test_deduplicate_cues(self) -> None:
         """Test deduplication of subtitle cues."""
         raw_cues = [
             ("00:01", "Hello world"),
@@ -59,13 +79,13 @@ class TestYouTubeClient:
         #    -> cleaned: "great" -> result: ["[00:01] Hello world",
         #                                   "[00:02] today is",
         #                                   "[00:03] great"]
-        result = client._deduplicate_cues(raw_cues)
+        result = list(_deduplicate_cues(raw_cues))
         assert len(result) == EXPECTED_DEDUPLICATED_LEN
         assert "[00:01] Hello world" in result[0]
         assert "today is" in result[1]
         assert "great" in result[2]
 
-    @patch("ssmcp.youtube_client.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     async def test_get_subtitles_no_subtitles(
         self, mock_ytdl: MagicMock, client: YouTubeClient
     ) -> None:
@@ -76,7 +96,7 @@ class TestYouTubeClient:
         with pytest.raises(YoutubeError, match="No subtitles available"):
             await client.get_subtitles("https://youtube.com/watch?v=123")
 
-    @patch("ssmcp.youtube_client.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     async def test_get_subtitles_success(
         self,
         mock_ytdl: MagicMock,
@@ -87,7 +107,8 @@ class TestYouTubeClient:
         mock_instance = mock_ytdl.return_value.__enter__.return_value
         mock_instance.extract_info.return_value = {
             "subtitles": {"en": [{"url": "http://example.com/en.vtt"}]},
-            "automatic_captions": {}
+            "automatic_captions": {},
+            "requested_subtitles": {"en": {"ext": "vtt"}},
         }
 
         # We need to mock download to actually create a file in the temp dir
@@ -101,7 +122,7 @@ class TestYouTubeClient:
             td = tempfile.mkdtemp()
             mock_td.return_value.__enter__.return_value = td
 
-            vtt_file = Path(td) / "test.vtt"
+            vtt_file = Path(td) / "test.en.vtt"
             vtt_text = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHello world"
             vtt_file.write_text(vtt_text, encoding="utf-8")
 
@@ -113,7 +134,7 @@ class TestYouTubeClient:
         assert isinstance(result, str)
         assert "[00:00:01.000] Hello world" in result
 
-    @patch("ssmcp.youtube_client.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     async def test_get_subtitles_file_not_found(
         self,
         mock_ytdl: MagicMock,
@@ -123,7 +144,8 @@ class TestYouTubeClient:
         mock_instance = mock_ytdl.return_value.__enter__.return_value
         mock_instance.extract_info.return_value = {
             "subtitles": {"en": [{"url": "http://example.com/en.vtt"}]},
-            "automatic_captions": {}
+            "automatic_captions": {},
+            "requested_subtitles": {"en": {"ext": "vtt"}},
         }
 
         # Mock TemporaryDirectory to return an empty directory (no .vtt files)
@@ -138,7 +160,7 @@ class TestYouTubeClient:
             # Clean up
             shutil.rmtree(td)
 
-    @patch("ssmcp.youtube_client.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     async def test_get_subtitles_empty_parsed_result(
         self,
         mock_ytdl: MagicMock,
@@ -148,7 +170,8 @@ class TestYouTubeClient:
         mock_instance = mock_ytdl.return_value.__enter__.return_value
         mock_instance.extract_info.return_value = {
             "subtitles": {"en": [{"url": "http://example.com/en.vtt"}]},
-            "automatic_captions": {}
+            "automatic_captions": {},
+            "requested_subtitles": {"en": {"ext": "vtt"}},
         }
 
         with patch("tempfile.TemporaryDirectory") as mock_td:
@@ -156,7 +179,7 @@ class TestYouTubeClient:
             mock_td.return_value.__enter__.return_value = td
 
             # Create a VTT file with only empty/whitespace cues that will be filtered out
-            vtt_file = Path(td) / "test.vtt"
+            vtt_file = Path(td) / "test.en.vtt"
             vtt_text = (
                 "WEBVTT\n\n"
                 "00:00:01.000 --> 00:00:02.000\n   \n\n"
@@ -170,7 +193,7 @@ class TestYouTubeClient:
             # Clean up
             shutil.rmtree(td)
 
-    @patch("ssmcp.youtube_client.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     async def test_get_subtitles_with_cookies_file(
         self,
         mock_ytdl: MagicMock,
@@ -187,20 +210,21 @@ class TestYouTubeClient:
             mock_instance = mock_ytdl.return_value.__enter__.return_value
             mock_instance.extract_info.return_value = {
                 "subtitles": {"en": [{"url": "http://example.com/en.vtt"}]},
-                "automatic_captions": {}
+                "automatic_captions": {},
+                "requested_subtitles": {"en": {"ext": "vtt"}},
             }
 
             with patch("tempfile.TemporaryDirectory") as mock_td:
                 td = tempfile.mkdtemp()
                 mock_td.return_value.__enter__.return_value = td
 
-                vtt_file = Path(td) / "test.vtt"
+                vtt_file = Path(td) / "test.en.vtt"
                 vtt_text = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHello world"
                 vtt_file.write_text(vtt_text, encoding="utf-8")
 
                 await client.get_subtitles("https://youtube.com/watch?v=123")
 
-                # Verify that YoutubeDL was called twice (extract_info + download)
+                # Verify that YoutubeDL was called once (extract_info downloads the subtitles)
                 assert mock_ytdl.call_count == EXPECTED_YTDLP_CALLS
 
                 # First call - YoutubeDL is called with positional args (options dict)
@@ -215,7 +239,7 @@ class TestYouTubeClient:
             # Clean up cookies file
             Path(cookies_path).unlink(missing_ok=True)
 
-    @patch("ssmcp.youtube_client.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     async def test_get_subtitles_without_cookies_file(
         self,
         mock_ytdl: MagicMock,
@@ -226,20 +250,21 @@ class TestYouTubeClient:
         mock_instance = mock_ytdl.return_value.__enter__.return_value
         mock_instance.extract_info.return_value = {
             "subtitles": {"en": [{"url": "http://example.com/en.vtt"}]},
-            "automatic_captions": {}
+            "automatic_captions": {},
+            "requested_subtitles": {"en": {"ext": "vtt"}},
         }
 
         with patch("tempfile.TemporaryDirectory") as mock_td:
             td = tempfile.mkdtemp()
             mock_td.return_value.__enter__.return_value = td
 
-            vtt_file = Path(td) / "test.vtt"
+            vtt_file = Path(td) / "test.en.vtt"
             vtt_text = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHello world"
             vtt_file.write_text(vtt_text, encoding="utf-8")
 
             await client.get_subtitles("https://youtube.com/watch?v=123")
 
-            # Verify that YoutubeDL was called twice (extract_info + download)
+            # Verify that YoutubeDL was called once (extract_info downloads the subtitles)
             assert mock_ytdl.call_count == EXPECTED_YTDLP_CALLS
 
             # First call - YoutubeDL is called with positional args (options dict)
@@ -250,6 +275,41 @@ class TestYouTubeClient:
             # Clean up
             shutil.rmtree(td)
 
+    @patch("yt_dlp.YoutubeDL")
+    async def test_get_subtitles_downloads_other_language_from_extracted_info(
+        self, mock_ytdl: MagicMock, client: YouTubeClient
+    ) -> None:
+        """Test that a non-preferred language is fetched by reprocessing the extracted info."""
+        mock_instance = mock_ytdl.return_value.__enter__.return_value
+        mock_instance.params = {}
+        mock_instance.extract_info.return_value = {
+            "subtitles": {"de": [{"url": "http://example.com/de.vtt"}]},
+            "automatic_captions": {},
+            "requested_subtitles": None,
+        }
+
+        with patch("tempfile.TemporaryDirectory") as mock_td:
+            td = tempfile.mkdtemp()
+            mock_td.return_value.__enter__.return_value = td
+
+            vtt_file = Path(td) / "test.de.vtt"
+            vtt_text = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHallo Welt"
+            vtt_file.write_text(vtt_text, encoding="utf-8")
+
+            result = await client.get_subtitles("https://youtube.com/watch?v=123")
+
+            # Clean up
+            shutil.rmtree(td)
+
+        # One YoutubeDL instance serves both passes and the page is extracted once
+        assert mock_ytdl.call_count == EXPECTED_YTDLP_CALLS
+        mock_instance.extract_info.assert_called_once()
+        assert mock_instance.params["subtitleslangs"] == ["de"]
+        mock_instance.process_ie_result.assert_called_once_with(
+            mock_instance.sanitize_info.return_value, download=True
+        )
+        assert "Hallo Welt" in result
+
     def test_select_language_configured_available(self, client: YouTubeClient) -> None:
         """Test that _select_language returns configured language when available."""
         subtitles: dict[str, Any] = {"en": [{"url": "http://example.com/en.vtt"}]}
@@ -259,9 +319,9 @@ class TestYouTubeClient:
 
         assert result == "en"
 
-    def test_select_language_falls_back_to_fallback(self, client: YouTubeClient) -> None:
+    def test_select_language_falls_back_to_fallback(self) -> None:
         """Test fallback to 'en' when configured language not available."""
-        client._language = "es"  # Spanish not available
+        client = YouTubeClient(language="es")  # Spanish not available
         subtitles: dict[str, Any] = {"en": [{"url": "http://example.com/en.vtt"}]}
         auto_captions: dict[str, Any] = {}
 
@@ -278,9 +338,9 @@ class TestYouTubeClient:
 
         assert result == "en"
 
-    def test_select_language_falls_back_to_any_subtitle(self, client: YouTubeClient) -> None:
+    def test_select_language_falls_back_to_any_subtitle(self) -> None:
         """Test fallback to any available subtitle when neither configured nor fallback."""
-        client._language = "de"  # German not available
+        client = YouTubeClient(language="de")  # German not available
         # French available
         subtitles: dict[str, Any] = {"fr": [{"url": "http://example.com/fr.vtt"}]}
         auto_captions: dict[str, Any] = {}
@@ -289,9 +349,9 @@ class TestYouTubeClient:
 
         assert result == "fr"
 
-    def test_select_language_falls_back_to_any_auto(self, client: YouTubeClient) -> None:
+    def test_select_language_falls_back_to_any_auto(self) -> None:
         """Test fallback to any available auto-caption when no subtitles at all."""
-        client._language = "de"
+        client = YouTubeClient(language="de")
         subtitles: dict[str, Any] = {}
         # Spanish auto
         auto_captions: dict[str, Any] = {"es": [{"url": "http://example.com/es.vtt"}]}
@@ -309,9 +369,9 @@ class TestYouTubeClient:
 
         assert result is None
 
-    def test_select_language_prefers_configured(self, client: YouTubeClient) -> None:
+    def test_select_language_prefers_configured(self) -> None:
         """Test that configured language is preferred over fallback when both available."""
-        client._language = "es"
+        client = YouTubeClient(language="es")
         subtitles: dict[str, Any] = {
             "es": [{"url": "http://example.com/es.vtt"}],
             "en": [{"url": "http://example.com/en.vtt"}],
@@ -334,6 +394,226 @@ class TestYouTubeClient:
         assert result == "en"
 
 
+class TestYouTubeClientWorkers:
+    """Test running subtitle downloads in worker processes."""
+
+    async def test_start_without_workers_uses_threads(self) -> None:
+        """Test that no process pool is created when workers is 0."""
+        client = YouTubeClient(language="en")
+
+        with patch("ssmcp.youtube_client.ProcessPoolExecutor") as mock_pool_class:
+            client.start()
+
+        mock_pool_class.assert_not_called()
+        assert client._executor is None
+
+    async def test_start_and_close_manage_process_pool(self) -> None:
+        """Test that the process pool is created on start and shut down on close."""
+        workers = 2
+        client = YouTubeClient(language="en", workers=workers)
+
+        with patch("ssmcp.youtube_client.ProcessPoolExecutor") as mock_pool_class:
+            client.start()
+            assert mock_pool_class.call_args.kwargs["max_workers"] == workers
+
+            await client.close()
+
+        mock_pool_class.return_value.shutdown.assert_called_once_with(
+            wait=False, cancel_futures=True
+        )
+        assert client._executor is None
+
+    async def test_get_subtitles_dispatches_to_worker_pool(self) -> None:
+        """Test that subtitles are fetched by the worker pool when present."""
+        client = YouTubeClient(language="de", cookies_path="/app/cookies.txt", workers=1)
+
+        with (
+            patch(
+                "ssmcp.youtube_client.ProcessPoolExecutor",
+                return_value=ThreadPoolExecutor(max_workers=1),
+            ),
+            patch("ssmcp.youtube_client._get_subtitles_in_worker") as mock_worker_fetch,
+            patch.object(client, "_get_subtitles_sync") as mock_local_fetch,
+        ):
+            mock_worker_fetch.return_value = "[00:00:01.000] Hallo"
+            client.start()
+
+            result = await client.get_subtitles("https://youtube.com/watch?v=123")
+            await client.close()
+
+        assert result == "[00:00:01.000] Hallo"
+        mock_worker_fetch.assert_called_once_with(
+            "de", "/app/cookies.txt", "https://youtube.com/watch?v=123"
+        )
+        mock_local_fetch.assert_not_called()
+
+    async def test_worker_crash_fails_request_and_replaces_pool(self) -> None:
+        """Test that a request whose worker dies fails with YoutubeError and the pool is rebuilt."""
+        client = YouTubeClient(language="en", workers=1)
+
+        crashed: Future[str] = Future()
+        crashed.set_exception(BrokenProcessPool("worker died"))
+        fetched: Future[str] = Future()
+        fetched.set_result("[00:00:01.000] Hello")
+        broken_pool = MagicMock()
+        broken_pool.submit.return_value = crashed
+        fresh_pool = MagicMock()
+        fresh_pool.submit.return_value = fetched
+
+        with patch(
+            "ssmcp.youtube_client.ProcessPoolExecutor", side_effect=[broken_pool, fresh_pool]
+        ):
+            client.start()
+
+            with pytest.raises(YoutubeError, match="worker died"):
+                await client.get_subtitles("https://youtube.com/watch?v=crashed0001")
+            result = await client.get_subtitles("https://youtube.com/watch?v=123")
+            await client.close()
+
+        assert result == "[00:00:01.000] Hello"
+        broken_pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        fresh_pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    async def test_request_resubmitted_when_pool_already_broken(self) -> None:
+        """Test that a request reaching an already broken pool is sent to a new pool."""
+        client = YouTubeClient(language="en", workers=1)
+
+        fetched: Future[str] = Future()
+        fetched.set_result("[00:00:01.000] Hello")
+        broken_pool = MagicMock()
+        broken_pool.submit.side_effect = BrokenProcessPool("pool is broken")
+        fresh_pool = MagicMock()
+        fresh_pool.submit.return_value = fetched
+
+        with patch(
+            "ssmcp.youtube_client.ProcessPoolExecutor", side_effect=[broken_pool, fresh_pool]
+        ):
+            client.start()
+            result = await client.get_subtitles("https://youtube.com/watch?v=123")
+            await client.close()
+
+        assert result == "[00:00:01.000] Hello"
+        assert client._executor is None
+        broken_pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    def test_worker_function_uses_client_settings(self) -> None:
+        """Test that the worker function fetches with the given language and cookies."""
+        with patch.object(
+            YouTubeClient, "_get_subtitles_sync", autospec=True, return_value="subs"
+        ) as mock_fetch:
+            result = _get_subtitles_in_worker("de", None, "https://youtube.com/watch?v=123")
+
+        assert result == "subs"
+        worker_client, url = mock_fetch.call_args.args
+        assert worker_client._language == "de"
+        assert worker_client._cookies_path is None
+        assert url == "https://youtube.com/watch?v=123"
+
+    def test_worker_function_wraps_yt_dlp_errors(self) -> None:
+        """Test that errors from yt-dlp are re-raised as picklable YoutubeErrors."""
+        with (
+            patch.object(
+                YouTubeClient, "_get_subtitles_sync", side_effect=RuntimeError("Video unavailable")
+            ),
+            pytest.raises(YoutubeError, match="RuntimeError: Video unavailable"),
+        ):
+            _get_subtitles_in_worker("en", None, "https://youtube.com/watch?v=123")
+
+
+class TestYouTubeClientCache:
+    """Test caching parsed subtitles in Redis."""
+
+    VIDEO_URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42"
+    CACHE_KEY = "ssmcp:ytsub:dQw4w9WgXcQ:en"
+
+    @pytest.fixture
+    def redis_client(self) -> AsyncMock:
+        """Create a mocked Redis client with an empty cache."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        return redis_client
+
+    def test_extract_video_id(self) -> None:
+        """Test that video IDs are parsed from watch URLs and short links."""
+        assert _extract_video_id(self.VIDEO_URL) == "dQw4w9WgXcQ"
+        assert _extract_video_id("https://youtu.be/dQw4w9WgXcQ?si=abc") == "dQw4w9WgXcQ"
+        assert _extract_video_id("https://www.youtube.com/@channel") is None
+
+    def test_extract_video_id_other_forms(self) -> None:
+        """Test that shorts, embed and scheme-less links yield the video ID."""
+        assert _extract_video_id("https://youtube.com/shorts/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert _extract_video_id("https://www.youtube.com/embed/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert _extract_video_id("m.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+
+    def test_extract_video_id_rejects_other_hosts(self) -> None:
+        """Test that v= on a non-YouTube host never yields a cacheable ID."""
+        assert _extract_video_id("https://example.com/watch?v=dQw4w9WgXcQ") is None
+        assert _extract_video_id("https://evil.com/?u=youtu.be/dQw4w9WgXcQ") is None
+        assert _extract_video_id("https://notyoutube.com/watch?v=dQw4w9WgXcQ") is None
+
+    def test_extract_video_id_requires_full_id(self) -> None:
+        """Test that an ID longer than 11 characters is not truncated into another video's."""
+        assert _extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQxyz") is None
+        assert _extract_video_id("https://youtu.be/dQw4w9WgXcQ-") is None
+
+    async def test_cache_hit_skips_download(self, redis_client: AsyncMock) -> None:
+        """Test that cached subtitles are returned without running yt-dlp."""
+        client = YouTubeClient(language="en")
+        client.use_cache(redis_client, "ssmcp")
+        redis_client.get.return_value = b"[00:00:01.000] Cached"
+
+        with patch.object(client, "_get_subtitles_sync") as mock_fetch:
+            result = await client.get_subtitles(self.VIDEO_URL)
+
+        assert result == "[00:00:01.000] Cached"
+        redis_client.get.assert_called_once_with(self.CACHE_KEY)
+        mock_fetch.assert_not_called()
+
+    async def test_cache_miss_stores_subtitles(self, redis_client: AsyncMock) -> None:
+        """Test that downloaded subtitles are cached with the configured TTL."""
+        cache_ttl = 60
+        client = YouTubeClient(language="en", cache_ttl=cache_ttl)
+        client.use_cache(redis_client, "ssmcp")
+
+        with patch.object(client, "_get_subtitles_sync", return_value="[00:00:01.000] Fresh"):
+            result = await client.get_subtitles(self.VIDEO_URL)
+
+        assert result == "[00:00:01.000] Fresh"
+        redis_client.setex.assert_called_once_with(
+            self.CACHE_KEY, cache_ttl, b"[00:00:01.000] Fresh"
+        )
+
+    async def test_cache_errors_fall_back_to_download(self, redis_client: AsyncMock) -> None:
+        """Test that an unreachable Redis doesn't fail the subtitle request."""
+        client = YouTubeClient(language="en")
+        client.use_cache(redis_client, "ssmcp")
+        redis_client.get.side_effect = ConnectionError("Redis down")
+        redis_client.setex.side_effect = ConnectionError("Redis down")
+
+        with patch.object(client, "_get_subtitles_sync", return_value="[00:00:01.000] Fresh"):
+            result = await client.get_subtitles(self.VIDEO_URL)
+
+        assert result == "[00:00:01.000] Fresh"
+
+    async def test_url_without_video_id_is_not_cached(self, redis_client: AsyncMock) -> None:
+        """Test that URLs without a video ID bypass the cache."""
+        client = YouTubeClient(language="en")
+        client.use_cache(redis_client, "ssmcp")
+
+        with patch.object(client, "_get_subtitles_sync", return_value="subs"):
+            await client.get_subtitles("https://www.youtube.com/@channel")
+
+        redis_client.get.assert_not_called()
+        redis_client.setex.assert_not_called()
+
+
+def write_vtt(directory: Path, content: str) -> Path:
+    """Write VTT content to a file in the given directory."""
+    vtt_path = directory / "subtitles.vtt"
+    vtt_path.write_text(content, encoding="utf-8")
+    return vtt_path
+
+
 @pytest.fixture
 def youtube_client() -> YouTubeClient:
     """Create a YouTube client for VTT parsing tests."""
@@ -343,7 +623,7 @@ def youtube_client() -> YouTubeClient:
 class TestYouTubeVTTParsing:
     """Test YouTube VTT subtitle parsing."""
 
-    def test_parse_vtt_basic(self, youtube_client: YouTubeClient) -> None:
+    def test_parse_vtt_basic(self, youtube_client: YouTubeClient, tmp_path: Path) -> None:
         """Test basic VTT parsing."""
         vtt_content = """WEBVTT
 
@@ -353,12 +633,14 @@ Hello world
 00:00:06.000 --> 00:00:10.000
 This is a test"""
 
-        result = youtube_client._parse_vtt(vtt_content)
+        result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
 
         assert "[00:00:01.000] Hello world" in result
         assert "[00:00:06.000] This is a test" in result
 
-    def test_parse_vtt_with_cue_settings(self, youtube_client: YouTubeClient) -> None:
+    def test_parse_vtt_with_cue_settings(
+        self, youtube_client: YouTubeClient, tmp_path: Path
+    ) -> None:
         """Test VTT parsing with cue settings (position, alignment)."""
         vtt_content = """WEBVTT
 
@@ -368,12 +650,14 @@ Content with settings
 00:00:06.000 --> 00:00:10.000 line:90%
 More content"""
 
-        result = youtube_client._parse_vtt(vtt_content)
+        result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
 
         assert "Content with settings" in result
         assert "More content" in result
 
-    def test_parse_vtt_empty_cues_skipped(self, youtube_client: YouTubeClient) -> None:
+    def test_parse_vtt_empty_cues_skipped(
+        self, youtube_client: YouTubeClient, tmp_path: Path
+    ) -> None:
         """Test VTT parsing skips empty/whitespace cues."""
         vtt_content = """WEBVTT
 
@@ -382,7 +666,7 @@ More content"""
 00:00:06.000 --> 00:00:10.000
 Valid text"""
 
-        result = youtube_client._parse_vtt(vtt_content)
+        result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
 
         # Empty cues should be skipped
         assert "Valid text" in result
@@ -390,7 +674,9 @@ Valid text"""
         lines = [line for line in result.split("\n") if line.strip()]
         assert len(lines) == 1
 
-    def test_parse_vtt_multiline_cues_joined(self, youtube_client: YouTubeClient) -> None:
+    def test_parse_vtt_multiline_cues_joined(
+        self, youtube_client: YouTubeClient, tmp_path: Path
+    ) -> None:
         """Test VTT parsing with multiline cues."""
         vtt_content = """WEBVTT
 
@@ -399,12 +685,14 @@ Line 1
 Line 2
 Line 3"""
 
-        result = youtube_client._parse_vtt(vtt_content)
+        result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
 
         # Should join lines with spaces
         assert "Line 1 Line 2 Line 3" in result
 
-    def test_parse_vtt_with_deduplication(self, youtube_client: YouTubeClient) -> None:
+    def test_parse_vtt_with_deduplication(
+        self, youtube_client: YouTubeClient, tmp_path: Path
+    ) -> None:
         """Test VTT parsing with rolling caption deduplication."""
         vtt_content = """WEBVTT
 
@@ -417,7 +705,7 @@ world today is great
 00:00:05.000 --> 00:00:07.000
 today is wonderful"""
 
-        result = youtube_client._parse_vtt(vtt_content)
+        result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
 
         # Should deduplicate overlapping text
         assert "[00:00:01.000] Hello world today" in result
@@ -425,16 +713,16 @@ today is wonderful"""
         assert "is great" in result
         assert "is wonderful" in result
 
-    def test_parse_vtt_empty_content(self, youtube_client: YouTubeClient) -> None:
+    def test_parse_vtt_empty_content(self, youtube_client: YouTubeClient, tmp_path: Path) -> None:
         """Test VTT parsing with empty content."""
         vtt_content = "WEBVTT\n"
 
-        result = youtube_client._parse_vtt(vtt_content)
+        result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
 
         # Empty VTT should return empty string
         assert result == ""
 
-    def test_parse_vtt_with_html_tags(self, youtube_client: YouTubeClient) -> None:
+    def test_parse_vtt_with_html_tags(self, youtube_client: YouTubeClient, tmp_path: Path) -> None:
         """Test VTT parsing with HTML tags in cues."""
         vtt_content = """WEBVTT
 
@@ -444,9 +732,64 @@ today is wonderful"""
 00:00:06.000 --> 00:00:10.000
 Text with <c.colorE5E5E5>color</c>"""
 
-        result = youtube_client._parse_vtt(vtt_content)
+        result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
 
-        # HTML tags should be preserved in output (webvtt handles them)
+        # Tags are stripped while their text is kept
         assert "Bold text" in result
         assert "italic" in result
         assert "color" in result
+
+    def test_parse_vtt_youtube_auto_captions(
+        self, youtube_client: YouTubeClient, tmp_path: Path
+    ) -> None:
+        """Test that word timings are stripped and whitespace-only lines end a cue."""
+        vtt_content = (
+            "WEBVTT\nKind: captions\nLanguage: en\n\n"
+            "00:00:00.500 --> 00:00:02.190 align:start position:0%\n"
+            " \n"
+            "hello<00:00:00.930><c> world</c>\n\n"
+            "00:00:02.190 --> 00:00:02.200 align:start position:0%\n"
+            "hello world\n"
+            " \n"
+        )
+
+        with patch("ssmcp.youtube_client._import_webvtt") as mock_import_webvtt:
+            result = youtube_client._parse_vtt(write_vtt(tmp_path, vtt_content))
+
+        assert result == "[00:00:02.190] hello world"
+        mock_import_webvtt.assert_not_called()
+
+    def test_parse_vtt_falls_back_to_webvtt(
+        self, youtube_client: YouTubeClient, tmp_path: Path
+    ) -> None:
+        """Test that webvtt parses files in which the regex finds no cue."""
+        vtt_path = write_vtt(tmp_path, "WEBVTT\n")
+
+        with patch("ssmcp.youtube_client._import_webvtt") as mock_import_webvtt:
+            mock_import_webvtt.return_value.read.return_value = [
+                MagicMock(start="00:00:01.000", text="From webvtt")
+            ]
+            result = youtube_client._parse_vtt(vtt_path)
+
+        assert result == "[00:00:01.000] From webvtt"
+        mock_import_webvtt.return_value.read.assert_called_once_with(
+            str(vtt_path), encoding="utf-8"
+        )
+
+
+class TestParseYoutubeVtt:
+    """Test _parse_youtube_vtt function."""
+
+    def test_yields_start_and_text_without_tags(self) -> None:
+        """Test that cues are yielded with their start time and tags removed."""
+        vtt_content = (
+            "WEBVTT\n\n1\n00:00:01.000 --> 00:00:02.000 line:0\n<v Bob>Hi</v> there\n"
+        )
+
+        assert list(_parse_youtube_vtt(vtt_content)) == [("00:00:01.000", "Hi there\n")]
+
+    def test_normalizes_start_without_hours(self) -> None:
+        """Test that MM:SS.mmm start times get an hours field like webvtt's."""
+        vtt_content = "WEBVTT\n\n01:02.500 --> 01:03.000\nShort"
+
+        assert list(_parse_youtube_vtt(vtt_content)) == [("00:01:02.500", "Short")]